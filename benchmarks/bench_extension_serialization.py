@@ -0,0 +1,76 @@
+"""Benchmark: column-wise extension serializability check vs ``iterrows``.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_extension_serialization
+    python -m benchmarks.bench_extension_serialization --zip path/to/extension.geojson.zip
+
+Loads the extension layer in the zip (by default the 1.6 MB
+``tests/assets/SDOT_lanewidth_osw.points.geojson.zip``) the way
+``validate()`` does, then times the previous row-wise
+``json.dumps(row.to_dict())`` loop against ``_first_non_serializable`` and
+checks that both agree on the first offending row. ``validate()`` strips
+``ext:*`` properties before this check; ``--with-ext`` keeps them to time
+the mixed-type object columns of the SDOT layer as well.
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import zipfile
+
+import pandas as pd
+
+from benchmarks.bench_geometry_mapping import timed
+from src.python_osw_validation.helpers import _first_non_serializable, _read_geojson_without_ext
+
+DEFAULT_ZIP = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),
+                           'tests', 'assets', 'SDOT_lanewidth_osw.points.geojson.zip')
+
+
+def load_properties(zip_path: str, with_ext: bool = False) -> pd.DataFrame:
+    with zipfile.ZipFile(zip_path) as archive, tempfile.TemporaryDirectory() as tmp:
+        name = next(n for n in archive.namelist() if n.endswith('.geojson') and not n.startswith('__MACOSX'))
+        path = archive.extract(name, tmp)
+        if with_ext:
+            with open(path) as f:
+                return pd.DataFrame([feature.get('properties') or {} for feature in json.load(f)['features']])
+        return _read_geojson_without_ext(path).drop(columns='geometry')
+
+
+def run_iterrows(properties):
+    for position, (_, row) in enumerate(properties.iterrows()):
+        try:
+            json.dumps(row.to_dict())
+        except (TypeError, ValueError):
+            return position
+    return None
+
+
+def run_columns(properties):
+    offending = _first_non_serializable(properties)
+    return None if offending is None else offending[0]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--zip', default=DEFAULT_ZIP)
+    parser.add_argument('--with-ext', action='store_true')
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    properties = load_properties(args.zip, args.with_ext)
+    print(f"features={len(properties)} columns={len(properties.columns)}")
+    column_time, column_result = timed(run_columns, properties, repeat=args.repeat)
+    print(f"columns:    {column_time:8.3f}s")
+    row_time, row_result = timed(run_iterrows, properties, repeat=args.repeat)
+    print(f"iterrows:   {row_time:8.3f}s")
+    print(f"speedup:    {row_time / column_time:8.1f}x")
+    if column_result != row_result:
+        raise SystemExit(f'First offending row differs: {column_result} vs {row_result}')
+    print('outputs identical')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""Benchmark: validation throughput on broken datasets, per fault type and ``max_errors``.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_faults --edges 20000 --rate 0.2 --max-errors 20 1000
+
+Writes one synthetic dataset per fault type (``benchmarks.synthetic.FAULT_TYPES``,
+plus a clean ``none`` baseline), each with ``--rate`` of the target file's
+features broken, validates it once per ``--max-errors`` value and prints
+features per second, the number of errors and the stage that took
+longest. Schema faults (bad enums, wrong types, missing ``_u_id``, null
+``ext:*`` values) exercise error construction and message formatting;
+the others exercise the integrity and geometry stages. Every broken
+dataset must come out invalid, and the baseline valid, before timings are
+reported.
+"""
+
+import argparse
+import os
+import tempfile
+import time
+from typing import Dict, List, NamedTuple, Optional, Sequence
+
+from benchmarks.synthetic import FAULT_TYPES, SyntheticDataset
+from src.python_osw_validation import OSWValidation
+
+BASELINE = 'none'
+
+
+class FaultRun(NamedTuple):
+    fault: str
+    max_errors: int
+    seconds: float
+    features: int
+    errors: int
+    slowest_stage: str
+
+    @property
+    def features_per_second(self) -> float:
+        return self.features / self.seconds if self.seconds else float('inf')
+
+
+def run_fault(path: str, fault: str, features: int, max_errors: int, repeat: int = 1) -> FaultRun:
+    """Best of ``repeat`` validations of the archive at ``path``."""
+    best, result = float('inf'), None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = OSWValidation(zipfile_path=path).validate(max_errors=max_errors, timings=True)
+        best = min(best, time.perf_counter() - start)
+    stage_wall: Dict[str, float] = {}
+    for timing in result.timings or []:
+        stage_wall[timing.stage] = stage_wall.get(timing.stage, 0.0) + timing.wall
+    slowest = max(stage_wall, key=stage_wall.get) if stage_wall else '-'
+    if result.is_valid != (fault == BASELINE):
+        raise SystemExit(f'{fault}: expected an {"in" if fault != BASELINE else ""}valid result, '
+                         f'got is_valid={result.is_valid}')
+    return FaultRun(fault, max_errors, best, features, len(result.errors or []), slowest)
+
+
+def run_suite(edges: int, rate: float, max_errors: Sequence[int], faults: Optional[Sequence[str]] = None,
+              seed: int = 0, repeat: int = 1) -> List[FaultRun]:
+    """Validate one dataset per fault type (and the baseline) at every ``max_errors`` value."""
+    runs = []
+    with tempfile.TemporaryDirectory() as tmp:
+        for fault in [BASELINE, *(faults or FAULT_TYPES)]:
+            dataset = SyntheticDataset(edges=edges, seed=seed, faults={} if fault == BASELINE else {fault: rate})
+            path = dataset.write_zip(os.path.join(tmp, f'{fault}.zip'))
+            features = sum(dataset.counts.values())
+            for limit in max_errors:
+                runs.append(run_fault(path, fault, features, limit, repeat=repeat))
+    return runs
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--edges', type=int, default=20000)
+    parser.add_argument('--rate', type=float, default=0.2)
+    parser.add_argument('--max-errors', type=int, nargs='+', default=[20, 1000])
+    parser.add_argument('--faults', nargs='+', choices=FAULT_TYPES, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--repeat', type=int, default=1)
+    args = parser.parse_args(argv)
+
+    print(f"edges={args.edges} fault rate={args.rate}")
+    print(f"{'fault':<18} {'max_errors':>10} {'seconds':>8} {'features/s':>11} {'errors':>7}  slowest stage")
+    for run in run_suite(args.edges, args.rate, args.max_errors, args.faults, args.seed, args.repeat):
+        print(f"{run.fault:<18} {run.max_errors:>10} {run.seconds:>8.3f} {run.features_per_second:>11.0f} "
+              f"{run.errors:>7}  {run.slowest_stage}")
+    print('every broken dataset invalid, baseline valid')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,63 @@
+"""Benchmark: bulk geometry construction vs one ``shape()`` call per feature.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_geometry_builder --features 200000
+
+Generates GeoJSON geometry objects in the OSW mix (nodes, edges and zone
+polygons), checks that ``build_geometries`` returns the same geometries as
+``shapely.geometry.shape`` and prints the timings of both.
+"""
+
+import argparse
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+from benchmarks.bench_geometry_mapping import timed
+from src.python_osw_validation.geometry_builder import build_geometries
+
+
+def build_geojson_geometries(n_features: int, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    base = rng.random((n_features, 2)) * 0.1 + (-122.3, 47.6)
+    geometries = []
+    for i, (x, y) in enumerate(base.tolist()):
+        kind = i % 10
+        if kind < 5:
+            geometries.append({'type': 'Point', 'coordinates': [x, y]})
+        elif kind < 9:
+            n = 2 + i % 6
+            geometries.append({'type': 'LineString',
+                               'coordinates': [[x + k * 1e-4, y + (k % 2) * 1e-4] for k in range(n)]})
+        else:
+            ring = [[x, y], [x + 1e-3, y], [x + 1e-3, y + 1e-3], [x, y + 1e-3], [x, y]]
+            geometries.append({'type': 'Polygon', 'coordinates': [ring]})
+    return geometries
+
+
+def run_shape(geometries):
+    return [shape(g) if g else None for g in geometries]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--features', type=int, default=100000)
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    geometries = build_geojson_geometries(args.features)
+    print(f"features={len(geometries)}")
+    bulk_time, bulk = timed(build_geometries, geometries, repeat=args.repeat)
+    print(f"bulk:       {bulk_time:8.3f}s")
+    shape_time, single = timed(run_shape, geometries, repeat=args.repeat)
+    print(f"shape():    {shape_time:8.3f}s")
+    print(f"speedup:    {shape_time / bulk_time:8.1f}x")
+    if not all(shapely.equals_exact(np.asarray(single, dtype=object), bulk, 0)):
+        raise SystemExit('Bulk geometries differ from shape()')
+    print('outputs identical')
+
+
+if __name__ == '__main__':
+    main()
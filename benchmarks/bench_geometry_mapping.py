@@ -0,0 +1,116 @@
+"""Benchmark: vectorised vs row-wise geometry mapping checks.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_geometry_mapping --edges 200000 --zones 5000
+
+Builds a synthetic node grid with edges between neighbours and square zones,
+perturbs a fraction of them so mismatches are reported, checks that the
+vectorised ``OSWValidation`` methods log exactly the same messages as the
+legacy ``iterrows`` implementation, and prints the timings of both.
+"""
+
+import argparse
+import time
+
+import geopandas as gpd
+import numpy as np
+import shapely
+
+from src.python_osw_validation import OSWValidation
+from benchmarks import legacy_geometry_mapping as legacy
+
+
+def build_frames(n_edges: int, n_zones: int, mismatch_rate: float, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    side = int(np.ceil(np.sqrt(n_edges + 1))) + 1
+    gx, gy = np.meshgrid(np.arange(side), np.arange(side))
+    node_x = -122.3 + gx.ravel() * 1e-4
+    node_y = 47.6 + gy.ravel() * 1e-4
+    node_ids = np.array([f"n{i}" for i in range(len(node_x))], dtype=object)
+    nodes = gpd.GeoDataFrame({'_id': node_ids, 'geometry': shapely.points(node_x, node_y)})
+
+    u = rng.integers(0, len(node_x) - 1, n_edges)
+    v = u + 1
+    sx, sy = node_x[u].copy(), node_y[u].copy()
+    ex, ey = node_x[v].copy(), node_y[v].copy()
+    drift = rng.random(n_edges) < mismatch_rate
+    sx[drift] += 1e-5
+    coords = np.stack([np.column_stack([sx, sy]), np.column_stack([ex, ey])], axis=1)
+    edges = gpd.GeoDataFrame({
+        '_id': np.array([f"e{i}" for i in range(n_edges)], dtype=object),
+        '_u_id': node_ids[u],
+        '_v_id': node_ids[v],
+        'geometry': shapely.linestrings(coords),
+    })
+
+    corners = rng.integers(0, (side - 1) * (side - 1), n_zones)
+    cx, cy = corners % (side - 1), corners // (side - 1)
+    ring_nodes = np.stack([cy * side + cx, cy * side + cx + 1,
+                           (cy + 1) * side + cx + 1, (cy + 1) * side + cx], axis=1)
+    ring = np.stack([node_x[ring_nodes], node_y[ring_nodes]], axis=2)
+    ring = np.concatenate([ring, ring[:, :1]], axis=1)
+    w_ids = [list(node_ids[r]) for r in ring_nodes]
+    misaligned = np.flatnonzero(rng.random(n_zones) < mismatch_rate)
+    for z in misaligned:
+        w_ids[z][0] = node_ids[(ring_nodes[z, 0] + 2 * side) % len(node_ids)]
+    zones = gpd.GeoDataFrame({
+        '_id': np.array([f"z{i}" for i in range(n_zones)], dtype=object),
+        '_w_id': w_ids,
+        'geometry': shapely.polygons(ring),
+    })
+    return nodes, edges, zones
+
+
+def run_vectorised(nodes, edges, zones, max_errors):
+    v = OSWValidation(zipfile_path='bench.zip')
+    node_map = v._build_node_coord_map(nodes)
+    v._validate_edge_geometry_mapping(edges, node_map, max_errors)
+    v._validate_zone_geometry_mapping(zones, node_map, max_errors)
+    return [(i['error_message'], i['feature_index']) for i in v.issues]
+
+
+def run_legacy(nodes, edges, zones, max_errors):
+    node_map = legacy.build_node_coord_map(nodes)
+    logged = legacy.validate_edge_geometry_mapping(edges, node_map, max_errors)
+    logged += legacy.validate_zone_geometry_mapping(zones, node_map, max_errors - len(logged))
+    return logged
+
+
+def timed(fn, *args, repeat=1):
+    best = float('inf')
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--edges', type=int, default=50000)
+    parser.add_argument('--zones', type=int, default=2000)
+    parser.add_argument('--mismatch-rate', type=float, default=0.01)
+    parser.add_argument('--max-errors', type=int, default=10 ** 9)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-legacy', action='store_true')
+    args = parser.parse_args(argv)
+
+    nodes, edges, zones = build_frames(args.edges, args.zones, args.mismatch_rate)
+    print(f"nodes={len(nodes)} edges={len(edges)} zones={len(zones)}")
+
+    vec_time, vec_issues = timed(run_vectorised, nodes, edges, zones, args.max_errors, repeat=args.repeat)
+    print(f"vectorised: {vec_time:8.3f}s  ({len(vec_issues)} issues)")
+    if args.skip_legacy:
+        return
+    old_time, old_issues = timed(run_legacy, nodes, edges, zones, args.max_errors, repeat=1)
+    print(f"iterrows:   {old_time:8.3f}s  ({len(old_issues)} issues)")
+    print(f"speedup:    {old_time / vec_time:8.1f}x")
+    if vec_issues != old_issues:
+        raise SystemExit('Vectorised output differs from the legacy implementation')
+    print('outputs identical')
+
+
+if __name__ == '__main__':
+    main()
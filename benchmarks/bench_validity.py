@@ -0,0 +1,56 @@
+"""Benchmark: thread-pooled geometry validity vs a single-threaded pass.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_validity --polygons 20000 --vertices 400 --threads 4
+
+Builds zone-like polygons with many ring vertices (a fraction of them
+self-intersecting), evaluates them with ``evaluate_validity`` on one thread
+and on ``--threads`` threads, checks both report the same rows and prints
+the timings.
+"""
+
+import argparse
+
+import numpy as np
+import shapely
+
+from benchmarks.bench_geometry_mapping import timed
+from src.python_osw_validation.validity import default_thread_count, evaluate_validity
+
+
+def build_polygons(n_polygons: int, n_vertices: int, invalid_rate: float, seed: int = 0) -> np.ndarray:
+    rng = np.random.default_rng(seed)
+    angles = np.linspace(0, 2 * np.pi, n_vertices, endpoint=False)
+    radius = 1e-3 * (1 + 0.2 * rng.random((n_polygons, n_vertices)))
+    centres = rng.random((n_polygons, 2)) * 0.1 + (-122.3, 47.6)
+    ring = np.stack([centres[:, :1] + radius * np.cos(angles), centres[:, 1:] + radius * np.sin(angles)], axis=2)
+    broken = rng.random(n_polygons) < invalid_rate
+    ring[broken, 1], ring[broken, 2] = ring[broken, 2].copy(), ring[broken, 1].copy()
+    ring = np.concatenate([ring, ring[:, :1]], axis=1)
+    return shapely.polygons(ring)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--polygons', type=int, default=20000)
+    parser.add_argument('--vertices', type=int, default=400)
+    parser.add_argument('--invalid-rate', type=float, default=0.05)
+    parser.add_argument('--threads', type=int, default=default_thread_count())
+    parser.add_argument('--repeat', type=int, default=3)
+    args = parser.parse_args(argv)
+
+    polygons = build_polygons(args.polygons, args.vertices, args.invalid_rate)
+    print(f"polygons={len(polygons)} vertices/polygon={args.vertices}")
+    single_time, single = timed(evaluate_validity, polygons, 'Polygon', 1, repeat=args.repeat)
+    print(f"1 thread:   {single_time:8.3f}s  ({len(single.invalid)} invalid)")
+    pooled_time, pooled = timed(evaluate_validity, polygons, 'Polygon', args.threads, repeat=args.repeat)
+    print(f"{args.threads} threads: {pooled_time:8.3f}s  ({len(pooled.invalid)} invalid)")
+    print(f"speedup:    {single_time / pooled_time:8.1f}x")
+    if not np.array_equal(single.invalid, pooled.invalid):
+        raise SystemExit('Threaded result differs from the single-threaded one')
+    print('outputs identical')
+
+
+if __name__ == '__main__':
+    main()
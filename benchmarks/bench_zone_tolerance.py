@@ -0,0 +1,106 @@
+"""Benchmark: grid-hashed tolerance matching on high-vertex zone polygons.
+
+Run from the repository root::
+
+    python -m benchmarks.bench_zone_tolerance --zones 500 --vertices 800
+
+Builds circular zones with many vertices whose ``_w_id`` lists reference a
+node at every vertex, drifts a fraction of those nodes off the ring, and
+times ``OSWValidation._validate_zone_geometry_mapping`` (``ToleranceGrid``)
+against a per-zone refs × vertices NumPy comparison and the legacy
+``iterrows`` implementation. All three must report the same messages.
+"""
+
+import argparse
+
+import geopandas as gpd
+import numpy as np
+import shapely
+
+from src.python_osw_validation import OSWValidation
+from benchmarks import legacy_geometry_mapping as legacy
+from benchmarks.bench_geometry_mapping import timed
+
+
+def build_frames(n_zones: int, n_vertices: int, mismatch_rate: float, seed: int = 0):
+    rng = np.random.default_rng(seed)
+    angles = np.linspace(0, 2 * np.pi, n_vertices, endpoint=False)
+    centres = rng.random((n_zones, 2)) * 0.1 + (-122.3, 47.6)
+    ring_x = centres[:, :1] + 1e-3 * np.cos(angles)[None, :]
+    ring_y = centres[:, 1:] + 1e-3 * np.sin(angles)[None, :]
+
+    node_ids = np.array([f"n{i}" for i in range(n_zones * n_vertices)], dtype=object)
+    node_x, node_y = ring_x.ravel().copy(), ring_y.ravel().copy()
+    drift = rng.random(len(node_x)) < mismatch_rate
+    node_x[drift] += 1e-5
+    nodes = gpd.GeoDataFrame({'_id': node_ids, 'geometry': shapely.points(node_x, node_y)})
+
+    ring = np.stack([ring_x, ring_y], axis=2)
+    ring = np.concatenate([ring, ring[:, :1]], axis=1)
+    zones = gpd.GeoDataFrame({
+        '_id': np.array([f"z{i}" for i in range(n_zones)], dtype=object),
+        '_w_id': [list(node_ids[z * n_vertices:(z + 1) * n_vertices]) for z in range(n_zones)],
+        'geometry': shapely.polygons(ring),
+    })
+    return nodes, zones
+
+
+def run_grid(nodes, zones, max_errors):
+    v = OSWValidation(zipfile_path='bench.zip')
+    v._validate_zone_geometry_mapping(zones, v._build_node_coord_map(nodes), max_errors)
+    return [(i['error_message'], i['feature_index']) for i in v.issues]
+
+
+def run_pairwise(nodes, zones, max_errors):
+    """Per-zone broadcast of every _w_id against every ring vertex."""
+    node_map = OSWValidation(zipfile_path='bench.zip')._build_node_coord_map(nodes)
+    tol = OSWValidation._COORD_TOLERANCE
+    logged = []
+    for feat_idx, geom, zone_id, w_ids in zip(zones.index, zones.geometry, zones['_id'], zones['_w_id']):
+        ring = shapely.get_coordinates(geom.exterior)
+        refs = np.array(w_ids, dtype=object)
+        positions = node_map.positions(refs)
+        x, y = node_map.xy(positions)
+        close = (np.abs(ring[:, 0][None, :] - x[:, None]) <= tol) & (np.abs(ring[:, 1][None, :] - y[:, None]) <= tol)
+        for ref in np.flatnonzero((positions >= 0) & ~close.any(axis=1)):
+            if len(logged) >= max_errors:
+                return logged
+            logged.append((f"zones id '{zone_id}' : "
+                           f"node id '{refs[ref]}' coordinate {node_map.coord(positions[ref])} is not a vertex "
+                           f"of the zone polygon geometry (_w_id coordinate mismatch).", feat_idx))
+    return logged
+
+
+def run_legacy(nodes, zones, max_errors):
+    return legacy.validate_zone_geometry_mapping(zones, legacy.build_node_coord_map(nodes), max_errors)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--zones', type=int, default=300)
+    parser.add_argument('--vertices', type=int, default=600)
+    parser.add_argument('--mismatch-rate', type=float, default=0.01)
+    parser.add_argument('--max-errors', type=int, default=10 ** 9)
+    parser.add_argument('--repeat', type=int, default=3)
+    parser.add_argument('--skip-legacy', action='store_true')
+    args = parser.parse_args(argv)
+
+    nodes, zones = build_frames(args.zones, args.vertices, args.mismatch_rate)
+    print(f"zones={len(zones)} vertices/zone={args.vertices} nodes={len(nodes)}")
+
+    grid_time, grid_issues = timed(run_grid, nodes, zones, args.max_errors, repeat=args.repeat)
+    print(f"grid:       {grid_time:8.3f}s  ({len(grid_issues)} issues)")
+    pair_time, pair_issues = timed(run_pairwise, nodes, zones, args.max_errors, repeat=args.repeat)
+    print(f"pairwise:   {pair_time:8.3f}s  ({len(pair_issues)} issues)")
+    if pair_issues != grid_issues:
+        raise SystemExit('Grid output differs from the pairwise comparison')
+    if not args.skip_legacy:
+        old_time, old_issues = timed(run_legacy, nodes, zones, args.max_errors, repeat=1)
+        print(f"iterrows:   {old_time:8.3f}s  ({len(old_issues)} issues)")
+        if old_issues != grid_issues:
+            raise SystemExit('Grid output differs from the legacy implementation')
+    print('outputs identical')
+
+
+if __name__ == '__main__':
+    main()
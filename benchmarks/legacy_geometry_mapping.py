@@ -0,0 +1,104 @@
+"""Row-wise (``DataFrame.iterrows``) geometry mapping checks as shipped in 0.4.3.
+
+Kept only as the reference implementation for benchmarks and parity checks
+against the vectorised ``OSWValidation`` methods. Each function returns the
+list of ``(message, feature_index)`` pairs the old code would have logged.
+"""
+
+from typing import Any, Dict, List, Tuple
+
+COORD_TOLERANCE = 1e-7
+
+
+def _coords_match(c1, c2) -> bool:
+    return abs(c1[0] - c2[0]) <= COORD_TOLERANCE and abs(c1[1] - c2[1]) <= COORD_TOLERANCE
+
+
+def build_node_coord_map(nodes_df) -> Dict[Any, tuple]:
+    coord_map: Dict[Any, tuple] = {}
+    for _, row in nodes_df.iterrows():
+        try:
+            nid = row['_id']
+        except KeyError:
+            continue
+        geom = row.geometry
+        if nid is not None and geom is not None and geom.geom_type == 'Point':
+            coord_map[nid] = (geom.x, geom.y)
+    return coord_map
+
+
+def validate_edge_geometry_mapping(edges_df, node_coord_map, max_errors: int) -> List[Tuple[str, Any]]:
+    logged: List[Tuple[str, Any]] = []
+    if edges_df is None or not node_coord_map:
+        return logged
+    has_u_id = '_u_id' in edges_df.columns
+    has_v_id = '_v_id' in edges_df.columns
+    if not (has_u_id or has_v_id):
+        return logged
+    for feat_idx, row in edges_df.iterrows():
+        if len(logged) >= max_errors:
+            break
+        geom = row.geometry
+        if geom is None or geom.geom_type != 'LineString':
+            continue
+        coords = list(geom.coords)
+        if not coords:
+            continue
+        try:
+            edge_id = row['_id']
+        except KeyError:
+            edge_id = feat_idx
+        if has_u_id:
+            u_id = row['_u_id']
+            if u_id is not None and u_id in node_coord_map:
+                node_coord = node_coord_map[u_id]
+                edge_start = (coords[0][0], coords[0][1])
+                if not _coords_match(edge_start, node_coord):
+                    logged.append((f"edges id '{edge_id}' : "
+                                   f"start coordinate {edge_start} does not match "
+                                   f"node id '{u_id}' coordinate {node_coord} (_u_id mismatch).", feat_idx))
+        if len(logged) >= max_errors:
+            break
+        if has_v_id:
+            v_id = row['_v_id']
+            if v_id is not None and v_id in node_coord_map:
+                node_coord = node_coord_map[v_id]
+                edge_end = (coords[-1][0], coords[-1][1])
+                if not _coords_match(edge_end, node_coord):
+                    logged.append((f"edges id '{edge_id}' : "
+                                   f"end coordinate {edge_end} does not match "
+                                   f"node id '{v_id}' coordinate {node_coord} (_v_id mismatch).", feat_idx))
+    return logged
+
+
+def validate_zone_geometry_mapping(zones_df, node_coord_map, max_errors: int) -> List[Tuple[str, Any]]:
+    logged: List[Tuple[str, Any]] = []
+    if zones_df is None or not node_coord_map or '_w_id' not in zones_df.columns:
+        return logged
+    for feat_idx, row in zones_df.iterrows():
+        if len(logged) >= max_errors:
+            break
+        geom = row.geometry
+        if geom is None or geom.geom_type != 'Polygon':
+            continue
+        try:
+            zone_id = row['_id']
+        except KeyError:
+            zone_id = feat_idx
+        ring_coords = {(c[0], c[1]) for c in geom.exterior.coords}
+        w_ids = row['_w_id']
+        if w_ids is None:
+            continue
+        if not isinstance(w_ids, (list, tuple)):
+            w_ids = [w_ids]
+        for w_id in w_ids:
+            if len(logged) >= max_errors:
+                break
+            if w_id is None or w_id not in node_coord_map:
+                continue
+            node_coord = node_coord_map[w_id]
+            if not any(_coords_match(node_coord, rc) for rc in ring_coords):
+                logged.append((f"zones id '{zone_id}' : "
+                               f"node id '{w_id}' coordinate {node_coord} is not a vertex "
+                               f"of the zone polygon geometry (_w_id coordinate mismatch).", feat_idx))
+    return logged
@@ -0,0 +1,305 @@
+"""Benchmark suite: every validation stage over fixed-size synthetic inputs, with baselines.
+
+Run from the repository root::
+
+    python -m benchmarks.suite run --size medium --output current.json
+    python -m benchmarks.suite compare baseline.json current.json --threshold 0.15
+
+``run`` writes a seeded ``SyntheticDataset`` of the chosen size
+(``SIZES``), validates it ``--repeat`` times with stage timings, and times
+the geometry mapping and validity checks on their own:
+
+* ``pipeline.<stage>`` for extraction, discovery, id, reference, geometry
+  mapping and validity checks, ``pipeline.schema.<file>`` and
+  ``pipeline.load.<file>`` per dataset file, and ``pipeline.total``;
+* ``mapping.module.*``: ``geometry_mapping_validator`` on parsed documents;
+* ``mapping.method.*``: the ``OSWValidation`` methods on loaded GeoDataFrames;
+* ``validity.<file>``: ``evaluate_validity`` on one thread.
+
+Each benchmark keeps the best and the median of its samples; results are
+saved as JSON together with the inputs and environment they were measured
+on. ``compare`` checks the best times of a run against a saved baseline and
+exits with status 1 if any benchmark is slower by more than ``--threshold``
+(a ratio; ``--threshold-for PATTERN=RATIO`` overrides it for matching
+names) and by more than ``--min-seconds``, which keeps timer noise on very
+short benchmarks from failing the comparison. Both files must come from the
+same inputs.
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from benchmarks.synthetic import SyntheticDataset
+from src.python_osw_validation import OSWValidation
+from src.python_osw_validation.extracted_data_validator import OSW_DATASET_FILES
+from src.python_osw_validation.feature_table import INTEGRITY_COLUMNS
+from src.python_osw_validation.geometry_mapping_validator import (
+    build_node_coord_index,
+    validate_edge_node_mapping,
+    validate_zone_node_mapping,
+)
+from src.python_osw_validation.helpers import _read_geojson_without_ext
+from src.python_osw_validation.validity import evaluate_validity
+from src.python_osw_validation.version import __version__
+
+FORMAT = 1
+# Edges per size; the other files are proportional (see SyntheticDataset)
+SIZES = {'small': 2_000, 'medium': 20_000, 'large': 200_000}
+# Meta fields that must agree for two result files to be comparable
+INPUT_FIELDS = ('size', 'edges', 'seed')
+
+STATUS_OK = 'ok'
+STATUS_FASTER = 'faster'
+STATUS_REGRESSION = 'REGRESSION'
+STATUS_NEW = 'new'
+STATUS_MISSING = 'missing'
+
+
+class Comparison(NamedTuple):
+    name: str
+    baseline: Optional[float]
+    current: Optional[float]
+    threshold: float
+    status: str
+
+    @property
+    def change(self) -> Optional[float]:
+        """Relative change of the best time; positive is slower."""
+        if not self.baseline or self.current is None:
+            return None
+        return self.current / self.baseline - 1.0
+
+
+def _summary(samples: Sequence[float]) -> Dict[str, Any]:
+    return {'seconds': min(samples), 'median': statistics.median(samples), 'samples': list(samples)}
+
+
+def _sample(fn: Callable[[], Any], repeat: int) -> List[float]:
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+    return samples
+
+
+def _pipeline(path: str, file_keys: Dict[str, str], repeat: int) -> Dict[str, List[float]]:
+    """Stage timings of ``repeat`` full validations of the archive at ``path``."""
+    samples: Dict[str, List[float]] = {}
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = OSWValidation(zipfile_path=path).validate(max_errors=10 ** 9, timings=True)
+        total = time.perf_counter() - start
+        if not result.is_valid:
+            raise SystemExit(f'The synthetic dataset should be valid: {result.errors[:3]}')
+        run: Dict[str, float] = {'pipeline.total': total}
+        for timing in result.timings:
+            name = f'pipeline.{timing.stage}'
+            if timing.filename is not None:
+                name += f'.{file_keys.get(timing.filename, timing.filename)}'
+            run[name] = run.get(name, 0.0) + timing.wall
+        for name, seconds in run.items():
+            samples.setdefault(name, []).append(seconds)
+    return samples
+
+
+def _checks(path: str, dataset: SyntheticDataset, directory: str, repeat: int) -> Dict[str, List[float]]:
+    """Geometry mapping and validity checks timed on their own."""
+    files = {}
+    for key in dataset.keys():
+        files[key] = os.path.join(directory, f'{key}.geojson')
+        with open(files[key], 'w') as stream:
+            json.dump(dataset.document(key), stream)
+    documents = {}
+    for key, file_path in files.items():
+        with open(file_path) as stream:
+            documents[key] = json.load(stream)
+    frames = {key: _read_geojson_without_ext(file_path, columns=INTEGRITY_COLUMNS)
+              for key, file_path in files.items()}
+
+    validator = OSWValidation(zipfile_path=path)
+    module_index = build_node_coord_index(documents['nodes'])
+    method_index = validator._build_node_coord_map(frames['nodes'])
+    if validate_edge_node_mapping(documents['edges'], module_index) or \
+            validate_zone_node_mapping(documents.get('zones'), module_index):
+        raise SystemExit('geometry_mapping_validator reported issues on the synthetic dataset')
+
+    def method(check, frame):
+        def run():
+            fresh = OSWValidation(zipfile_path=path)
+            check(fresh, frame, method_index, 10 ** 9)
+            if fresh.errors:
+                raise SystemExit(f'{check.__name__} reported errors on the synthetic dataset')
+        return run
+
+    benchmarks = {
+        'mapping.module.node_index': lambda: build_node_coord_index(documents['nodes']),
+        'mapping.module.edges': lambda: validate_edge_node_mapping(documents['edges'], module_index),
+        'mapping.method.node_index': lambda: validator._build_node_coord_map(frames['nodes']),
+        'mapping.method.edges': method(OSWValidation._validate_edge_geometry_mapping, frames['edges']),
+    }
+    if 'zones' in documents:
+        benchmarks['mapping.module.zones'] = lambda: validate_zone_node_mapping(documents['zones'], module_index)
+        benchmarks['mapping.method.zones'] = method(OSWValidation._validate_zone_geometry_mapping, frames['zones'])
+    for key, frame in frames.items():
+        geometries = np.asarray(frame.geometry.values)
+        expected = OSW_DATASET_FILES[key]['geometry']
+        benchmarks[f'validity.{key}'] = lambda g=geometries, e=expected: evaluate_validity(g, e, threads=1)
+    return {name: _sample(fn, repeat) for name, fn in benchmarks.items()}
+
+
+def run_suite(size: str = 'medium', seed: int = 0, repeat: int = 5, edges: Optional[int] = None) -> Dict[str, Any]:
+    """Run every benchmark; returns the JSON-ready results document."""
+    if edges is None:
+        if size not in SIZES:
+            raise ValueError(f'size must be one of {", ".join(SIZES)}')
+        edges = SIZES[size]
+    else:
+        size = 'custom'
+    dataset = SyntheticDataset(edges=edges, seed=seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = dataset.write_zip(os.path.join(tmp, 'suite.zip'))
+        file_keys = {dataset.member_name(key): key for key in dataset.keys()}
+        samples = _pipeline(path, file_keys, repeat)
+        samples.update(_checks(path, dataset, tmp, repeat))
+    return {
+        'format': FORMAT,
+        'meta': {
+            'size': size, 'edges': edges, 'seed': seed, 'repeat': repeat,
+            'counts': dataset.counts, 'version': __version__,
+            'python': platform.python_version(), 'platform': platform.platform(),
+            'cpus': os.cpu_count(), 'created': datetime.now(timezone.utc).isoformat(timespec='seconds'),
+        },
+        'results': {name: _summary(values) for name, values in sorted(samples.items())},
+    }
+
+
+def save_results(results: Dict[str, Any], path: str) -> None:
+    with open(path, 'w') as stream:
+        json.dump(results, stream, indent=2, sort_keys=True)
+        stream.write('\n')
+
+
+def load_results(path: str) -> Dict[str, Any]:
+    with open(path) as stream:
+        results = json.load(stream)
+    if results.get('format') != FORMAT:
+        raise ValueError(f"{path}: unsupported results format {results.get('format')!r}")
+    return results
+
+
+def _threshold_for(name: str, threshold: float, overrides: Dict[str, float]) -> float:
+    # The last matching pattern wins, as with repeated command line options
+    for pattern, value in overrides.items():
+        if fnmatch.fnmatchcase(name, pattern):
+            threshold = value
+    return threshold
+
+
+def compare_results(baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.15,
+                    overrides: Optional[Dict[str, float]] = None, min_seconds: float = 0.001) -> List[Comparison]:
+    """Compare best times benchmark by benchmark; raises ValueError if the inputs differ."""
+    for field in INPUT_FIELDS:
+        if baseline['meta'].get(field) != current['meta'].get(field):
+            raise ValueError(f"results come from different inputs: {field} is "
+                             f"{baseline['meta'].get(field)!r} in the baseline, {current['meta'].get(field)!r} now")
+    overrides = overrides or {}
+    comparisons = []
+    for name in sorted(set(baseline['results']) | set(current['results'])):
+        before = baseline['results'].get(name, {}).get('seconds')
+        after = current['results'].get(name, {}).get('seconds')
+        limit = _threshold_for(name, threshold, overrides)
+        if before is None:
+            status = STATUS_NEW
+        elif after is None:
+            status = STATUS_MISSING
+        elif after > before * (1.0 + limit) and after - before > min_seconds:
+            status = STATUS_REGRESSION
+        elif after < before / (1.0 + limit) and before - after > min_seconds:
+            status = STATUS_FASTER
+        else:
+            status = STATUS_OK
+        comparisons.append(Comparison(name, before, after, limit, status))
+    return comparisons
+
+
+def _format_seconds(seconds: Optional[float]) -> str:
+    return f'{seconds * 1000:10.1f}' if seconds is not None else f'{"-":>10}'
+
+
+def _run(args) -> int:
+    results = run_suite(args.size, args.seed, args.repeat, args.edges)
+    meta = results['meta']
+    print(f"size={meta['size']} edges={meta['edges']} seed={meta['seed']} repeat={meta['repeat']}")
+    for name, entry in results['results'].items():
+        print(f"{name:<36} {_format_seconds(entry['seconds'])} ms  (median {entry['median'] * 1000:.1f} ms)")
+    if args.output:
+        save_results(results, args.output)
+        print(f'saved {args.output}')
+    return 0
+
+
+def _compare(args) -> int:
+    overrides = {}
+    for spec in args.threshold_for:
+        pattern, _, value = spec.partition('=')
+        overrides[pattern] = float(value)
+    try:
+        comparisons = compare_results(load_results(args.baseline), load_results(args.current),
+                                      args.threshold, overrides, args.min_seconds)
+    except ValueError as e:
+        print(e, file=sys.stderr)
+        return 2
+    print(f"{'benchmark':<36} {'baseline ms':>11} {'current ms':>10} {'change':>8}  status")
+    for comparison in comparisons:
+        change = f'{comparison.change:+8.1%}' if comparison.change is not None else f'{"-":>8}'
+        print(f"{comparison.name:<36} {_format_seconds(comparison.baseline):>11} "
+              f"{_format_seconds(comparison.current)} {change}  {comparison.status}")
+    regressions = [comparison.name for comparison in comparisons if comparison.status == STATUS_REGRESSION]
+    if regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        return 1
+    print('no regressions')
+    return 0
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    commands = parser.add_subparsers(dest='command', required=True)
+
+    run = commands.add_parser('run', help='run the suite')
+    run.add_argument('--size', choices=SIZES, default='medium')
+    run.add_argument('--edges', type=int, default=None, help='custom input size instead of --size')
+    run.add_argument('--seed', type=int, default=0)
+    run.add_argument('--repeat', type=int, default=5)
+    run.add_argument('--output', help='JSON file to save the results to')
+    run.set_defaults(handler=_run)
+
+    compare = commands.add_parser('compare', help='compare a run with a saved baseline')
+    compare.add_argument('baseline')
+    compare.add_argument('current')
+    compare.add_argument('--threshold', type=float, default=0.15,
+                         help='allowed slowdown as a ratio of the baseline (default 0.15)')
+    compare.add_argument('--threshold-for', action='append', default=[], metavar='PATTERN=RATIO',
+                         help='threshold for benchmarks matching a glob pattern; repeatable')
+    compare.add_argument('--min-seconds', type=float, default=0.001,
+                         help='slowdowns smaller than this are never regressions (default 0.001)')
+    compare.set_defaults(handler=_compare)
+
+    args = parser.parse_args(argv)
+    sys.exit(args.handler(args))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,425 @@
+"""Deterministic synthetic OSW 0.3 datasets at any size.
+
+``SyntheticDataset`` lays out a jittered grid of nodes and picks, from a
+seeded generator:
+
+* edges between neighbouring grid nodes, each a three-vertex LineString
+  from its ``_u_id`` node to its ``_v_id`` node, tagged as sidewalks,
+  crossings, footways, steps and streets;
+* zones over grid cells, whose ``_w_id`` lists the cell's corner nodes in
+  ring order;
+* points, lines and polygons (street furniture, fences, buildings, woods)
+  inside grid cells.
+
+Tags only use values the 0.3 schemas in ``schema/`` accept, so a dataset
+validates cleanly unless a benchmark breaks it on purpose: ``faults`` maps
+fault types (``FAULT_TYPES``) to the share of their target file's features
+that get the fault, drawn from a generator of their own so the rest of the
+dataset stays the same for a seed. Features are
+produced lazily and written to the ZIP one at a time, so datasets with
+millions of edges never exist in memory as documents. Used by the
+benchmarks and by tests::
+
+    SyntheticDataset(edges=1_000_000, seed=7).write_zip('region.zip', layout='nested')
+
+or from the repository root::
+
+    python -m benchmarks.synthetic region.zip --edges 1000000 --seed 7 --layout nested
+"""
+
+import argparse
+import json
+import math
+import os
+import time
+import zipfile
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+SCHEMA_URL = 'https://sidewalks.washington.edu/opensidewalks/0.3/schema.json'
+DATASET_KEYS = ('nodes', 'edges', 'zones', 'points', 'lines', 'polygons')
+# flat: opensidewalks.<key>.geojson at the root; nested: the same in one folder;
+# legacy: <folder>/<prefix>.<key>.OSW.geojson
+LAYOUTS = ('flat', 'nested', 'legacy')
+
+# Fault type -> dataset file it is injected into
+FAULT_TARGETS = {
+    'bad_enum': 'edges',              # surface outside the enum
+    'wrong_type': 'edges',            # width as a string
+    'missing_u_id': 'edges',          # no _u_id
+    'endpoint_drift': 'edges',        # start vertex about a metre off its _u_id node
+    'zone_misalignment': 'zones',     # first ring vertex about a metre off its _w_id node
+    'duplicate_id': 'edges',          # _id of the previous edge
+    'invalid_geometry': 'polygons',   # self-intersecting (bow-tie) ring
+    'null_ext': 'edges',              # ext:* property set to null
+}
+FAULT_TYPES = tuple(FAULT_TARGETS)
+
+_DEGREES_TO_METERS = 111_320.0
+_DRIFT = 1e-5
+_STREET_NAMES = ('Pine St', 'Pike St', 'Union St', 'Spring St', 'Madison St', 'Marion St')
+
+# (weight, fixed tags) per kind; edges draw their other tags in _edge_properties
+_EDGE_KINDS: Sequence[Tuple[float, Dict[str, Any]]] = (
+    (0.45, {'highway': 'footway', 'footway': 'sidewalk'}),
+    (0.15, {'highway': 'footway', 'footway': 'crossing'}),
+    (0.15, {'highway': 'footway'}),
+    (0.05, {'highway': 'steps'}),
+    (0.14, {'highway': 'residential'}),
+    (0.06, {'highway': 'service'}),
+)
+_NODE_KINDS: Sequence[Tuple[float, Dict[str, Any]]] = (
+    (0.85, {}),
+    (0.10, {'barrier': 'kerb', 'kerb': 'lowered', 'tactile_paving': 'yes'}),
+    (0.03, {'barrier': 'kerb', 'kerb': 'raised'}),
+    (0.02, {'barrier': 'kerb', 'kerb': 'flush'}),
+)
+_POINT_KINDS: Sequence[Tuple[float, Dict[str, Any]]] = (
+    (0.25, {'amenity': 'bench'}),
+    (0.15, {'emergency': 'fire_hydrant'}),
+    (0.20, {'highway': 'street_lamp'}),
+    (0.10, {'man_made': 'manhole'}),
+    (0.10, {'power': 'pole'}),
+    (0.20, {'natural': 'tree', 'leaf_cycle': 'deciduous', 'leaf_type': 'broadleaved'}),
+)
+_LINE_KINDS: Sequence[Tuple[float, Dict[str, Any]]] = (
+    (0.6, {'barrier': 'fence'}),
+    (0.4, {'natural': 'tree_row', 'leaf_cycle': 'deciduous'}),
+)
+_POLYGON_KINDS: Sequence[Tuple[float, Dict[str, Any]]] = (
+    (0.5, {'building': 'house'}),
+    (0.3, {'building': 'apartments'}),
+    (0.1, {'building': 'commercial'}),
+    (0.1, {'natural': 'wood', 'leaf_type': 'mixed'}),
+)
+
+
+def _pick_kinds(rng: np.random.Generator, kinds: Sequence[Tuple[float, Dict[str, Any]]], count: int) -> np.ndarray:
+    weights = np.array([weight for weight, _ in kinds])
+    return rng.choice(len(kinds), size=count, p=weights / weights.sum())
+
+
+def _round(values: np.ndarray) -> np.ndarray:
+    # Seven decimals (about 1 cm), as exported coordinates usually are
+    return np.round(values, 7)
+
+
+class SyntheticDataset:
+    """A seeded OSW 0.3 dataset with ``edges`` edges and, by default, proportional other files.
+
+    ``zones``, ``points``, ``lines`` and ``polygons`` default to 1%, 10%, 2%
+    and 2% of ``edges``; pass 0 to leave a file out. Nodes are the grid
+    needed to fit the edges and zones. ``faults`` maps fault types to rates
+    in [0, 1].
+    """
+
+    def __init__(self, edges: int = 1000, zones: Optional[int] = None, points: Optional[int] = None,
+                 lines: Optional[int] = None, polygons: Optional[int] = None, seed: int = 0,
+                 origin: Tuple[float, float] = (-122.33, 47.60), spacing: float = 1e-4,
+                 faults: Optional[Dict[str, float]] = None):
+        counts = {'edges': edges,
+                  'zones': edges // 100 if zones is None else zones,
+                  'points': edges // 10 if points is None else points,
+                  'lines': edges // 50 if lines is None else lines,
+                  'polygons': edges // 50 if polygons is None else polygons}
+        if any(count < 0 for count in counts.values()):
+            raise ValueError('feature counts must not be negative')
+        self.seed = seed
+        self.origin = origin
+        self.spacing = spacing
+        rng = np.random.default_rng(seed)
+
+        # Grid of side s: s*(s-1) horizontal plus as many vertical neighbour pairs, (s-1)**2 cells
+        cells_needed = max(counts['edges'] / 2, counts['zones'], counts['points'], counts['lines'],
+                           counts['polygons'], 1)
+        self.side = side = int(math.ceil(math.sqrt(cells_needed))) + 1
+        row, col = np.divmod(np.arange(side * side), side)
+        jitter = rng.uniform(-0.2, 0.2, size=(2, side * side)) * spacing
+        self.node_x = _round(origin[0] + col * spacing + jitter[0])
+        self.node_y = _round(origin[1] + row * spacing + jitter[1])
+        self.node_kinds = _pick_kinds(rng, _NODE_KINDS, side * side)
+
+        pairs = side * (side - 1)
+        chosen = np.sort(rng.choice(2 * pairs, size=counts['edges'], replace=False))
+        horizontal = chosen < pairs
+        r, c = np.divmod(np.where(horizontal, chosen, chosen - pairs), np.where(horizontal, side - 1, side))
+        self.edge_u = r * side + c
+        self.edge_v = np.where(horizontal, self.edge_u + 1, self.edge_u + side)
+        self.edge_bend = rng.uniform(-0.05, 0.05, size=counts['edges']) * spacing
+        self.edge_kinds = _pick_kinds(rng, _EDGE_KINDS, counts['edges'])
+        self.edge_draws = rng.random(size=(counts['edges'], 4))
+
+        cells = (side - 1) * (side - 1)
+        self.zone_cells = np.sort(rng.choice(cells, size=counts['zones'], replace=False))
+        self.point_cells = rng.integers(0, cells, size=counts['points'])
+        self.point_offsets = rng.uniform(0.0, 0.4, size=(counts['points'], 2)) * spacing
+        self.point_kinds = _pick_kinds(rng, _POINT_KINDS, counts['points'])
+        self.line_cells = rng.integers(0, cells, size=counts['lines'])
+        self.line_kinds = _pick_kinds(rng, _LINE_KINDS, counts['lines'])
+        self.polygon_cells = rng.integers(0, cells, size=counts['polygons'])
+        self.polygon_kinds = _pick_kinds(rng, _POLYGON_KINDS, counts['polygons'])
+        self.counts = {'nodes': side * side, **counts}
+
+        self.faults = dict(faults or {})
+        for name, rate in self.faults.items():
+            if name not in FAULT_TARGETS:
+                raise ValueError(f'unknown fault type {name!r}; expected one of {", ".join(FAULT_TYPES)}')
+            if not 0.0 <= rate <= 1.0:
+                raise ValueError(f'fault rate for {name!r} must be between 0 and 1')
+        # One draw per fault type and target feature, whether or not the type is enabled,
+        # so a fault's features do not move when other rates change
+        self.fault_masks: Dict[str, np.ndarray] = {}
+        fault_rng = np.random.default_rng([seed, 1])
+        for name in FAULT_TYPES:
+            draws = fault_rng.random(counts[FAULT_TARGETS[name]])
+            if self.faults.get(name):
+                self.fault_masks[name] = draws < self.faults[name]
+
+    # -- geometry helpers ----------------------------------------------------
+
+    def _node_coord(self, node: int) -> List[float]:
+        return [float(self.node_x[node]), float(self.node_y[node])]
+
+    def _cell_corners(self, cell: int) -> List[int]:
+        row, col = divmod(int(cell), self.side - 1)
+        first = row * self.side + col
+        return [first, first + 1, first + self.side + 1, first + self.side]
+
+    def _cell_origin(self, cell: int) -> Tuple[float, float]:
+        row, col = divmod(int(cell), self.side - 1)
+        # Clear of the corner nodes, which are jittered by up to 0.2 spacing
+        return (self.origin[0] + (col + 0.25) * self.spacing, self.origin[1] + (row + 0.25) * self.spacing)
+
+    def _length(self, coords: List[List[float]]) -> float:
+        cos_lat = math.cos(math.radians(coords[0][1]))
+        total = sum(math.hypot((b[0] - a[0]) * cos_lat, b[1] - a[1]) for a, b in zip(coords, coords[1:]))
+        return round(total * _DEGREES_TO_METERS, 2)
+
+    def fault_count(self, name: str) -> int:
+        """Number of features that get fault ``name``."""
+        mask = self.fault_masks.get(name)
+        return int(mask.sum()) if mask is not None else 0
+
+    def _inject(self, key: str, index: int, feature: Dict[str, Any]) -> Dict[str, Any]:
+        for name, mask in self.fault_masks.items():
+            if FAULT_TARGETS[name] == key and mask[index]:
+                _FAULTS[name](feature, index)
+        return feature
+
+    # -- features --------------------------------------------------------------
+
+    def _edge_properties(self, index: int, coords: List[List[float]]) -> Dict[str, Any]:
+        kind = _EDGE_KINDS[self.edge_kinds[index]][1]
+        draw = self.edge_draws[index]
+        props = dict(kind)
+        props['length'] = self._length(coords)
+        highway, footway = kind['highway'], kind.get('footway')
+        if footway == 'crossing':
+            props['crossing:markings'] = ('zebra', 'lines', 'dashes', 'no')[int(draw[0] * 4)]
+            props['surface'] = 'asphalt'
+        elif highway == 'steps':
+            props['step_count'] = 3 + int(draw[0] * 20)
+            props['climb'] = 'up' if draw[1] < 0.5 else 'down'
+        elif highway == 'footway':
+            props['surface'] = ('concrete', 'concrete', 'asphalt', 'paving_stones')[int(draw[0] * 4)]
+            props['width'] = round(1.2 + draw[1] * 1.8, 1)
+            if draw[2] < 0.5:
+                props['incline'] = round((draw[3] - 0.5) * 0.16, 3)
+        else:
+            props['name'] = _STREET_NAMES[int(draw[0] * len(_STREET_NAMES))]
+            props['surface'] = 'asphalt'
+        return props
+
+    def _nodes(self) -> Iterator[Dict[str, Any]]:
+        for node in range(self.counts['nodes']):
+            yield _feature('Point', self._node_coord(node),
+                           {'_id': f'n{node}', **_NODE_KINDS[self.node_kinds[node]][1]})
+
+    def _edges(self) -> Iterator[Dict[str, Any]]:
+        for index, (u, v) in enumerate(zip(self.edge_u.tolist(), self.edge_v.tolist())):
+            start, end = self._node_coord(u), self._node_coord(v)
+            # A slight bend halfway, perpendicular to the edge
+            bend = float(self.edge_bend[index])
+            vertical = v - u != 1
+            middle = [round((start[0] + end[0]) / 2 + (bend if vertical else 0.0), 7),
+                      round((start[1] + end[1]) / 2 + (0.0 if vertical else bend), 7)]
+            coords = [start, middle, end]
+            props = {'_id': f'e{index}', '_u_id': f'n{u}', '_v_id': f'n{v}',
+                     **self._edge_properties(index, coords)}
+            yield self._inject('edges', index, _feature('LineString', coords, props))
+
+    def _zones(self) -> Iterator[Dict[str, Any]]:
+        for index, cell in enumerate(self.zone_cells.tolist()):
+            corners = self._cell_corners(cell)
+            ring = [self._node_coord(node) for node in corners]
+            yield self._inject('zones', index, _feature('Polygon', [ring + [ring[0]]], {
+                '_id': f'z{index}', '_w_id': [f'n{node}' for node in corners],
+                'highway': 'pedestrian', 'surface': 'paving_stones',
+            }))
+
+    def _points(self) -> Iterator[Dict[str, Any]]:
+        for index, cell in enumerate(self.point_cells.tolist()):
+            x0, y0 = self._cell_origin(cell)
+            dx, dy = self.point_offsets[index]
+            yield _feature('Point', [round(x0 + float(dx), 7), round(y0 + float(dy), 7)],
+                           {'_id': f'p{index}', **_POINT_KINDS[self.point_kinds[index]][1]})
+
+    def _lines(self) -> Iterator[Dict[str, Any]]:
+        step = 0.15 * self.spacing
+        for index, cell in enumerate(self.line_cells.tolist()):
+            x0, y0 = self._cell_origin(cell)
+            coords = [[round(x0 + step, 7), round(y0 + step, 7)],
+                      [round(x0 + 2 * step, 7), round(y0 + step, 7)],
+                      [round(x0 + 3 * step, 7), round(y0 + 2 * step, 7)]]
+            props = {'_id': f'l{index}', **_LINE_KINDS[self.line_kinds[index]][1]}
+            if 'barrier' in props:
+                props['length'] = self._length(coords)
+            yield _feature('LineString', coords, props)
+
+    def _polygons(self) -> Iterator[Dict[str, Any]]:
+        low, high = 0.1 * self.spacing, 0.4 * self.spacing
+        for index, cell in enumerate(self.polygon_cells.tolist()):
+            x0, y0 = self._cell_origin(cell)
+            ring = [[round(x0 + low, 7), round(y0 + low, 7)], [round(x0 + high, 7), round(y0 + low, 7)],
+                    [round(x0 + high, 7), round(y0 + high, 7)], [round(x0 + low, 7), round(y0 + high, 7)]]
+            yield self._inject('polygons', index, _feature(
+                'Polygon', [ring + [ring[0]]], {'_id': f'g{index}', **_POLYGON_KINDS[self.polygon_kinds[index]][1]}))
+
+    def features(self, key: str) -> Iterator[Dict[str, Any]]:
+        """Features of one dataset file, generated one at a time."""
+        if key not in DATASET_KEYS:
+            raise ValueError(f'unknown dataset key {key!r}')
+        return getattr(self, f'_{key}')()
+
+    def document(self, key: str) -> Dict[str, Any]:
+        """One dataset file as a parsed GeoJSON document (small datasets)."""
+        return {'$schema': SCHEMA_URL, 'type': 'FeatureCollection', 'features': list(self.features(key))}
+
+    def keys(self) -> List[str]:
+        """Dataset files with at least one feature."""
+        return [key for key in DATASET_KEYS if self.counts[key]]
+
+    # -- archives ---------------------------------------------------------------
+
+    def member_name(self, key: str, layout: str = 'flat', folder: str = 'synthetic') -> str:
+        if layout == 'flat':
+            return f'opensidewalks.{key}.geojson'
+        if layout == 'nested':
+            return f'{folder}/opensidewalks.{key}.geojson'
+        if layout == 'legacy':
+            return f'{folder}/{folder}.graph.{key}.OSW.geojson'
+        raise ValueError(f'layout must be one of {", ".join(LAYOUTS)}')
+
+    def write_zip(self, path: str, layout: str = 'flat', keys: Optional[Sequence[str]] = None,
+                  compression: int = zipfile.ZIP_DEFLATED) -> str:
+        """Write the dataset files (``keys``, default all non-empty) to a ZIP archive; returns ``path``."""
+        folder = os.path.splitext(os.path.basename(path))[0] or 'synthetic'
+        names = {key: self.member_name(key, layout, folder) for key in (keys or self.keys())}
+        with zipfile.ZipFile(path, 'w', compression) as archive:
+            for key, name in names.items():
+                with archive.open(name, 'w', force_zip64=True) as member:
+                    write_document(member, self.features(key))
+        return path
+
+
+def _feature(geometry_type: str, coordinates: Any, properties: Dict[str, Any]) -> Dict[str, Any]:
+    return {'type': 'Feature', 'geometry': {'type': geometry_type, 'coordinates': coordinates},
+            'properties': properties}
+
+
+# -- faults ------------------------------------------------------------------
+
+def _bad_enum(feature: Dict[str, Any], index: int) -> None:
+    feature['properties']['surface'] = 'cobblestone_x'
+
+
+def _wrong_type(feature: Dict[str, Any], index: int) -> None:
+    feature['properties']['width'] = '1.5 m'
+
+
+def _missing_u_id(feature: Dict[str, Any], index: int) -> None:
+    feature['properties'].pop('_u_id', None)
+
+
+def _endpoint_drift(feature: Dict[str, Any], index: int) -> None:
+    start = feature['geometry']['coordinates'][0]
+    feature['geometry']['coordinates'][0] = [round(start[0] + _DRIFT, 7), start[1]]
+
+
+def _zone_misalignment(feature: Dict[str, Any], index: int) -> None:
+    # The first (and closing) ring vertex drifts off its _w_id node
+    ring = feature['geometry']['coordinates'][0]
+    ring[0] = ring[-1] = [round(ring[0][0] + _DRIFT, 7), ring[0][1]]
+
+
+def _duplicate_id(feature: Dict[str, Any], index: int) -> None:
+    # The first edge keeps its id, so every injected id is a duplicate
+    if index:
+        feature['properties']['_id'] = f'e{index - 1}'
+
+
+def _invalid_geometry(feature: Dict[str, Any], index: int) -> None:
+    ring = feature['geometry']['coordinates'][0]
+    ring[1], ring[2] = ring[2], ring[1]
+
+
+def _null_ext(feature: Dict[str, Any], index: int) -> None:
+    feature['properties']['ext:surveyed'] = None
+
+
+_FAULTS = {
+    'bad_enum': _bad_enum,
+    'wrong_type': _wrong_type,
+    'missing_u_id': _missing_u_id,
+    'endpoint_drift': _endpoint_drift,
+    'zone_misalignment': _zone_misalignment,
+    'duplicate_id': _duplicate_id,
+    'invalid_geometry': _invalid_geometry,
+    'null_ext': _null_ext,
+}
+
+
+def write_document(stream, features: Iterator[Dict[str, Any]], chunk: int = 1000) -> None:
+    """Write a FeatureCollection to a binary ``stream`` feature by feature."""
+    stream.write(json.dumps({'$schema': SCHEMA_URL, 'type': 'FeatureCollection'})[:-1].encode('utf-8'))
+    stream.write(b', "features": [')
+    buffer: List[str] = []
+    first = True
+    for feature in features:
+        buffer.append(json.dumps(feature))
+        if len(buffer) >= chunk:
+            stream.write(((', ' if not first else '') + ', '.join(buffer)).encode('utf-8'))
+            buffer, first = [], False
+    if buffer:
+        stream.write(((', ' if not first else '') + ', '.join(buffer)).encode('utf-8'))
+    stream.write(b']}')
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('output', help='ZIP archive to write')
+    parser.add_argument('--edges', type=int, default=100000)
+    for key in ('zones', 'points', 'lines', 'polygons'):
+        parser.add_argument(f'--{key}', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=0)
+    parser.add_argument('--layout', choices=LAYOUTS, default='flat')
+    parser.add_argument('--fault', action='append', default=[], metavar='TYPE=RATE',
+                        help=f'inject a fault ({", ".join(FAULT_TYPES)}) into a share of features; repeatable')
+    args = parser.parse_args(argv)
+    faults = {}
+    for spec in args.fault:
+        name, _, rate = spec.partition('=')
+        faults[name] = float(rate or 1.0)
+
+    start = time.perf_counter()
+    dataset = SyntheticDataset(edges=args.edges, zones=args.zones, points=args.points, lines=args.lines,
+                               polygons=args.polygons, seed=args.seed, faults=faults)
+    dataset.write_zip(args.output, layout=args.layout)
+    counts = ', '.join(f'{count} {key}' for key, count in dataset.counts.items() if count)
+    print(f"wrote {args.output} ({os.path.getsize(args.output) / 2 ** 20:.1f} MiB: {counts}) "
+          f"in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == '__main__':
+    main()
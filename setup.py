@@ -21,7 +21,8 @@ setup(
     install_requires=[
         'jsonschema_rs==0.33.0',
         'zipfile36==0.1.3',
-        'geopandas==0.14.4'
+        'geopandas==0.14.4',
+        'shapely>=2.0'
     ],
     packages=find_packages(where='src'),
     classifiers=[
@@ -3,18 +3,76 @@ import gc
 import json
 import math
 import numbers
-from typing import Dict, Any, Optional, List, Tuple
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
+from typing import Dict, Any, Iterator, Optional, List, Sequence, Tuple, Union
 import geopandas as gpd
 import jsonschema_rs
+import numpy as np
+import pandas as pd
+import shapely
 
 from .zipfile_handler import ZipFileHandler
 from .extracted_data_validator import ExtractedDataValidator, OSW_DATASET_FILES
 from .version import __version__
+from .cache import CacheStats, CachedArchive, CachedFile, ResultCache, cache_key, file_digest
+from .feature_table import FeatureTable, INTEGRITY_COLUMNS
+from .id_codes import IdCodes, duplicated_ids, non_null, unique_in_order
+from .issues import Issue, IssueList
+from .incremental import Baseline, FeatureDiff, SchemaIssues
+from .geometry_mapping_validator import NodeIndex, ToleranceGrid, coords_within_tolerance
+from .node_store import IndexCodes, NodeStore, StoredNodes
+from .pipeline import FilePrefetcher
+from .schema_memo import MemoisedValidator
+from .tracing import (
+    ATTR_BYTES,
+    ATTR_ERRORS,
+    ATTR_FEATURES,
+    ATTR_FILENAME,
+    ATTR_ISSUES,
+    ATTR_VALID,
+    SPAN_SCHEMA_FILE,
+    SPAN_STAGE,
+    SPAN_VALIDATE,
+    Span,
+    Tracer,
+    get_tracer,
+    set_tracer,
+)
+from .validity import evaluate_validity
+from .memory import (
+    CHECKS_FACTOR,
+    MemoryBudget,
+    MemoryBudgetExceeded,
+    estimate_document_bytes,
+    estimate_table_bytes,
+)
+from .progress import (
+    CancellationToken,
+    ProgressCallback,
+    ProgressEvent,
+    StageCounters,
+    StageTiming,
+    ValidationCancelled,
+    STAGE_DISCOVER,
+    STAGE_EXTENSIONS,
+    STAGE_EXTRACT,
+    STAGE_GEOMETRY_MAPPING,
+    STAGE_GEOMETRY_VALIDITY,
+    STAGE_IDS,
+    STAGE_LOAD,
+    STAGE_REFERENCES,
+    STAGE_SCHEMA,
+)
 from .helpers import (
     _add_additional_properties_hint,
     _err_kind,
     _feature_index_from_error,
+    _first_non_serializable,
     _pretty_message,
+    _geodataframe_without_ext,
     _read_geojson_without_ext,
 )
 
@@ -29,6 +87,76 @@ DEFAULT_DATASET_SCHEMAS = {
 }
 
 
+def _file_size(path: Optional[str]) -> int:
+    try:
+        return os.path.getsize(path) if path else 0
+    except (OSError, TypeError):
+        return 0
+
+
+# shapely.get_type_id codes
+_POINT = 0
+_LINESTRING = 1
+_POLYGON = 3
+
+
+# Integrity checks accept either a GeoDataFrame or, in lean mode, a FeatureTable.
+_Frame = Union[gpd.GeoDataFrame, FeatureTable]
+
+def _geometry_array(gdf: _Frame) -> np.ndarray:
+    """Object array of shapely geometries (None for missing)."""
+    if isinstance(gdf, FeatureTable):
+        return gdf.geometry
+    return np.asarray(gdf.geometry.values, dtype=object)
+
+
+def _column(gdf: _Frame, name: str) -> np.ndarray:
+    """Object array of one column."""
+    return np.asarray(gdf[name], dtype=object)
+
+
+def _line_endpoints(geoms: np.ndarray, lines: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+    """Start/end x and y for the rows flagged in ``lines``; NaN elsewhere."""
+    n = len(geoms)
+    start_x, start_y, end_x, end_y = (np.full(n, np.nan) for _ in range(4))
+    if lines.any():
+        selected = geoms[lines]
+        starts = shapely.get_point(selected, 0)
+        ends = shapely.get_point(selected, -1)
+        start_x[lines] = shapely.get_x(starts)
+        start_y[lines] = shapely.get_y(starts)
+        end_x[lines] = shapely.get_x(ends)
+        end_y[lines] = shapely.get_y(ends)
+    return start_x, start_y, end_x, end_y
+
+
+def _scalar(value: Any) -> Any:
+    """Unwrap NumPy scalars so issue payloads stay JSON serializable."""
+    return value.item() if isinstance(value, np.generic) else value
+
+
+def _load_json(path: str) -> Any:
+    with open(path, 'r') as file:
+        return json.load(file)
+
+
+def _schema_issues_at(filename: str, schema: Dict[str, Any], messages: List[str], summary: Optional[str],
+                      errors: List[Any], feature_index: int) -> List[Issue]:
+    """Schema issues of a feature validated on its own, for its place at ``feature_index``."""
+    issues = [Issue(filename, feature_index, message) for message in messages]
+    if summary is not None:
+        issues.append(Issue(filename, feature_index, summary, listed=False))
+    issues.extend(Issue(filename, feature_index, _pretty_message(err, schema, feature_index), kind=_err_kind(err))
+                  for err in errors)
+    return issues
+
+
+def _dataset_key_for_path(file_path: str) -> str:
+    """Dataset key (edges, nodes, ...) contained in the file's basename, else ''."""
+    return next((osw_key for osw_key in OSW_DATASET_FILES.keys()
+                 if osw_key in os.path.basename(file_path)), '')
+
+
 class ValidationResult:
     """Container for validation outcome.
 
@@ -38,13 +166,32 @@ class ValidationResult:
     """
 
     def __init__(self, is_valid: bool, errors: Optional[List[str]] = None,
-                 issues: Optional[List[Dict[str, Any]]] = None):
+                 issues: Optional[Union[List[Dict[str, Any]], IssueList]] = None,
+                 cache_stats: Optional[CacheStats] = None, nodes_key: Optional[str] = None,
+                 timings: Optional[List[StageTiming]] = None):
         self.is_valid = is_valid
         if len(errors) == 0:
             self.errors = None
         else:
             self.errors = errors
         self.issues = issues
+        # Result cache hits/misses of this run (None when no cache was used)
+        self.cache_stats = cache_stats
+        # Key of this run's nodes in the node store (None when not stored)
+        self.nodes_key = nodes_key
+        # One StageTiming per stage run, in order (None unless timings were requested)
+        self.timings = timings
+
+    @property
+    def issues(self) -> Optional[List[Dict[str, Any]]]:
+        # Issues are kept compact until first read, then materialised as dicts once.
+        if isinstance(self._issues, IssueList):
+            self._issues = self._issues.to_list()
+        return self._issues
+
+    @issues.setter
+    def issues(self, issues: Optional[Union[List[Dict[str, Any]], IssueList]]) -> None:
+        self._issues = issues
 
 
 class OSWValidation:
@@ -67,8 +214,8 @@ class OSWValidation:
         self.zipfile_path = zipfile_path
         self.extracted_dir: Optional[str] = None
         self.errors: List[str] = []
-        # per-feature schema issues (formerly `fixme`)
-        self.issues: List[Dict[str, Any]] = []
+        # per-feature schema issues (formerly `fixme`), stored column-wise
+        self.issues: IssueList = IssueList()
 
         # Legacy single schema (if set, used for all)
         self.schema_file_path = schema_file_path  # may be None
@@ -83,35 +230,95 @@ class OSWValidation:
         self.line_schema_path = line_schema_path or self.dataset_schema_paths['edges']
         self.polygon_schema_path = polygon_schema_path or self.dataset_schema_paths['zones']
 
+        # sha256 per schema path, for result cache keys
+        self._schema_digests: Dict[str, str] = {}
+
+        # Per-run hooks, set by validate()
+        self._progress: Optional[ProgressCallback] = None
+        self._cancel_token: Optional[CancellationToken] = None
+        self._schema_memo = False
+        self._timings: Optional[List[StageTiming]] = None
+        # Per-feature detail behind a summary error (unmatched references, validity
+        # reasons), added once every summary is in
+        self._details: List[Issue] = []
+
     # ----------------------------
     # Utilities & helpers
     # ----------------------------
     def log_errors(self, message: str, filename: Optional[str] = None, feature_index: Optional[int] = None):
         """Helper to log errors in a consistent format."""
         self.errors.append(message)
-        self.issues.append({
-            'filename': filename,
-            'feature_index': feature_index,
-            'error_message': message,
-        })
-
-    # add this small helper inside OSWValidation (near other helpers)
-    def _get_colset(self, gdf: Optional[gpd.GeoDataFrame], col: str, filekey: str) -> set:
-        """Return set of a column if present; else log and return empty set."""
+        self.issues.append(Issue(filename, feature_index, message, listed=False))
+
+    def _add_details(self, max_errors: int) -> None:
+        """Add the deferred per-feature issues into the slots the other issues leave under ``max_errors``."""
+        room = max(max_errors - len(self.issues), 0)
+        self.issues.extend(self._details[:room])
+        self._details = []
+
+    def _check_cancelled(self) -> None:
+        if self._cancel_token is not None:
+            self._cancel_token.raise_if_cancelled()
+
+    @contextmanager
+    def _stage(self, stage: str, filename: Optional[str] = None) -> Iterator[StageCounters]:
+        """Report a stage transition to the progress callback.
+
+        Yields counters the stage body fills in; they are reported on the
+        'finished' event, with the stage's timing when timings are on, and
+        on the stage's tracing span. Cancellation is checked on entry.
+        """
+        self._check_cancelled()
+        counters = StageCounters()
+        if self._progress is not None:
+            self._progress(ProgressEvent(stage, 'started', filename))
+        errors_before = len(self.errors)
+        with get_tracer().start_span(SPAN_STAGE + stage, {ATTR_FILENAME: filename} if filename else {}) as span:
+            timings = self._timings
+            if timings is not None:
+                wall, cpu = time.perf_counter(), time.process_time()
+            yield counters
+            if timings is not None:
+                timings.append(StageTiming(stage, filename, time.perf_counter() - wall,
+                                           time.process_time() - cpu, counters.features, counters.bytes))
+            span.set_attribute(ATTR_FEATURES, counters.features)
+            span.set_attribute(ATTR_BYTES, counters.bytes)
+            span.set_attribute(ATTR_ERRORS, len(self.errors) - errors_before)
+        if self._progress is not None:
+            self._progress(ProgressEvent(stage, 'finished', filename, counters.features, counters.bytes))
+
+    def _get_colvalues(self, gdf: Optional[_Frame], col: str, filekey: str,
+                       explode: bool = False) -> Tuple[np.ndarray, np.ndarray]:
+        """Non-null values of a column and the row position of each, if present;
+        else log and return empty arrays.
+
+        ``explode`` flattens list-like cells (e.g. zones ``_w_id``), repeating the row.
+        """
+        empty = (np.empty(0, dtype=object), np.empty(0, dtype=np.intp))
         if gdf is None:
-            return set()
+            return empty
         if col not in gdf.columns:
             self.log_errors(f"Missing required column '{col}' in {filekey}.", filekey, None)
-            return set()
-        try:
-            return set(gdf[col].dropna())
-        except Exception:
-            # If non-hashable entries sneak in, coerce to str to keep moving
-            try:
-                return set(map(str, gdf[col].dropna()))
-            except Exception:
-                self.log_errors(f"Could not create set for column '{col}' in {filekey}.", filekey, None)
-                return set()
+            return empty
+        values = _column(gdf, col)
+        rows = np.arange(len(values))
+        if explode:
+            exploded = pd.Series(values, index=rows, dtype=object).explode()
+            values, rows = exploded.to_numpy(dtype=object), exploded.index.to_numpy()
+        keep = ~pd.isna(values)
+        return values[keep], rows[keep]
+
+    def _log_unmatched_references(self, filekey: str, gdf: _Frame, field: str, refs: np.ndarray,
+                                  rows: np.ndarray, max_errors: int) -> None:
+        """Defer one issue per unmatched reference (up to ``max_errors``) with the feature it is on."""
+        ids = _column(gdf, '_id') if '_id' in gdf.columns else None
+        for ref, row in zip(refs[:max_errors], rows[:max_errors]):
+            feature_id = _scalar(ids[row]) if ids is not None else None
+            self._details.append(Issue(
+                filekey, _scalar(gdf.index[row]),
+                f"{filekey} id '{feature_id}' : {field} '{ref}' is not an _id in nodes.",
+                feature_id=feature_id,
+            ))
 
     # ----------------------------
     # Geometry mapping helpers
@@ -122,26 +329,60 @@ class OSWValidation:
     def _coords_match(self, c1: tuple, c2: tuple) -> bool:
         return abs(c1[0] - c2[0]) <= self._COORD_TOLERANCE and abs(c1[1] - c2[1]) <= self._COORD_TOLERANCE
 
-    def _build_node_coord_map(self, nodes_df: gpd.GeoDataFrame) -> Dict[Any, tuple]:
-        """Return {node_id: (lon, lat)} from a nodes GeoDataFrame."""
-        coord_map: Dict[Any, tuple] = {}
-        for _, row in nodes_df.iterrows():
-            try:
-                nid = row['_id']
-            except KeyError:
-                continue
-            geom = row.geometry
-            if nid is not None and geom is not None and geom.geom_type == 'Point':
-                coord_map[nid] = (geom.x, geom.y)
-        return coord_map
+    def _build_node_coord_map(self, nodes_df: _Frame) -> NodeIndex:
+        """Return the node id → (lon, lat) index for Point nodes with an _id.
+
+        Duplicate ids keep the last occurrence.
+        """
+        if '_id' not in nodes_df.columns:
+            return NodeIndex.empty()
+        ids = _column(nodes_df, '_id')
+        geoms = _geometry_array(nodes_df)
+        keep = (shapely.get_type_id(geoms) == _POINT) & ~pd.isna(ids)
+        ids = ids[keep]
+        points = geoms[keep]
+        return NodeIndex(ids, shapely.get_x(points), shapely.get_y(points), keep='last')
+
+    def _node_tables(self, nodes_df: _Frame) -> StoredNodes:
+        """The node index and the table of every node ``_id`` (nodes_df must have an _id column)."""
+        ids = non_null(_column(nodes_df, '_id'))
+        missing = np.full(len(ids), np.nan)
+        return StoredNodes(self._build_node_coord_map(nodes_df), NodeIndex(ids, missing, missing))
+
+    def _stored_nodes(self, node_store: NodeStore, nodes_path: Optional[str], nodes_df: Optional[_Frame],
+                      nodes_baseline: Optional[str], zip_handler: ZipFileHandler,
+                      fingerprints: Dict[str, Tuple[int, int]]) -> Tuple[Optional[str], Optional[StoredNodes]]:
+        """Key and node tables of this run's nodes file (stored on a miss), else of ``nodes_baseline``."""
+        if nodes_df is not None:
+            if nodes_path is None or '_id' not in nodes_df.columns:
+                return None, None
+            key = cache_key('nodes', self._content_fingerprint(nodes_path, zip_handler, fingerprints), __version__)
+            # The key is a CRC32; only use an entry built from this very content
+            digest = file_digest(nodes_path)
+            nodes = node_store.get(key, digest)
+            if nodes is None:
+                nodes = self._node_tables(nodes_df)
+                if not node_store.put(key, nodes, digest):
+                    key = None
+            return key, nodes
+        if nodes_baseline is None:
+            return None, None
+        nodes = node_store.get(nodes_baseline)
+        if nodes is None:
+            self.log_errors(f"Nodes baseline '{nodes_baseline}' is not in the node store.", None, None)
+        return None, nodes
 
     def _validate_edge_geometry_mapping(
         self,
-        edges_df: Optional[gpd.GeoDataFrame],
-        node_coord_map: Dict[Any, tuple],
+        edges_df: Optional[_Frame],
+        node_coord_map: NodeIndex,
         max_errors: int,
     ) -> None:
-        """Verify edge start/end coordinates match their _u_id/_v_id node geometries."""
+        """Verify edge start/end coordinates match their _u_id/_v_id node geometries.
+
+        Endpoints, node lookups and tolerance comparisons are computed for all
+        edges at once; Python only runs for the mismatching rows.
+        """
         if edges_df is None or not node_coord_map:
             return
 
@@ -149,69 +390,69 @@ class OSWValidation:
         has_v_id = '_v_id' in edges_df.columns
         if not (has_u_id or has_v_id):
             return
+        self._check_cancelled()
+
+        geoms = _geometry_array(edges_df)
+        lines = (shapely.get_type_id(geoms) == _LINESTRING) & (shapely.get_num_coordinates(geoms) > 0)
+        start_x, start_y, end_x, end_y = _line_endpoints(geoms, lines)
+
+        checks = []
+        if has_u_id:
+            checks.append(('_u_id', 'start', start_x, start_y,
+                           *self._endpoint_mismatches(_column(edges_df, '_u_id'), lines, start_x, start_y, node_coord_map)))
+        if has_v_id:
+            checks.append(('_v_id', 'end', end_x, end_y,
+                           *self._endpoint_mismatches(_column(edges_df, '_v_id'), lines, end_x, end_y, node_coord_map)))
+
+        rows = np.flatnonzero(np.logical_or.reduce([mismatch for *_, mismatch, _pos in checks]))
+        if len(rows) == 0:
+            return
+        edge_ids = _column(edges_df, '_id') if '_id' in edges_df.columns else None
+        ref_values = {field: _column(edges_df, field) for field, *_ in checks}
 
-        for feat_idx, row in edges_df.iterrows():
-            if len(self.errors) >= max_errors:
-                break
-
-            geom = row.geometry
-            if geom is None or geom.geom_type != 'LineString':
-                continue
-
-            coords = list(geom.coords)
-            if not coords:
-                continue
-
-            try:
-                edge_id = row['_id']
-            except KeyError:
-                edge_id = feat_idx
-
-            if has_u_id:
-                try:
-                    u_id = row['_u_id']
-                except KeyError:
-                    u_id = None
-                if u_id is not None and u_id in node_coord_map:
-                    node_coord = node_coord_map[u_id]
-                    edge_start = (coords[0][0], coords[0][1])
-                    if not self._coords_match(edge_start, node_coord):
-                        self.log_errors(
-                            message=(
-                                f"edges id '{edge_id}' : "
-                                f"start coordinate {edge_start} does not match "
-                                f"node id '{u_id}' coordinate {node_coord} (_u_id mismatch)."
-                            ),
-                            filename='edges',
-                            feature_index=feat_idx,
-                        )
-
-            if len(self.errors) >= max_errors:
-                break
+        for row in rows:
+            feat_idx = _scalar(edges_df.index[row])
+            edge_id = edge_ids[row] if edge_ids is not None else feat_idx
+            for field, label, xs, ys, mismatch, positions in checks:
+                if len(self.errors) >= max_errors:
+                    return
+                self._check_cancelled()
+                if not mismatch[row]:
+                    continue
+                endpoint = (float(xs[row]), float(ys[row]))
+                self.log_errors(
+                    message=(
+                        f"edges id '{edge_id}' : "
+                        f"{label} coordinate {endpoint} does not match "
+                        f"node id '{ref_values[field][row]}' coordinate {node_coord_map.coord(positions[row])} "
+                        f"({field} mismatch)."
+                    ),
+                    filename='edges',
+                    feature_index=feat_idx,
+                )
 
-            if has_v_id:
-                try:
-                    v_id = row['_v_id']
-                except KeyError:
-                    v_id = None
-                if v_id is not None and v_id in node_coord_map:
-                    node_coord = node_coord_map[v_id]
-                    edge_end = (coords[-1][0], coords[-1][1])
-                    if not self._coords_match(edge_end, node_coord):
-                        self.log_errors(
-                            message=(
-                                f"edges id '{edge_id}' : "
-                                f"end coordinate {edge_end} does not match "
-                                f"node id '{v_id}' coordinate {node_coord} (_v_id mismatch)."
-                            ),
-                            filename='edges',
-                            feature_index=feat_idx,
-                        )
+    def _log_validity_reasons(self, osw_file: str, gdf: _Frame, rows: np.ndarray, reasons: List[str],
+                              max_errors: int) -> None:
+        """Defer one issue per invalid geometry (up to ``max_errors``) with its reason."""
+        ids = _column(gdf, '_id') if '_id' in gdf.columns else None
+        for row, reason in zip(rows[:max_errors], reasons):
+            feat_idx = _scalar(gdf.index[row])
+            feature_id = ids[row] if ids is not None else feat_idx
+            self._details.append(Issue(osw_file, feat_idx, f"{osw_file} id '{feature_id}' : invalid geometry ({reason})."))
+
+    def _endpoint_mismatches(self, refs: np.ndarray, lines: np.ndarray, xs: np.ndarray, ys: np.ndarray,
+                             node_coord_map: NodeIndex) -> Tuple[np.ndarray, np.ndarray]:
+        """Return (mismatch mask, node positions) for one endpoint reference column."""
+        positions = node_coord_map.positions(refs)
+        found = lines & (positions >= 0)
+        node_x, node_y = node_coord_map.xy(positions)
+        close = coords_within_tolerance(xs, ys, node_x, node_y, self._COORD_TOLERANCE)
+        return found & ~close, positions
 
     def _validate_zone_geometry_mapping(
         self,
-        zones_df: Optional[gpd.GeoDataFrame],
-        node_coord_map: Dict[Any, tuple],
+        zones_df: Optional[_Frame],
+        node_coord_map: NodeIndex,
         max_errors: int,
     ) -> None:
         """Verify each _w_id node coordinate is a vertex of the zone's polygon exterior ring."""
@@ -220,48 +461,59 @@ class OSWValidation:
 
         if '_w_id' not in zones_df.columns:
             return
+        self._check_cancelled()
 
-        for feat_idx, row in zones_df.iterrows():
-            if len(self.errors) >= max_errors:
-                break
-
-            geom = row.geometry
-            if geom is None or geom.geom_type != 'Polygon':
-                continue
-
-            try:
-                zone_id = row['_id']
-            except KeyError:
-                zone_id = feat_idx
-
-            ring_coords = {(c[0], c[1]) for c in geom.exterior.coords}
-
-            try:
-                w_ids = row['_w_id']
-            except KeyError:
-                continue
+        geoms = _geometry_array(zones_df)
+        polygons = np.flatnonzero(shapely.get_type_id(geoms) == _POLYGON)
+        if len(polygons) == 0:
+            return
 
+        # Flatten (zone row, _w_id) references for polygon rows.
+        w_column = _column(zones_df, '_w_id')
+        ref_rows: List[int] = []
+        ref_values: List[Any] = []
+        for row in polygons:
+            w_ids = w_column[row]
             if w_ids is None:
                 continue
             if not isinstance(w_ids, (list, tuple)):
                 w_ids = [w_ids]
-
-            for w_id in w_ids:
-                if len(self.errors) >= max_errors:
-                    break
-                if w_id is None or w_id not in node_coord_map:
-                    continue
-                node_coord = node_coord_map[w_id]
-                if not any(self._coords_match(node_coord, rc) for rc in ring_coords):
-                    self.log_errors(
-                        message=(
-                            f"zones id '{zone_id}' : "
-                            f"node id '{w_id}' coordinate {node_coord} is not a vertex "
-                            f"of the zone polygon geometry (_w_id coordinate mismatch)."
-                        ),
-                        filename='zones',
-                        feature_index=feat_idx,
-                    )
+            ref_rows.extend([row] * len(w_ids))
+            ref_values.extend(w_ids)
+        if not ref_rows:
+            return
+        ref_rows_arr = np.asarray(ref_rows, dtype=np.int64)
+        ref_values_arr = np.empty(len(ref_values), dtype=object)
+        ref_values_arr[:] = ref_values
+        positions = node_coord_map.positions(ref_values_arr)
+        node_x, node_y = node_coord_map.xy(positions)
+
+        # Exterior ring vertices on a tolerance grid grouped per polygon row, so
+        # each _w_id lookup only inspects the neighbouring cells of its own ring.
+        ring_xy, ring_owner = shapely.get_coordinates(
+            shapely.get_exterior_ring(geoms[polygons]), return_index=True)
+        grid = ToleranceGrid(ring_xy[:, 0], ring_xy[:, 1], self._COORD_TOLERANCE, groups=polygons[ring_owner])
+        known = positions >= 0
+        is_vertex = np.zeros(len(ref_rows_arr), dtype=bool)
+        is_vertex[known] = grid.contains(node_x[known], node_y[known], groups=ref_rows_arr[known])
+
+        zone_ids = _column(zones_df, '_id') if '_id' in zones_df.columns else None
+        for ref in np.flatnonzero((positions >= 0) & ~is_vertex):
+            if len(self.errors) >= max_errors:
+                return
+            self._check_cancelled()
+            row = ref_rows_arr[ref]
+            feat_idx = _scalar(zones_df.index[row])
+            zone_id = zone_ids[row] if zone_ids is not None else feat_idx
+            self.log_errors(
+                message=(
+                    f"zones id '{zone_id}' : "
+                    f"node id '{ref_values[ref]}' coordinate {node_coord_map.coord(positions[ref])} is not a vertex "
+                    f"of the zone polygon geometry (_w_id coordinate mismatch)."
+                ),
+                filename='zones',
+                feature_index=feat_idx,
+            )
 
     def _schema_key_from_text(self, text: Optional[str]) -> Optional[str]:
         """Return dataset key from exact filename suffixes only."""
@@ -309,6 +561,30 @@ class OSWValidation:
                 paths.extend(self._collect_nullish_property_paths(value, key))
         return paths
 
+    def _nullish_message(self, path: str, bad_value: Any) -> str:
+        rendered = f'"{bad_value}"' if isinstance(bad_value, str) else str(bad_value)
+        return (
+            f"Invalid value at '{path}': {rendered}. "
+            f"Null/NaN placeholders are not allowed; provide a valid value or remove this property."
+        )
+
+    def _disallowed_02_message(self, file_path: str, reasons: set) -> str:
+        dataset_key = self._schema_key_from_text(file_path) or "data"
+        custom_label_map = {
+            "edges": "Custom Edge",
+            "lines": "Custom Line",
+            "polygons": "Custom Polygon",
+            "zones": "Custom Polygon/Zone",
+            "points": "Custom Point",
+            "nodes": "Custom Node",
+        }
+        parts = []
+        if "tree" in reasons:
+            parts.append("Tree coverage")
+        if "custom_ext" in reasons or "custom_token" in reasons:
+            parts.append(custom_label_map.get(dataset_key, "Custom content"))
+        return f"0.2 schema does not support " + " and ".join(parts)
+
     def _contains_disallowed_features_for_02(self, geojson_data: Dict[str, Any]) -> set:
         """Detect Tree coverage or Custom content in legacy 0.2 datasets.
 
@@ -358,7 +634,7 @@ class OSWValidation:
 
     def are_ids_unique(self, gdf):
         """Check for duplicate values in the _id field"""
-        duplicates = gdf[gdf.duplicated('_id', keep=False)]['_id'].unique()
+        duplicates = duplicated_ids(_column(gdf, '_id'))
         is_valid = len(duplicates) == 0
         return is_valid, list(duplicates)
 
@@ -373,23 +649,278 @@ class OSWValidation:
 
         return self.line_schema_path
 
+    def _schema_digest(self, schema_path: str) -> str:
+        if schema_path not in self._schema_digests:
+            self._schema_digests[schema_path] = file_digest(schema_path)
+        return self._schema_digests[schema_path]
+
+    @staticmethod
+    def _content_fingerprint(file_path: str, zip_handler: ZipFileHandler,
+                             fingerprints: Dict[str, Tuple[int, int]]) -> str:
+        member = zip_handler.member_name(file_path)
+        if member in fingerprints:
+            crc, size = fingerprints[member]
+            return f"crc32:{crc:08x}:{size}"
+        return f"sha256:{file_digest(file_path)}"
+
+    def _cache_key_for_file(self, file_path: str, max_errors: int, zip_handler: ZipFileHandler,
+                            fingerprints: Dict[str, Tuple[int, int]]) -> str:
+        member = zip_handler.member_name(file_path)
+        content = self._content_fingerprint(file_path, zip_handler, fingerprints)
+        schema_digest = self._schema_digest(self.pick_schema_for_file(file_path, {}))
+        return cache_key(content, member, schema_digest, __version__, max_errors, self._schema_memo)
+
+    def _cache_key_for_archive(self, fingerprints: Dict[str, Tuple[int, int]], max_errors: int,
+                               validity_reasons: bool) -> Optional[str]:
+        if not fingerprints:
+            return None
+        schema_paths = {self.schema_file_path, self.point_schema_path, self.line_schema_path,
+                        self.polygon_schema_path, *self.dataset_schema_paths.values()}
+        schema_digests = sorted(self._schema_digest(path) for path in schema_paths if path)
+        return cache_key('archive', os.path.basename(self.zipfile_path), sorted(fingerprints.items()),
+                         schema_digests, __version__, max_errors, validity_reasons, self._schema_memo)
+
+    # ----------------------------
+    # Integrity checks (one per stage)
+    # ----------------------------
+    def _check_unique_ids(self, dataset: Dict[str, Optional[_Frame]], max_errors: int,
+                          counters: StageCounters) -> None:
+        """Are all id's unique in each file?"""
+        for osw_file, gdf in dataset.items():
+            if gdf is None:
+                continue
+            counters.features += len(gdf)
+            is_valid, duplicates = self.are_ids_unique(gdf)
+            if not is_valid:
+                total_duplicates = len(duplicates)
+                displayed = ', '.join(map(str, duplicates[:max_errors]))
+                if total_duplicates > max_errors:
+                    message = (f"Duplicate _id's found in {osw_file}: showing first {max_errors} "
+                               f"of {total_duplicates} duplicates: {displayed}")
+                else:
+                    message = f"Duplicate _id's found in {osw_file}: {displayed}"
+                self.log_errors(
+                    message=message,
+                    filename=osw_file,
+                    feature_index=None
+                )
+
+    def _check_references(self, nodes_df: Optional[_Frame], edges_df: Optional[_Frame],
+                          zones_df: Optional[_Frame], max_errors: int,
+                          node_codes: Optional[Union[IdCodes, IndexCodes]] = None) -> None:
+        """``_u_id``/``_v_id``/``_w_id`` must be ``_id``s of nodes (of ``node_codes``, when given)."""
+        if node_codes is None:
+            node_codes = IdCodes(self._get_colvalues(nodes_df, '_id', 'nodes')[0])
+        references = [
+            ('_u_id', 'edges', edges_df, *self._get_colvalues(edges_df, '_u_id', 'edges')),
+            ('_v_id', 'edges', edges_df, *self._get_colvalues(edges_df, '_v_id', 'edges')),
+            # zones: _w_id is list-like per feature → flatten
+            ('_w_id', 'zones', zones_df, *self._get_colvalues(zones_df, '_w_id', 'zones', explode=True)),
+        ]
+
+        # Cross-file integrity checks (only when we have the prerequisite ids);
+        # all reference columns are encoded against the node ids in one pass
+        # and a reference is unmatched where its code is -1.
+        references = [ref for ref in references if len(node_codes) and len(ref[3])]
+        codes = node_codes.encode(*(refs for _, _, _, refs, _ in references))
+        for (field, filekey, gdf, refs, rows), ref_codes in zip(references, codes):
+            unmatched = ref_codes < 0
+            if not unmatched.any():
+                continue
+            unmatched_list = unique_in_order(refs[unmatched])
+            num_unmatched = len(unmatched_list)
+            limit = min(num_unmatched, max_errors)
+            displayed_unmatched = ', '.join(map(str, unmatched_list[:limit]))
+            self.log_errors(
+                message=(f"All {field}'s in {filekey} should be part of _id's mentioned in nodes. "
+                         f"Showing {max_errors if num_unmatched > max_errors else 'all'} out of {num_unmatched} "
+                         f"unmatched {field}'s: {displayed_unmatched}"),
+                filename='All',
+                feature_index=None
+            )
+            self._log_unmatched_references(filekey, gdf, field, refs[unmatched], rows[unmatched], max_errors)
+
+    def _check_geometry_mapping(self, nodes_df: Optional[_Frame], edges_df: Optional[_Frame],
+                                zones_df: Optional[_Frame], node_map_future: Optional[Future], max_errors: int,
+                                node_coord_map: Optional[NodeIndex] = None) -> None:
+        """Edge endpoints and zone vertices must match the referenced node coordinates."""
+        if node_coord_map is None:
+            if node_map_future is not None:
+                node_coord_map = node_map_future.result()
+            else:
+                node_coord_map = self._build_node_coord_map(nodes_df)
+        if node_coord_map:
+            self._validate_edge_geometry_mapping(edges_df, node_coord_map, max_errors)
+            self._validate_zone_geometry_mapping(zones_df, node_coord_map, max_errors)
+
+    def _check_geometry_validity(self, dataset: Dict[str, Optional[_Frame]], max_errors: int,
+                                 counters: StageCounters, threads: Optional[int], reasons: bool) -> None:
+        """Check geometry type and SFA validity of every dataset file."""
+        for osw_file, gdf in dataset.items():
+            if gdf is None:
+                continue
+            counters.features += len(gdf)
+            expected_geom = OSW_DATASET_FILES.get(osw_file, {}).get('geometry')
+            report = evaluate_validity(_geometry_array(gdf), expected_geom, threads=threads, reasons=reasons)
+            invalid_rows = report.invalid
+
+            if len(invalid_rows) > 0:
+                # Extract IDs if present, else fallback to index
+                ids_series = _column(gdf, '_id')[invalid_rows] if '_id' in gdf.columns else gdf.index[invalid_rows]
+                invalid_ids = list(set(_scalar(i) for i in ids_series))
+                num_invalid = len(invalid_ids)
+                limit = min(num_invalid, max_errors)
+                displayed_invalid = ', '.join(map(str, invalid_ids[:limit]))
+                self.log_errors(
+                    message=(f"Showing {max_errors if num_invalid > max_errors else 'all'} out of {num_invalid} "
+                             f"invalid {osw_file} geometries, id's of invalid geometries: {displayed_invalid}"),
+                    filename='All',
+                    feature_index=None
+                )
+                if report.reasons is not None:
+                    self._log_validity_reasons(osw_file, gdf, invalid_rows, report.reasons, max_errors)
+
     # ----------------------------
     # Core validation entrypoint
     # ----------------------------
-    def validate(self, max_errors=20) -> ValidationResult:
-        def _finalize(is_valid: bool, errors: Optional[List[str]] = None) -> ValidationResult:
+    def validate(self, max_errors=20, progress: Optional[ProgressCallback] = None,
+                 cancel_token: Optional[CancellationToken] = None,
+                 pipelined: bool = False, pipeline_depth: int = 2, lean: bool = False,
+                 validity_threads: Optional[int] = None, validity_reasons: bool = False,
+                 memory_budget: Optional[int] = None, collect_garbage: bool = False,
+                 cache: Optional[ResultCache] = None, schema_memo: bool = False,
+                 node_store: Optional[NodeStore] = None, nodes_baseline: Optional[str] = None,
+                 timings: bool = False) -> ValidationResult:
+        """Validate the ZIP archive.
+
+        ``progress`` receives a ``ProgressEvent`` on every stage transition.
+        ``cancel_token`` is polled between stages and inside per-feature
+        loops; once cancelled, validation stops and returns an invalid
+        result with a 'Validation cancelled.' error.
+
+        With ``pipelined=True`` each dataset file is parsed once, on a
+        background thread, while the previous file is schema-validated and
+        loaded; at most ``pipeline_depth`` parsed files wait in between.
+        The node coordinate index is built as soon as nodes are loaded.
+
+        With ``lean=True`` the integrity checks run on ``FeatureTable``s read
+        straight from the parsed JSON (only ``_id``/``_u_id``/``_v_id``/``_w_id``
+        and bulk-built geometries) instead of GeoDataFrames.
+
+        Geometry validity of dataset files is evaluated in chunks on
+        ``validity_threads`` threads (default: CPU count, at most 8). With
+        ``validity_reasons=True`` every invalid geometry also gets its own
+        issue with the ``shapely.is_valid_reason`` explanation; these come
+        after all summary errors, in the slots left under ``max_errors``.
+
+        ``memory_budget`` (bytes) bounds the estimated footprint of the run
+        (see ``memory``): files are parsed one at a time and released before
+        the next, integrity checks use lean tables, and a stage that would not
+        fit stops validation with a "Memory budget exceeded" error. It
+        implies ``lean=True`` and turns ``pipelined`` off.
+
+        Large objects live only as long as the stage that needs them: parsed
+        documents until their file is loaded, check temporaries until the
+        check's stage ends, and dataset tables until extensions are validated.
+        ``collect_garbage=True`` additionally forces ``gc.collect()`` once at
+        the end of the run.
+
+        With a ``cache`` (see ``cache.ResultCache``), dataset files whose
+        content, schema, library version and ``max_errors`` match an earlier
+        run replay that run's schema-stage errors and issues and reuse its
+        integrity table instead of being parsed and schema-validated again.
+        Files are fingerprinted by the CRC32 and size in the ZIP central
+        directory; with ``ResultCache(archive_memo=True)`` a repeated upload
+        of the same archive returns the memoised result before extraction
+        (not with a ``node_store``, whose entries the result depends on).
+        A cache implies ``lean=True`` and turns ``pipelined`` off; the run's
+        hits and misses are reported in ``ValidationResult.cache_stats``.
+
+        With ``schema_memo=True`` each distinct ``properties`` payload (ids
+        aside) is schema-validated once per file and its errors are reused
+        for identical payloads (see ``schema_memo``).
+
+        With a ``node_store`` (see ``node_store.NodeStore``) the node id table
+        and coordinate index of the reference and geometry mapping checks are
+        memory-mapped from the store when the nodes file's content was seen
+        before, and stored otherwise; ``ValidationResult.nodes_key`` names the
+        entry. ``nodes_baseline`` is such a key: an archive without a nodes
+        file then has its edges and zones checked against those nodes.
+
+        With ``timings=True`` every stage run (per file for schema, load and
+        extensions) is timed, and ``ValidationResult.timings`` lists one
+        ``StageTiming`` per run with its wall and CPU seconds and its
+        feature and byte counts. Stages that did not finish are not listed.
+
+        The run, each stage and the archive, discovery and schema steps are
+        traced through the installed tracer (see ``tracing``; a no-op
+        unless ``set_tracer`` installed one).
+        """
+        if nodes_baseline is not None and node_store is None:
+            raise ValueError('nodes_baseline requires a node_store')
+
+        def _finalize(is_valid: bool, errors: Optional[List[str]] = None,
+                      remember: bool = True) -> ValidationResult:
+            self._add_details(max_errors)
+            if archive_key is not None and remember:
+                cache.put(archive_key, CachedArchive(is_valid, list(self.errors if errors is None else errors),
+                                                     self.issues.to_list()), self.zipfile_path)
             final_errors = self.errors if errors is None else errors
             final_errors = (final_errors or [])[:max_errors]
             final_issues = (self.issues or [])[:max_errors]
-            return ValidationResult(is_valid, final_errors, final_issues)
-
+            span.set_attribute(ATTR_VALID, is_valid)
+            span.set_attribute(ATTR_ERRORS, len(final_errors))
+            span.set_attribute(ATTR_ISSUES, len(final_issues))
+            cache_stats = None
+            if cache is not None:
+                cache_stats = CacheStats(cache.stats.hits - stats_before.hits,
+                                         cache.stats.misses - stats_before.misses)
+            return ValidationResult(is_valid, final_errors, final_issues, cache_stats, nodes_key, self._timings)
+
+        self._progress = progress
+        self._cancel_token = cancel_token
+        self._schema_memo = schema_memo
+        self._timings = [] if timings else None
+        self._details = []
         zip_handler = None
-        OSW_DATASET: Dict[str, Optional[gpd.GeoDataFrame]] = {}
+        OSW_DATASET: Dict[str, Optional[_Frame]] = {}
         validator = None
+        background: Optional[ThreadPoolExecutor] = None
+        budget = MemoryBudget(memory_budget)
+        if memory_budget is not None:
+            lean, pipelined = True, False
+        resident_bytes = 0
+        if cache is not None:
+            lean, pipelined = True, False
+            stats_before = cache.stats
+        # Per dataset file: its cache key, and the entry found for it (if any)
+        cache_keys: Dict[str, str] = {}
+        cache_hits: Dict[str, CachedFile] = {}
+        fingerprints: Dict[str, Tuple[int, int]] = {}
+        archive_key: Optional[str] = None
+        memo: Optional[CachedArchive] = None
+        nodes_key: Optional[str] = None
+        span = get_tracer().start_span(SPAN_VALIDATE, {ATTR_FILENAME: os.path.basename(str(self.zipfile_path))})
+        span.__enter__()
         try:
             # Extract the zipfile
-            zip_handler = ZipFileHandler(self.zipfile_path)
-            self.extracted_dir = zip_handler.extract_zip()
+            with self._stage(STAGE_EXTRACT) as counters:
+                zip_handler = ZipFileHandler(self.zipfile_path)
+                if cache is not None or node_store is not None:
+                    fingerprints = zip_handler.member_fingerprints()
+                if cache is not None:
+                    # With a node store the result also depends on the store's entries
+                    if cache.archive_memo and node_store is None:
+                        archive_key = self._cache_key_for_archive(fingerprints, max_errors, validity_reasons)
+                        memo = cache.get(archive_key, self.zipfile_path) if archive_key else None
+                if memo is None:
+                    self.extracted_dir = zip_handler.extract_zip()
+                counters.bytes = _file_size(self.zipfile_path)
+
+            if memo is not None:
+                self.errors.extend(memo.errors)
+                self.issues.extend(memo.issues)
+                return _finalize(memo.is_valid, remember=False)
 
             if not self.extracted_dir:
                 self.log_errors(
@@ -397,11 +928,15 @@ class OSWValidation:
                     filename=self.zipfile_path,
                     feature_index=None
                 )
-                return _finalize(False)
+                return _finalize(False, remember=False)
 
             # Validate the folder structure
-            validator = ExtractedDataValidator(self.extracted_dir)
-            if not validator.is_valid():
+            with self._stage(STAGE_DISCOVER) as counters:
+                validator = ExtractedDataValidator(self.extracted_dir)
+                structure_ok = validator.is_valid()
+                if structure_ok:
+                    counters.features = len(validator.files) + len(validator.externalExtensions)
+            if not structure_ok:
                 upload_name = os.path.basename(self.zipfile_path) if self.zipfile_path else self.extracted_dir
                 self.log_errors(
                     message=validator.error,
@@ -410,200 +945,131 @@ class OSWValidation:
                 )
                 return _finalize(False)
 
-            # Per-file schema validation → populate self.issues (fixme-like)
-            for file in validator.files:
-                file_path = os.path.join(file)
-                if not self.validate_osw_errors(file_path=str(file_path), max_errors=max_errors):
-                    # mirror legacy behavior: stop early when we hit the cap
-                    break
-
-            if self.errors:
-                return _finalize(False)
-
-            # Load GeoDataFrames for integrity checks
-            for file in validator.files:
-                file_path = os.path.join(file)
-                osw_file = next((osw_key for osw_key in OSW_DATASET_FILES.keys()
-                                 if osw_key in os.path.basename(file_path)), '')
-                try:
-                    gdf = _read_geojson_without_ext(file_path)
-                except Exception as e:
-                    self.log_errors(
-                        message=f"Failed to read '{os.path.basename(file_path)}' as GeoJSON: {e}",
-                        filename=os.path.basename(file_path),
-                        feature_index=None
-                    )
-                    gdf = None
-                if osw_file:
-                    OSW_DATASET[osw_file] = gdf
+            node_map_future: Optional[Future] = None
+            if pipelined:
+                background = ThreadPoolExecutor(max_workers=1, thread_name_prefix='osw-integrity')
+                node_map_future = self._schema_and_load_pipelined(
+                    validator.files, max_errors, OSW_DATASET, pipeline_depth, background, lean)
+                if self.errors:
+                    return _finalize(False)
+            else:
+                # Per-file schema validation → populate self.issues (fixme-like)
+                for file in validator.files:
+                    file_path = os.path.join(file)
+                    basename = os.path.basename(file_path)
+                    with self._stage(STAGE_SCHEMA, basename) as counters:
+                        size = _file_size(file_path)
+                        # A file's outcome only stands on its own while no earlier file has failed
+                        entry = None
+                        if cache is not None and not self.errors:
+                            cache_keys[file_path] = self._cache_key_for_file(
+                                file_path, max_errors, zip_handler, fingerprints)
+                            entry = cache.get(cache_keys[file_path], file_path)
+                        if entry is not None:
+                            cache_hits[file_path] = entry
+                            self.errors.extend(entry.errors)
+                            self.issues.extend(entry.issues)
+                            within_cap = entry.within_cap
+                        else:
+                            errors_before, issues_before = len(self.errors), len(self.issues)
+                            with budget.hold(STAGE_SCHEMA, basename, estimate_document_bytes(size)):
+                                within_cap = self.validate_osw_errors(file_path=str(file_path), max_errors=max_errors)
+                            if file_path in cache_keys and (self.errors or not within_cap):
+                                # The run stops before loading, so the entry carries no table
+                                cache.put(cache_keys.pop(file_path), CachedFile(
+                                    self.errors[errors_before:], self.issues[issues_before:].to_list(),
+                                    within_cap, None), file_path)
+                        counters.bytes = size
+                    if not within_cap:
+                        # mirror legacy behavior: stop early when we hit the cap
+                        break
+
+                if self.errors:
+                    return _finalize(False)
+
+                # Load GeoDataFrames for integrity checks
+                for file in validator.files:
+                    file_path = os.path.join(file)
+                    osw_file = _dataset_key_for_path(file_path)
+                    basename = os.path.basename(file_path)
+                    with self._stage(STAGE_LOAD, basename) as counters:
+                        size = _file_size(file_path)
+                        resident_bytes += budget.reserve(STAGE_LOAD, basename, estimate_table_bytes(size))
+                        entry = cache_hits.pop(file_path, None)
+                        if entry is not None and entry.table is not None:
+                            gdf = entry.table
+                            counters.features = len(gdf)
+                        else:
+                            with budget.hold(STAGE_LOAD, basename, estimate_document_bytes(size)):
+                                try:
+                                    if lean:
+                                        gdf = FeatureTable.from_geojson(_load_json(file_path))
+                                    else:
+                                        gdf = _read_geojson_without_ext(file_path, columns=INTEGRITY_COLUMNS)
+                                    counters.features = len(gdf)
+                                except Exception as e:
+                                    self.log_errors(
+                                        message=f"Failed to read '{basename}' as GeoJSON: {e}",
+                                        filename=basename,
+                                        feature_index=None
+                                    )
+                                    gdf = None
+                            if file_path in cache_keys and gdf is not None:
+                                cache.put(cache_keys[file_path], CachedFile([], [], True, gdf), file_path)
+                        counters.bytes = size
+                    if osw_file:
+                        OSW_DATASET[osw_file] = gdf
+
+            # Id codes, reference arrays and the node index of the checks below
+            checks_bytes = budget.reserve(STAGE_IDS, None, CHECKS_FACTOR * resident_bytes)
+
+            # Each check runs in its own method so its temporaries (id codes,
+            # reference arrays, the node index) are released when its stage ends.
+            with self._stage(STAGE_IDS) as counters:
+                self._check_unique_ids(OSW_DATASET, max_errors, counters)
 
-            # Are all id's unique in each file?
-            for osw_file, gdf in OSW_DATASET.items():
-                if gdf is None:
-                    continue
-                is_valid, duplicates = self.are_ids_unique(gdf)
-                if not is_valid:
-                    total_duplicates = len(duplicates)
-                    displayed = ', '.join(map(str, duplicates[:max_errors]))
-                    if total_duplicates > max_errors:
-                        message = (f"Duplicate _id's found in {osw_file}: showing first {max_errors} "
-                                   f"of {total_duplicates} duplicates: {displayed}")
-                    else:
-                        message = f"Duplicate _id's found in {osw_file}: {displayed}"
-                    self.log_errors(
-                        message=message,
-                        filename=osw_file,
-                        feature_index=None
-                    )
-
-            # Create sets of node id's and foreign keys to be used in validation
             nodes_df = OSW_DATASET.get('nodes')
             edges_df = OSW_DATASET.get('edges')
             zones_df = OSW_DATASET.get('zones')
-
-            node_ids = self._get_colset(nodes_df, '_id', 'nodes') if nodes_df is not None else set()
-            node_ids_edges_u = self._get_colset(edges_df, '_u_id', 'edges') if edges_df is not None else set()
-            node_ids_edges_v = self._get_colset(edges_df, '_v_id', 'edges') if edges_df is not None else set()
-
-            # zones: _w_id is list-like per feature → flatten safely
-            if zones_df is not None:
-                if '_w_id' in zones_df.columns:
-                    vals = zones_df['_w_id'].dropna().tolist()
-                    node_ids_zones_w = set(
-                        item
-                        for sub in vals
-                        for item in (sub if isinstance(sub, (list, tuple)) else [sub])
-                    )
-                else:
-                    self.log_errors("Missing required column '_w_id' in zones.", 'zones', None)
-                    node_ids_zones_w = set()
-            else:
-                node_ids_zones_w = set()
-
-            # Cross-file integrity checks (only when we have the prerequisite sets)
-            if node_ids and node_ids_edges_u:
-                unmatched = node_ids_edges_u - node_ids
-                if unmatched:
-                    unmatched_list = list(unmatched)
-                    num_unmatched = len(unmatched_list)
-                    limit = min(num_unmatched, max_errors)
-                    displayed_unmatched = ', '.join(map(str, unmatched_list[:limit]))
-                    self.log_errors(
-                        message=(f"All _u_id's in edges should be part of _id's mentioned in nodes. "
-                                 f"Showing {max_errors if num_unmatched > max_errors else 'all'} out of {num_unmatched} "
-                                 f"unmatched _u_id's: {displayed_unmatched}"),
-                        filename='All',
-                        feature_index=None
-                    )
-
-            if node_ids and node_ids_edges_v:
-                unmatched = node_ids_edges_v - node_ids
-                if unmatched:
-                    unmatched_list = list(unmatched)
-                    num_unmatched = len(unmatched_list)
-                    limit = min(num_unmatched, max_errors)
-                    displayed_unmatched = ', '.join(map(str, unmatched_list[:limit]))
-                    self.log_errors(
-                        message=(f"All _v_id's in edges should be part of _id's mentioned in nodes. "
-                                 f"Showing {max_errors if num_unmatched > max_errors else 'all'} out of {num_unmatched} "
-                                 f"unmatched _v_id's: {displayed_unmatched}"),
-                        filename='All',
-                        feature_index=None
-                    )
-
-            if node_ids and node_ids_zones_w:
-                unmatched = node_ids_zones_w - node_ids
-                if unmatched:
-                    unmatched_list = list(unmatched)
-                    num_unmatched = len(unmatched_list)
-                    limit = min(num_unmatched, max_errors)
-                    displayed_unmatched = ', '.join(map(str, unmatched_list[:limit]))
-                    self.log_errors(
-                        message=(f"All _w_id's in zones should be part of _id's mentioned in nodes. "
-                                 f"Showing {max_errors if num_unmatched > max_errors else 'all'} out of {num_unmatched} "
-                                 f"unmatched _w_id's: {displayed_unmatched}"),
-                        filename='All',
-                        feature_index=None
-                    )
+            frames = [df for df in (nodes_df, edges_df, zones_df) if df is not None]
+
+            with self._stage(STAGE_REFERENCES) as counters:
+                counters.features = sum(len(df) for df in frames)
+                stored_nodes = None
+                if node_store is not None:
+                    nodes_path = next((f for f in validator.files if _dataset_key_for_path(f) == 'nodes'), None)
+                    nodes_key, stored_nodes = self._stored_nodes(node_store, nodes_path, nodes_df, nodes_baseline,
+                                                                 zip_handler, fingerprints)
+                self._check_references(nodes_df, edges_df, zones_df, max_errors,
+                                       stored_nodes.id_codes if stored_nodes is not None else None)
 
             # Geometry mapping: coordinate consistency using already-loaded GeoDataFrames
-            if nodes_df is not None and len(self.errors) < max_errors:
-                node_coord_map = self._build_node_coord_map(nodes_df)
-                if node_coord_map:
-                    self._validate_edge_geometry_mapping(edges_df, node_coord_map, max_errors)
-                    self._validate_zone_geometry_mapping(zones_df, node_coord_map, max_errors)
+            if (nodes_df is not None or stored_nodes is not None) and len(self.errors) < max_errors:
+                with self._stage(STAGE_GEOMETRY_MAPPING) as counters:
+                    counters.features = sum(len(df) for df in frames)
+                    self._check_geometry_mapping(nodes_df, edges_df, zones_df, node_map_future, max_errors,
+                                                 stored_nodes.coords if stored_nodes is not None else None)
+            node_map_future = stored_nodes = None
 
             # Geometry validation: check geometry type and SFA validity
-            for osw_file, gdf in OSW_DATASET.items():
-                if gdf is None:
-                    continue
-                expected_geom = OSW_DATASET_FILES.get(osw_file, {}).get('geometry')
-                if expected_geom:
-                    invalid_geojson = gdf[
-                        (gdf.geometry.type != expected_geom) | (gdf.is_valid == False)
-                        ]
-                else:
-                    invalid_geojson = gdf[gdf.is_valid == False]
-
-                if len(invalid_geojson) > 0:
-                    # Extract IDs if present, else fallback to index
-                    ids_series = invalid_geojson['_id'] if '_id' in invalid_geojson.columns else invalid_geojson.index
-                    invalid_ids = list(set(ids_series))
-                    num_invalid = len(invalid_ids)
-                    limit = min(num_invalid, max_errors)
-                    displayed_invalid = ', '.join(map(str, invalid_ids[:limit]))
-                    self.log_errors(
-                        message=(f"Showing {max_errors if num_invalid > max_errors else 'all'} out of {num_invalid} "
-                                 f"invalid {osw_file} geometries, id's of invalid geometries: {displayed_invalid}"),
-                        filename='All',
-                        feature_index=None
-                    )
+            with self._stage(STAGE_GEOMETRY_VALIDITY) as counters:
+                self._check_geometry_validity(OSW_DATASET, max_errors, counters, validity_threads, validity_reasons)
+
+            # The dataset tables are not needed past this point
+            OSW_DATASET.clear()
+            nodes_df = edges_df = zones_df = frames = None
+            budget.release(checks_bytes + resident_bytes)
 
             # Validate OSW external extensions
             for file in validator.externalExtensions:
                 file_path = os.path.join(file)
                 file_name = os.path.basename(file)
-                try:
-                    extensionFile = _read_geojson_without_ext(file_path)
-                except Exception as e:
-                    self.log_errors(
-                        message=f"Failed to read extension '{file_name}' as GeoJSON: {e}",
-                        filename=file_name,
-                        feature_index=None
-                    )
-                    continue
-
-                invalid_geojson = extensionFile[extensionFile.is_valid == False]
-                if len(invalid_geojson) > 0:
-                    try:
-                        invalid_ids = list(set(invalid_geojson.get('_id', invalid_geojson.index)))
-                        num_invalid = len(invalid_ids)
-                        limit = min(num_invalid, max_errors)
-                        displayed_invalid = ', '.join(map(str, invalid_ids[:limit]))
-                        self.log_errors(
-                            message=(f"Invalid geometries found in extension file `{file_name}`. "
-                                     f"Showing {max_errors if num_invalid > max_errors else 'all'} of {num_invalid} "
-                                     f"invalid geometry IDs: {displayed_invalid}"),
-                            filename=file_name,
-                            feature_index=None
-                        )
-                    except Exception as e:
-                        self.log_errors(
-                            message=f"Invalid features found in `{file_name}`, but failed to extract IDs: {e}",
-                            filename=file_name,
-                            feature_index=None
-                        )
-
-                # Optional: Test serializability of extension file
-                try:
-                    for _, row in extensionFile.drop(columns='geometry').iterrows():
-                        json.dumps(row.to_dict())
-                except Exception as e:
-                    self.log_errors(
-                        message=f"Extension file `{file_name}` has non-serializable properties: {e}",
-                        filename=file_name,
-                        feature_index=None
-                    )
+                with self._stage(STAGE_EXTENSIONS, file_name) as counters:
+                    counters.bytes = _file_size(file_path)
+                    needed = estimate_document_bytes(counters.bytes) + estimate_table_bytes(counters.bytes)
+                    with budget.hold(STAGE_EXTENSIONS, file_name, needed):
+                        keep_going = self._validate_extension_file(file_path, file_name, max_errors, counters)
+                if not keep_going:
                     break
 
             if self.errors:
@@ -611,42 +1077,181 @@ class OSWValidation:
             else:
                 return _finalize(True, [])
 
+        except ValidationCancelled as e:
+            self.log_errors(
+                message=str(e),
+                filename=None,
+                feature_index=None
+            )
+            return _finalize(False, remember=False)
+        except MemoryBudgetExceeded as e:
+            self.log_errors(
+                message=str(e),
+                filename=e.filename,
+                feature_index=None
+            )
+            return _finalize(False, remember=False)
         except Exception as e:
             self.log_errors(
                 message=f'Unable to validate: {e}',
                 filename=None,
                 feature_index=None
             )
-            return _finalize(False)
+            return _finalize(False, remember=False)
         finally:
-            # Cleanup extracted files
-            try:
-                del OSW_DATASET
-            except Exception:
-                pass
+            if background is not None:
+                background.shutdown(wait=True, cancel_futures=True)
+            self._progress = None
+            self._cancel_token = None
+            self._schema_memo = False
+            self._timings = None
+            # Errors are caught above and reported through the span's attributes
+            span.__exit__(None, None, None)
+
+            # Release the dataset tables and clean up extracted files
+            OSW_DATASET.clear()
             if zip_handler:
                 zip_handler.remove_extracted_files()
 
-            # Force garbage collection to free memory
-            gc.collect()
+            if collect_garbage:
+                gc.collect()
+
+    def _schema_and_load_pipelined(
+        self,
+        files: List[str],
+        max_errors: int,
+        dataset: Dict[str, Optional[_Frame]],
+        depth: int,
+        background: ThreadPoolExecutor,
+        lean: bool = False,
+    ) -> Optional[Future]:
+        """Schema-validate and load dataset files with parsing overlapped.
+
+        A prefetch thread parses file N+1 while file N is schema-validated
+        and turned into a GeoDataFrame (or, with ``lean``, a ``FeatureTable``)
+        from the same parsed document. Files keep their discovery order so
+        capped error lists match the sequential path. Once nodes are loaded, the node coordinate index is
+        built on ``background`` while the remaining files are processed.
+        Returns the future for that index (None without a nodes file).
+        """
+        node_map_future: Optional[Future] = None
+        with FilePrefetcher([os.path.join(f) for f in files], _load_json, depth) as prefetcher:
+            for item in prefetcher:
+                file_path = item.path
+                basename = os.path.basename(file_path)
+                with self._stage(STAGE_SCHEMA, basename) as counters:
+                    if item.error is not None:
+                        self._log_load_error(file_path, item.error)
+                        within_cap = False
+                    else:
+                        within_cap = self.validate_osw_errors(
+                            file_path=str(file_path), max_errors=max_errors, geojson_data=item.data)
+                    counters.bytes = _file_size(file_path)
+                if not within_cap:
+                    break
+                if self.errors:
+                    # Integrity checks are skipped once any schema error exists;
+                    # keep validating schemas but stop building frames.
+                    continue
+
+                osw_file = _dataset_key_for_path(file_path)
+                with self._stage(STAGE_LOAD, basename) as counters:
+                    try:
+                        if lean:
+                            gdf = FeatureTable.from_geojson(item.data)
+                        else:
+                            gdf = _geodataframe_without_ext(item.data, columns=INTEGRITY_COLUMNS)
+                        counters.features = len(gdf)
+                    except Exception as e:
+                        self.log_errors(
+                            message=f"Failed to read '{basename}' as GeoJSON: {e}",
+                            filename=basename,
+                            feature_index=None
+                        )
+                        gdf = None
+                    counters.bytes = _file_size(file_path)
+                del item
+                if osw_file:
+                    dataset[osw_file] = gdf
+                    if osw_file == 'nodes' and gdf is not None:
+                        node_map_future = background.submit(self._build_node_coord_map, gdf)
+        return node_map_future
+
+    def _validate_extension_file(self, file_path: str, file_name: str, max_errors: int,
+                                 counters: StageCounters) -> bool:
+        """Geometry validity and property serializability checks for one external extension.
+
+        Returns False when the remaining extension files should be skipped
+        (legacy behaviour after a serializability failure).
+        """
+        try:
+            extensionFile = _read_geojson_without_ext(file_path)
+        except Exception as e:
+            self.log_errors(
+                message=f"Failed to read extension '{file_name}' as GeoJSON: {e}",
+                filename=file_name,
+                feature_index=None
+            )
+            return True
+        counters.features = len(extensionFile)
+
+        invalid_geojson = extensionFile[extensionFile.is_valid == False]
+        if len(invalid_geojson) > 0:
+            try:
+                invalid_ids = list(set(invalid_geojson.get('_id', invalid_geojson.index)))
+                num_invalid = len(invalid_ids)
+                limit = min(num_invalid, max_errors)
+                displayed_invalid = ', '.join(map(str, invalid_ids[:limit]))
+                self.log_errors(
+                    message=(f"Invalid geometries found in extension file `{file_name}`. "
+                             f"Showing {max_errors if num_invalid > max_errors else 'all'} of {num_invalid} "
+                             f"invalid geometry IDs: {displayed_invalid}"),
+                    filename=file_name,
+                    feature_index=None
+                )
+            except Exception as e:
+                self.log_errors(
+                    message=f"Invalid features found in `{file_name}`, but failed to extract IDs: {e}",
+                    filename=file_name,
+                    feature_index=None
+                )
 
-            # Additional memory cleanup for geopandas dataframes
-            if validator:
-                try:
-                    for osw_file in getattr(validator, 'files', []):
-                        if osw_file in locals():
-                            del osw_file
-                except Exception:
-                    pass
-                del validator
-            gc.collect()
+        # Optional: Test serializability of extension file
+        try:
+            properties = extensionFile.drop(columns='geometry')
+            self._check_cancelled()
+            offending = _first_non_serializable(properties)
+        except ValidationCancelled:
+            raise
+        except Exception as e:
+            self.log_errors(
+                message=f"Extension file `{file_name}` has non-serializable properties: {e}",
+                filename=file_name,
+                feature_index=None
+            )
+            return False
+        if offending is not None:
+            row, column, e = offending
+            feat_idx = _scalar(properties.index[row])
+            self.log_errors(
+                message=(f"Extension file `{file_name}` has non-serializable properties: {e} "
+                         f"(feature index {feat_idx}, column '{column}')"),
+                filename=file_name,
+                feature_index=feat_idx
+            )
+            return False
+        return True
 
     def load_osw_file(self, graph_geojson_path: str) -> Dict[str, Any]:
         try:
-            with open(graph_geojson_path, 'r') as file:
-                return json.load(file)
-        except json.JSONDecodeError as e:
-            filename = os.path.basename(graph_geojson_path)
+            return _load_json(graph_geojson_path)
+        except (json.JSONDecodeError, OSError) as e:
+            self._log_load_error(graph_geojson_path, e)
+            raise
+
+    def _log_load_error(self, graph_geojson_path: str, e: BaseException) -> None:
+        filename = os.path.basename(graph_geojson_path)
+        if isinstance(e, json.JSONDecodeError):
             self.log_errors(
                 message=(
                     f"Failed to parse '{filename}' as valid JSON. "
@@ -655,38 +1260,61 @@ class OSWValidation:
                 filename=filename,
                 feature_index=None,
             )
-            raise
-        except OSError as e:
-            filename = os.path.basename(graph_geojson_path)
+        elif isinstance(e, OSError):
             self.log_errors(
                 message=f"Unable to read file '{filename}': {e.strerror or e}",
                 filename=filename,
                 feature_index=None,
             )
-            raise
+        else:
+            self.log_errors(
+                message=f"Unable to read file '{filename}': {e}",
+                filename=filename,
+                feature_index=None,
+            )
+
+    def validate_osw_errors(self, file_path: str, max_errors: int,
+                            geojson_data: Optional[Dict[str, Any]] = None) -> bool:
+        """Validate one OSW GeoJSON against the appropriate schema (streaming).
 
-    def validate_osw_errors(self, file_path: str, max_errors: int) -> bool:
+        Traced as one span (see ``tracing``); the rest is ``_validate_osw_errors``.
+        """
+        with get_tracer().start_span(SPAN_SCHEMA_FILE, {ATTR_FILENAME: os.path.basename(file_path)}) as span:
+            errors_before = len(self.errors)
+            within_cap = self._validate_osw_errors(file_path, max_errors, geojson_data, span)
+            span.set_attribute(ATTR_ERRORS, len(self.errors) - errors_before)
+            return within_cap
+
+    def _validate_osw_errors(self, file_path: str, max_errors: int,
+                             geojson_data: Optional[Dict[str, Any]], span: Span) -> bool:
         """Validate one OSW GeoJSON against the appropriate schema (streaming).
 
+        - ``geojson_data`` may carry the already parsed document; otherwise
+          the file is read from ``file_path``.
+
         - Keeps legacy `self.errors` capped by `max_errors` (original behavior).
         - While streaming, tracks the *best* error per feature (ranked) and,
           before returning, pushes a single human-friendly message per feature
           into `self.issues` (like your sample: "must include one of: ...").
         """
-        try:
-            geojson_data = self.load_osw_file(file_path)
-        except json.JSONDecodeError:
-            return False
-        except OSError:
-            return False
+        if geojson_data is None:
+            try:
+                geojson_data = self.load_osw_file(file_path)
+            except json.JSONDecodeError:
+                return False
+            except OSError:
+                return False
 
         filename = os.path.basename(file_path)
 
         # Upfront guard: reject null/NaN values in free-form extension properties.
         # Schema-owned properties are left to schema validation.
         features = geojson_data.get("features", []) if isinstance(geojson_data, dict) else []
+        if isinstance(features, list):
+            span.set_attribute(ATTR_FEATURES, len(features))
         found_nullish = False
         for idx, feature in enumerate(features):
+            self._check_cancelled()
             if not isinstance(feature, dict):
                 continue
             props = feature.get("properties")
@@ -697,17 +1325,9 @@ class OSWValidation:
                 if len(self.errors) >= max_errors:
                     return False
                 found_nullish = True
-                rendered = f'"{bad_value}"' if isinstance(bad_value, str) else str(bad_value)
-                msg = (
-                    f"Invalid value at '{path}': {rendered}. "
-                    f"Null/NaN placeholders are not allowed; provide a valid value or remove this property."
-                )
+                msg = self._nullish_message(path, bad_value)
                 self.errors.append(f"Validation error: {msg}")
-                self.issues.append({
-                    "filename": filename,
-                    "feature_index": idx,
-                    "error_message": [msg],
-                })
+                self.issues.append(Issue(filename, idx, msg))
         if found_nullish:
             return False
 
@@ -715,23 +1335,8 @@ class OSWValidation:
         if isinstance(schema_url, str) and '0.2/schema.json' in schema_url:
             reasons = self._contains_disallowed_features_for_02(geojson_data)
             if reasons:
-                dataset_key = self._schema_key_from_text(file_path) or "data"
-                custom_label_map = {
-                    "edges": "Custom Edge",
-                    "lines": "Custom Line",
-                    "polygons": "Custom Polygon",
-                    "zones": "Custom Polygon/Zone",
-                    "points": "Custom Point",
-                    "nodes": "Custom Node",
-                }
-                parts = []
-                if "tree" in reasons:
-                    parts.append("Tree coverage")
-                if "custom_ext" in reasons or "custom_token" in reasons:
-                    parts.append(custom_label_map.get(dataset_key, "Custom content"))
-                msg = f"0.2 schema does not support " + " and ".join(parts)
                 self.log_errors(
-                    message=msg,
+                    message=self._disallowed_02_message(file_path, reasons),
                     filename=os.path.basename(file_path),
                     feature_index=None,
                 )
@@ -739,14 +1344,22 @@ class OSWValidation:
 
         schema_path = self.pick_schema_for_file(file_path, geojson_data)
         schema = self.load_osw_schema(schema_path)
-        validator = jsonschema_rs.Draft7Validator(schema)
+        validator = None
+        if self._schema_memo:
+            try:
+                validator = MemoisedValidator(schema)
+            except ValueError:
+                pass
+        if validator is None:
+            validator = jsonschema_rs.Draft7Validator(schema)
 
         # Legacy cap
         legacy_count = 0
-        collected_issues: List[Dict[str, Any]] = []
+        collected_issues: List[Issue] = []
 
         # --- STREAM over errors; STOP as soon as legacy hits the cap ---
         for err in validator.iter_errors(geojson_data):
+            self._check_cancelled()
             # legacy list (for backward compatibility)
             if legacy_count < max_errors:
                 raw_msg = _add_additional_properties_hint(getattr(err, "message", "") or "")
@@ -758,26 +1371,114 @@ class OSWValidation:
 
             # Keep every issue (no per-feature collapsing)
             fidx = _feature_index_from_error(err)
-            collected_issues.append({
-                "filename": filename,
-                "feature_index": fidx if fidx is not None else -1,
-                "error_message": [_pretty_message(err, schema)],
-                "_kind": _err_kind(err),
-            })
+            collected_issues.append(Issue(
+                filename, fidx if fidx is not None else -1, _pretty_message(err, schema), kind=_err_kind(err),
+            ))
 
         # Drop noisy AnyOf summaries when specific field-level errors exist
         # for the same feature.
         has_specific_by_feature: Dict[int, bool] = {}
         for issue in collected_issues:
-            fidx = issue["feature_index"]
-            if issue.get("_kind") != "AnyOf":
-                has_specific_by_feature[fidx] = True
+            if issue.kind != "AnyOf":
+                has_specific_by_feature[issue.feature_index] = True
 
         for issue in collected_issues:
-            if issue.get("_kind") == "AnyOf" and has_specific_by_feature.get(issue["feature_index"], False):
+            if issue.kind == "AnyOf" and has_specific_by_feature.get(issue.feature_index, False):
                 continue
-            issue.pop("_kind", None)
             self.issues.append(issue)
 
         # Mirror original boolean behavior: False when we exactly hit the cap
         return len(self.errors) < max_errors
+
+    # ----------------------------
+    # Incremental re-validation
+    # ----------------------------
+    def _feature_schema_issues(self, file_path: str, header: Dict[str, Any],
+                               features: Sequence[Dict[str, Any]]) -> Tuple[List[Issue], List[SchemaIssues]]:
+        """Schema issues of each feature, validated on its own inside the file's ``header``.
+
+        Returns the file-level issues (errors outside ``features``, taken
+        from the first feature's document) and, per feature, a function
+        building its issues for the index it is placed at, with the same
+        messages as ``validate_osw_errors``.
+        """
+        filename = os.path.basename(file_path)
+        schema = self.load_osw_schema(self.pick_schema_for_file(file_path, header))
+        validator = jsonschema_rs.Draft7Validator(schema)
+        schema_url = header.get('$schema')
+        legacy_02 = isinstance(schema_url, str) and '0.2/schema.json' in schema_url
+
+        file_issues: List[Issue] = []
+        per_feature: List[SchemaIssues] = []
+        for position, feature in enumerate(features or [None]):
+            self._check_cancelled()
+            props = feature.get('properties') if isinstance(feature, dict) else None
+            messages = [self._nullish_message(path, bad_value) for path, bad_value in
+                        (self._collect_nullish_extension_property_paths(props) if isinstance(props, dict) else [])]
+            reasons = self._contains_disallowed_features_for_02({'features': [feature]}) if legacy_02 else set()
+            summary = self._disallowed_02_message(file_path, reasons) if reasons else None
+            errors = []
+            if not messages and summary is None:
+                document = {**header, 'features': [feature] if feature is not None else []}
+                for err in validator.iter_errors(document):
+                    if _feature_index_from_error(err) is None:
+                        if position == 0:
+                            file_issues.append(Issue(filename, None, _pretty_message(err, schema), kind=_err_kind(err)))
+                        continue
+                    errors.append(err)
+                # Drop AnyOf summaries when the feature has specific errors
+                if any(_err_kind(err) != "AnyOf" for err in errors):
+                    errors = [err for err in errors if _err_kind(err) != "AnyOf"]
+            if feature is not None:
+                per_feature.append(partial(_schema_issues_at, filename, schema, messages, summary, errors))
+        return file_issues, per_feature
+
+    def build_baseline(self) -> Baseline:
+        """Validate every feature of the archive and keep the state ``revalidate`` needs.
+
+        Raises ``ValueError`` if the archive cannot be extracted or its
+        structure is invalid. The baseline can be persisted with
+        ``Baseline.save`` and reopened with ``Baseline.load``.
+        """
+        zip_handler = ZipFileHandler(self.zipfile_path)
+        extracted_dir = zip_handler.extract_zip()
+        if not extracted_dir:
+            raise ValueError(zip_handler.error)
+        try:
+            validator = ExtractedDataValidator(extracted_dir)
+            if not validator.is_valid():
+                raise ValueError(validator.error)
+            baseline = Baseline(self._COORD_TOLERANCE)
+            for file_path in validator.files:
+                osw_file = _dataset_key_for_path(file_path)
+                if not osw_file:
+                    continue
+                document = _load_json(file_path)
+                header = {name: value for name, value in document.items() if name != 'features'}
+                features = document.get('features', [])
+                file_issues, schema_issues = self._feature_schema_issues(file_path, header, features)
+                baseline.add_file(osw_file, os.path.basename(file_path), header,
+                                  OSW_DATASET_FILES[osw_file].get('geometry'), features, schema_issues, file_issues)
+            baseline.check_all()
+            return baseline
+        finally:
+            zip_handler.remove_extracted_files()
+
+    def revalidate(self, baseline: Baseline, diffs: Dict[str, FeatureDiff], max_errors: int = 20) -> ValidationResult:
+        """Apply feature-level ``diffs`` (dataset key → ``FeatureDiff``) to ``baseline``.
+
+        Only the changed features are schema-validated, and only the
+        integrity checks they touch are rerun (see ``incremental``). The
+        baseline is updated in place. The result lists every current issue,
+        and its errors are the issue messages.
+        """
+        baseline.validate_diffs(diffs)
+        schema_issues = {}
+        for osw_file, diff in diffs.items():
+            state = baseline.files[osw_file]
+            _, schema_issues[osw_file] = self._feature_schema_issues(
+                state.filename, state.header, [*diff.added, *diff.modified])
+        baseline.apply(diffs, schema_issues)
+        issues = baseline.issue_list()
+        errors = [issue.message for issue in issues[:max_errors].records()]
+        return ValidationResult(len(issues) == 0, errors, issues[:max_errors])
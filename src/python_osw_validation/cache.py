@@ -0,0 +1,207 @@
+"""Content-addressed, on-disk cache of per-file validation results.
+
+``validate(cache=ResultCache(path))`` looks every dataset file up by a key
+built from the member's fingerprint, its name, a digest of the schema it is
+validated against, the library version and ``max_errors``. A hit replays
+the file's schema-stage errors and issues and returns its integrity table
+(``_id``/``_u_id``/``_v_id``/``_w_id`` plus geometries as WKB), so the file
+is neither parsed nor schema-validated again; only the cross-file checks
+run. Entries live in one SQLite file and the least recently used ones are
+evicted once the stored payloads exceed ``max_bytes``.
+
+The fingerprint is the CRC32 and uncompressed size the ZIP central
+directory already records for each member, so a lookup reads no member
+data (files without one fall back to a SHA-256 of their content). With
+``archive_memo=True`` the whole archive's fingerprints key a memo of the
+final result, which short-circuits a repeated upload before extraction.
+CRC32 is not collision resistant; ``confirm=True`` stores a SHA-256 with
+every entry and only counts a hit if the file (or archive) still matches.
+
+Entries are plain data: a JSON header (errors, issues, flags) followed,
+for files, by the table's JSON columns and WKB geometries. Reading a cache
+file never runs code from it, so it may be shared between processes and
+hosts; a malformed or foreign entry counts as a miss.
+"""
+
+import hashlib
+import json
+import sqlite3
+import threading
+from typing import Any, Dict, List, NamedTuple, Optional, Union
+
+import numpy as np
+import shapely
+
+from .feature_table import FeatureTable
+
+DEFAULT_MAX_BYTES = 512 * 2 ** 20
+_CHUNK_SIZE = 2 ** 20
+
+
+class CacheStats(NamedTuple):
+    hits: int = 0
+    misses: int = 0
+
+
+class CachedFile(NamedTuple):
+    """What one dataset file contributed to a run."""
+    errors: List[str]
+    issues: List[Dict[str, Any]]
+    within_cap: bool
+    table: Optional[FeatureTable]
+    digest: Optional[str] = None
+
+
+class CachedArchive(NamedTuple):
+    """The outcome of a whole run over one archive."""
+    is_valid: bool
+    errors: List[str]
+    issues: List[Dict[str, Any]]
+    digest: Optional[str] = None
+
+
+Entry = Union[CachedFile, CachedArchive]
+
+
+def file_digest(path: str) -> str:
+    """SHA-256 of a file's bytes."""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(_CHUNK_SIZE), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def cache_key(*parts: Any) -> str:
+    return hashlib.sha256('\0'.join(map(str, parts)).encode('utf-8')).hexdigest()
+
+
+def _json_default(value: Any) -> Any:
+    # numpy scalars, e.g. feature indexes in issues
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+def _encode(entry: Entry) -> bytes:
+    fields = entry._asdict()
+    table = fields.pop('table', None)
+    if isinstance(entry, CachedFile):
+        fields['kind'], fields['table'] = 'file', table is not None
+    else:
+        fields['kind'] = 'archive'
+    payload = json.dumps(fields, default=_json_default).encode('utf-8') + b'\n'
+    return payload + table.to_bytes() if table is not None else payload
+
+
+def _decode(payload: bytes) -> Optional[Entry]:
+    """Entry written by ``_encode``; None for anything else (e.g. entries of older versions)."""
+    header, _, rest = bytes(payload).partition(b'\n')
+    try:
+        fields = json.loads(header)
+        kind = fields.pop('kind')
+        if kind == 'archive':
+            return CachedArchive(**fields)
+        table = FeatureTable.from_bytes(rest) if fields.pop('table') else None
+        return CachedFile(table=table, **fields)
+    except (ValueError, KeyError, TypeError, AttributeError, shapely.errors.GEOSException):
+        return None
+
+
+class ResultCache:
+    """SQLite-backed store of ``CachedFile`` entries with size-bounded LRU eviction."""
+
+    def __init__(self, path: str, max_bytes: int = DEFAULT_MAX_BYTES,
+                 archive_memo: bool = False, confirm: bool = False):
+        if max_bytes <= 0:
+            raise ValueError('max_bytes must be positive')
+        self.path = path
+        self.max_bytes = max_bytes
+        self.archive_memo = archive_memo
+        self.confirm = confirm
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._db = sqlite3.connect(path, check_same_thread=False)
+        with self._db:
+            self._db.execute(
+                'CREATE TABLE IF NOT EXISTS entries ('
+                'key TEXT PRIMARY KEY, payload BLOB NOT NULL, size INTEGER NOT NULL, last_used INTEGER NOT NULL)'
+            )
+            self._db.execute('CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used)')
+
+    @property
+    def stats(self) -> CacheStats:
+        """Hits and misses since this cache object was opened."""
+        return CacheStats(self._hits, self._misses)
+
+    def get(self, key: str, path: Optional[str] = None) -> Optional[Entry]:
+        """Entry stored under ``key``; with ``confirm``, only if ``path`` still has its digest."""
+        with self._lock:
+            row = self._db.execute('SELECT payload FROM entries WHERE key = ?', (key,)).fetchone()
+            entry = None if row is None else _decode(row[0])
+            if entry is not None and self.confirm and path is not None and entry.digest != file_digest(path):
+                entry = None
+            if entry is None:
+                self._misses += 1
+                return None
+            with self._db:
+                self._db.execute('UPDATE entries SET last_used = ? WHERE key = ?', (self._tick(), key))
+            self._hits += 1
+        return entry
+
+    def put(self, key: str, entry: Entry, path: Optional[str] = None) -> None:
+        """Store ``entry``; with ``confirm``, together with the digest of ``path``."""
+        if self.confirm and path is not None:
+            entry = entry._replace(digest=file_digest(path))
+        payload = _encode(entry)
+        if len(payload) > self.max_bytes:
+            return
+        with self._lock, self._db:
+            self._db.execute('INSERT OR REPLACE INTO entries VALUES (?, ?, ?, ?)',
+                             (key, payload, len(payload), self._tick()))
+            self._evict()
+
+    def _tick(self) -> int:
+        # Monotonic use counter, so recency survives reopening the file.
+        return self._db.execute('SELECT COALESCE(MAX(last_used), 0) + 1 FROM entries').fetchone()[0]
+
+    def _evict(self) -> None:
+        total = self.total_bytes
+        if total <= self.max_bytes:
+            return
+        for key, size in self._db.execute('SELECT key, size FROM entries ORDER BY last_used').fetchall():
+            self._db.execute('DELETE FROM entries WHERE key = ?', (key,))
+            total -= size
+            if total <= self.max_bytes:
+                break
+
+    @property
+    def total_bytes(self) -> int:
+        return self._db.execute('SELECT COALESCE(SUM(size), 0) FROM entries').fetchone()[0]
+
+    def __len__(self) -> int:
+        return self._db.execute('SELECT COUNT(*) FROM entries').fetchone()[0]
+
+    def __contains__(self, key: str) -> bool:
+        return self._db.execute('SELECT 1 FROM entries WHERE key = ?', (key,)).fetchone() is not None
+
+    def clear(self) -> None:
+        with self._lock, self._db:
+            self._db.execute('DELETE FROM entries')
+
+    def close(self) -> None:
+        self._db.close()
+
+    def __enter__(self) -> 'ResultCache':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        return (f"ResultCache({self.path!r}, max_bytes={self.max_bytes}, "
+                f"archive_memo={self.archive_memo}, confirm={self.confirm})")
+
+
+__all__ = ["CacheStats", "CachedArchive", "CachedFile", "DEFAULT_MAX_BYTES", "ResultCache", "cache_key", "file_digest"]
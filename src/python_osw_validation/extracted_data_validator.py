@@ -1,7 +1,8 @@
 import os
-import gc
 import glob
 
+from .tracing import ATTR_ERRORS, ATTR_FILES, SPAN_DISCOVER_FILES, get_tracer
+
 OSW_DATASET_FILES = {
     "edges": {
         "required": False,
@@ -70,6 +71,13 @@ class ExtractedDataValidator:
         self.error = None
 
     def is_valid(self) -> bool:
+        with get_tracer().start_span(SPAN_DISCOVER_FILES, {}) as span:
+            valid = self._is_valid()
+            span.set_attribute(ATTR_FILES, len(self.files) + len(self.externalExtensions))
+            span.set_attribute(ATTR_ERRORS, 0 if valid else 1)
+            return valid
+
+    def _is_valid(self) -> bool:
         # Check if the directory exists
         if not os.path.exists(self.extracted_dir):
             self.error = 'Directory does not exist.'
@@ -109,7 +117,6 @@ class ExtractedDataValidator:
                 return False
 
             self.externalExtensions.extend([item for item in geojson_files if item not in self.files])
-            gc.collect()
             return True
 
         allowed_keys = tuple(OSW_DATASET_FILES.keys())
@@ -129,53 +136,47 @@ class ExtractedDataValidator:
         duplicate_files = []
         save_filename = None  # Initialize this variable
 
-        try:
-            # Process required files
-            for required_file in required_files:
-                file_count = 0
-                for filename in geojson_files:
-                    base_name = os.path.basename(filename)
-                    if _matches_dataset_filename(base_name, required_file):
-                        file_count += 1
-                        save_filename = filename
-                if file_count == 0:
-                    # Missing required file
-                    missing_files.append(required_file)
-                elif file_count == 1:
-                    self.files.append(save_filename)
-                else:
-                    # Duplicate file
-                    duplicate_files.append(required_file)
-
-            # Process optional files
-            for optional_file in optional_files:
-                file_count = 0
-                for filename in geojson_files:
-                    base_name = os.path.basename(filename)
-                    if _matches_dataset_filename(base_name, optional_file):
-                        file_count += 1
-                        save_filename = filename
-                if file_count == 1:
-                    self.files.append(save_filename)
-                elif file_count > 1:
-                    # Duplicate file
-                    duplicate_files.append(optional_file)
-
-            # Check for missing or duplicate files
-            if missing_files:
-                self.error = f'Missing required .geojson files: {", ".join(missing_files)}.'
-                return False
-
-            if duplicate_files:
-                self.error = f'Multiple .geojson files of the same type found: {", ".join(duplicate_files)}.'
-                return False
+        # Process required files
+        for required_file in required_files:
+            file_count = 0
+            for filename in geojson_files:
+                base_name = os.path.basename(filename)
+                if _matches_dataset_filename(base_name, required_file):
+                    file_count += 1
+                    save_filename = filename
+            if file_count == 0:
+                # Missing required file
+                missing_files.append(required_file)
+            elif file_count == 1:
+                self.files.append(save_filename)
+            else:
+                # Duplicate file
+                duplicate_files.append(required_file)
+
+        # Process optional files
+        for optional_file in optional_files:
+            file_count = 0
+            for filename in geojson_files:
+                base_name = os.path.basename(filename)
+                if _matches_dataset_filename(base_name, optional_file):
+                    file_count += 1
+                    save_filename = filename
+            if file_count == 1:
+                self.files.append(save_filename)
+            elif file_count > 1:
+                # Duplicate file
+                duplicate_files.append(optional_file)
+
+        # Check for missing or duplicate files
+        if missing_files:
+            self.error = f'Missing required .geojson files: {", ".join(missing_files)}.'
+            return False
 
-            # Add OSW external extensions, GeoJSON files we know nothing about
-            self.externalExtensions.extend([item for item in geojson_files if item not in self.files])
+        if duplicate_files:
+            self.error = f'Multiple .geojson files of the same type found: {", ".join(duplicate_files)}.'
+            return False
 
-        finally:
-            # Cleanup large lists and call garbage collector
-            del geojson_files, basenames, required_files, optional_files, missing_files, duplicate_files
-            gc.collect()
+        # Add OSW external extensions, GeoJSON files we know nothing about
+        self.externalExtensions.extend([item for item in geojson_files if item not in self.files])
 
         return True
@@ -0,0 +1,113 @@
+"""GeoPandas-free tables for the integrity checks of ``validate(lean=True)``.
+
+A ``FeatureTable`` holds only what the integrity stage reads from a dataset
+file: the ``_id``/``_u_id``/``_v_id``/``_w_id`` properties as object arrays
+and one shapely geometry per feature. It is filled straight from the parsed
+GeoJSON document, builds geometries in bulk with ``build_geometries``, and
+exposes the small part of the GeoDataFrame interface the integrity checks
+use (``columns``, ``len``, ``[name]``, ``index`` and ``geometry``).
+"""
+
+import json
+from typing import Any, Dict, List, Sequence, Tuple
+
+import numpy as np
+import shapely
+
+from .geometry_builder import build_geometries
+
+INTEGRITY_COLUMNS: Tuple[str, ...] = ('_id', '_u_id', '_v_id', '_w_id')
+
+
+def _object_array(values: Sequence[Any]) -> np.ndarray:
+    # fromiter keeps list values (e.g. _w_id) as single elements.
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _pack_wkb(geometries: Sequence[Any]) -> Tuple[np.ndarray, bytes]:
+    """WKB sizes (-1 for missing geometries) and the concatenated WKB of ``geometries``."""
+    wkb = shapely.to_wkb(_object_array(geometries))
+    sizes = np.fromiter((-1 if item is None else len(item) for item in wkb), dtype=np.int64, count=len(wkb))
+    return sizes, b''.join(item for item in wkb if item is not None)
+
+
+def _unpack_wkb(sizes: Sequence[int], blob: bytes) -> np.ndarray:
+    """Geometries packed by ``_pack_wkb``; raises ``ValueError`` if ``sizes`` do not match ``blob``."""
+    sizes = np.asarray(sizes, dtype=np.int64)
+    present = sizes >= 0
+    ends = np.cumsum(np.where(present, sizes, 0))
+    if (ends[-1] if len(ends) else 0) != len(blob):
+        raise ValueError('WKB sizes do not match the data')
+    wkb = np.empty(len(sizes), dtype=object)
+    # Through an object array: numpy would otherwise make bytes values fixed-width and drop trailing NULs
+    wkb[present] = _object_array([blob[start:end]
+                                  for start, end in zip((ends - sizes)[present].tolist(), ends[present].tolist())])
+    return shapely.from_wkb(wkb)
+
+
+class FeatureTable:
+    """Integrity-check columns and geometries of one GeoJSON FeatureCollection."""
+
+    def __init__(self, columns: Dict[str, np.ndarray], geometry: np.ndarray):
+        self._columns = columns
+        self.geometry = geometry
+        self.index = np.arange(len(geometry))
+
+    @classmethod
+    def from_geojson(cls, data: Dict[str, Any], columns: Sequence[str] = INTEGRITY_COLUMNS) -> 'FeatureTable':
+        """Read ``columns`` and geometries from a parsed GeoJSON document.
+
+        Like ``GeoDataFrame.from_features``, a column only exists when at
+        least one feature has that property key; other features get None.
+        """
+        features = data.get('features', []) if isinstance(data, dict) else []
+        values: Dict[str, List[Any]] = {name: [] for name in columns}
+        present = set()
+        geometries: List[Any] = []
+        for feature in features:
+            props = feature.get('properties') or {}
+            for name, column in values.items():
+                if name in props:
+                    present.add(name)
+                column.append(props.get(name))
+            geometries.append(feature.get('geometry'))
+        table_columns = {name: _object_array(column) for name, column in values.items() if name in present}
+        return cls(table_columns, build_geometries(geometries))
+
+    @property
+    def columns(self) -> List[str]:
+        return list(self._columns) + ['geometry']
+
+    def __len__(self) -> int:
+        return len(self.geometry)
+
+    def __getitem__(self, name: str) -> np.ndarray:
+        if name == 'geometry':
+            return self.geometry
+        return self._columns[name]
+
+    def to_bytes(self) -> bytes:
+        """The columns as a JSON line followed by the geometries' WKB, one after another."""
+        sizes, blob = _pack_wkb(self.geometry)
+        header = {'columns': {name: list(column) for name, column in self._columns.items()},
+                  'wkb_sizes': sizes.tolist()}
+        return json.dumps(header).encode('utf-8') + b'\n' + blob
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> 'FeatureTable':
+        """Table written by ``to_bytes``; raises ``ValueError`` if ``data`` is not one."""
+        header, _, blob = data.partition(b'\n')
+        try:
+            state = json.loads(header)
+            columns, sizes = state['columns'], state['wkb_sizes']
+        except (KeyError, TypeError) as e:
+            raise ValueError(f'not a FeatureTable: {e}') from e
+        if any(len(column) != len(sizes) for column in columns.values()):
+            raise ValueError('not a FeatureTable: column lengths differ')
+        return cls({name: _object_array(column) for name, column in columns.items()}, _unpack_wkb(sizes, blob))
+
+    def __repr__(self) -> str:
+        return f"FeatureTable({len(self)} features, columns={self.columns})"
+
+
+__all__ = ["FeatureTable", "INTEGRITY_COLUMNS"]
@@ -0,0 +1,116 @@
+"""Bulk construction of shapely geometries from GeoJSON geometry objects.
+
+``build_geometries`` makes one pass over the geometry objects and flattens
+the coordinates of every Point, LineString and Polygon into per-type
+coordinate arrays with part sizes (the ragged offsets), then creates all
+geometries of a type with one call to shapely 2's vectorised constructors.
+Other geometry types, and coordinates the bulk path cannot take as-is, go
+through ``shapely.geometry.shape`` one feature at a time, so the result is
+the same as calling ``shape`` on every geometry.
+"""
+
+from typing import Any, List, Optional, Sequence
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+
+class _Ragged:
+    """Flattened coordinates of one geometry type.
+
+    ``rows`` are the output positions, ``coords`` every position in order,
+    ``sizes`` the coordinate count of each part (line or ring) and
+    ``owners`` the ordinal of the geometry each part belongs to.
+    """
+
+    __slots__ = ('rows', 'coords', 'sizes', 'owners')
+
+    def __init__(self):
+        self.rows: List[int] = []
+        self.coords: List[Any] = []
+        self.sizes: List[int] = []
+        self.owners: List[int] = []
+
+    def add_part(self, coords: List[Any]) -> None:
+        self.coords.extend(coords)
+        self.sizes.append(len(coords))
+        self.owners.append(len(self.rows) - 1)
+
+    def coordinate_array(self) -> Optional[np.ndarray]:
+        """``(n, 2)`` or ``(n, 3)`` float array, or None when positions are ragged or not numeric."""
+        try:
+            xy = np.asarray(self.coords, dtype=np.float64)
+        except (TypeError, ValueError):
+            return None
+        if xy.ndim != 2 or xy.shape[1] not in (2, 3):
+            return None
+        return xy
+
+    def part_index(self) -> np.ndarray:
+        """Part number of every coordinate."""
+        return np.repeat(np.arange(len(self.sizes)), self.sizes)
+
+
+def _is_closed_ring(ring: Any) -> bool:
+    return isinstance(ring, list) and len(ring) >= 4 and ring[0] == ring[-1]
+
+
+def build_geometries(geometries: Sequence[Any]) -> np.ndarray:
+    """Object array of shapely geometries for GeoJSON geometry objects.
+
+    Falsy geometries (None, ``{}``) become None, as in
+    ``GeoDataFrame.from_features``. Errors from malformed geometry are
+    raised by the per-feature fallback, exactly as ``shape`` would.
+    """
+    out = np.empty(len(geometries), dtype=object)
+    points, lines, polygons = _Ragged(), _Ragged(), _Ragged()
+    fallback: List[int] = []
+
+    for i, geom in enumerate(geometries):
+        if not geom:
+            continue
+        kind = geom.get('type') if isinstance(geom, dict) else None
+        coords = geom.get('coordinates') if kind else None
+        if not isinstance(coords, list):
+            fallback.append(i)
+        elif kind == 'Point' and len(coords) in (2, 3):
+            points.rows.append(i)
+            points.coords.append(coords)
+        elif kind == 'LineString' and len(coords) >= 2:
+            lines.rows.append(i)
+            lines.add_part(coords)
+        elif kind == 'Polygon' and coords and all(_is_closed_ring(ring) for ring in coords):
+            polygons.rows.append(i)
+            for ring in coords:
+                polygons.add_part(ring)
+        else:
+            fallback.append(i)
+
+    if points.rows:
+        xy = points.coordinate_array()
+        if xy is None:
+            fallback.extend(points.rows)
+        else:
+            out[points.rows] = shapely.points(xy)
+    if lines.rows:
+        xy = lines.coordinate_array()
+        if xy is None:
+            fallback.extend(lines.rows)
+        else:
+            out[lines.rows] = shapely.linestrings(xy, indices=lines.part_index())
+    if polygons.rows:
+        xy = polygons.coordinate_array()
+        if xy is None:
+            fallback.extend(polygons.rows)
+        else:
+            rings = shapely.linearrings(xy, indices=polygons.part_index())
+            # With indices, the first ring of each polygon is its shell and the rest are holes.
+            out[polygons.rows] = shapely.polygons(rings, indices=np.asarray(polygons.owners))
+
+    for i in sorted(fallback):
+        out[i] = shape(geometries[i])
+    return out
+
+
+__all__ = ["build_geometries"]
@@ -14,14 +14,18 @@ The validator emits structured issues with ``filename``, ``feature_index``,
 ``feature_id`` (when available) and a clear, actionable error message.
 
 Coordinate matching is performed by exact equality on the (lon, lat) pair.
-Altitude / extra coordinate dimensions are ignored.
+Altitude / extra coordinate dimensions are ignored. Node coordinates are
+held in a NumPy-backed ``NodeIndex`` and the checks run on whole arrays.
 """
 
 from __future__ import annotations
 
-from typing import Any, Dict, Iterable, List, Optional, Sequence, Tuple
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple
 import math
 
+import numpy as np
+
 
 # ---------------------------------------------------------------------------
 # Coordinate helpers
@@ -51,39 +55,367 @@ def _format_coord(coord: Optional[Sequence[Any]]) -> str:
     return f"({key[0]}, {key[1]})"
 
 
+# ---------------------------------------------------------------------------
+# Node index
+# ---------------------------------------------------------------------------
+
+
+def _int_key(value: Any) -> Optional[int]:
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, (int, np.integer)):
+        return int(value)
+    if isinstance(value, (float, np.floating)) and float(value).is_integer():
+        return int(value)
+    return None
+
+
+def _str_key(value: Any) -> bool:
+    """Whether ``value`` is a string that survives a round trip through a NumPy byte string."""
+    return isinstance(value, str) and not value.endswith('\0')
+
+
+class NodeIndex(Mapping):
+    """Compact node id → (lon, lat) index.
+
+    Ids are stored once, sorted, in a contiguous array: UTF-8 byte strings
+    when every id is a string, int64 when every id is an integer, and a
+    hashed pandas-free fallback (a plain dict of positions) otherwise.
+    NumPy byte strings drop trailing NULs, so string ids ending in ``"\\0"``
+    also take the fallback rather than colliding with their stripped form.
+    Coordinates live in parallel float64 ``lon``/``lat`` arrays, so a
+    million nodes cost tens of bytes each instead of a dict entry, a tuple
+    and two float objects.
+
+    Batch lookups (``positions``, ``lookup``) are vectorised. The class
+    also behaves as a read-only ``Mapping`` of id → ``(lon, lat)`` tuples for
+    callers that pass node coordinates around as a dict.
+    """
+
+    __slots__ = ('_kind', '_keys', '_fallback', 'lon', 'lat')
+
+    def __init__(self, ids: Sequence[Any], lon: Sequence[float], lat: Sequence[float], keep: str = 'first'):
+        """Index ``ids`` with their coordinates.
+
+        ``keep`` decides which coordinate a duplicated id maps to:
+        ``'first'`` or ``'last'`` occurrence.
+        """
+        if keep not in ('first', 'last'):
+            raise ValueError("keep must be 'first' or 'last'")
+        id_values = _object_array(ids)
+        lon_arr = np.asarray(lon, dtype=np.float64)
+        lat_arr = np.asarray(lat, dtype=np.float64)
+        if not (len(id_values) == len(lon_arr) == len(lat_arr)):
+            raise ValueError('ids, lon and lat must have the same length')
+
+        self._fallback: Optional[Dict[Any, int]] = None
+        if all(_str_key(v) for v in id_values):
+            self._kind = 'str'
+            keys = np.char.encode(id_values.astype(str), 'utf-8') if len(id_values) else np.empty(0, dtype='S1')
+        elif all(_int_key(v) is not None for v in id_values):
+            self._kind = 'int'
+            keys = np.fromiter((_int_key(v) for v in id_values), dtype=np.int64, count=len(id_values))
+        else:
+            self._kind = 'object'
+            positions: Dict[Any, int] = {}
+            for pos, value in enumerate(id_values):
+                if keep == 'last' or value not in positions:
+                    positions[value] = pos
+            order = np.fromiter(positions.values(), dtype=np.int64, count=len(positions))
+            self._fallback = {value: i for i, value in enumerate(positions)}
+            self._keys = id_values[order]
+            self.lon = lon_arr[order]
+            self.lat = lat_arr[order]
+            return
+
+        order = np.argsort(keys, kind='stable')
+        keys = keys[order]
+        if len(keys):
+            boundary = keys[1:] != keys[:-1]
+            unique = np.r_[True, boundary] if keep == 'first' else np.r_[boundary, True]
+            order = order[unique]
+            keys = keys[unique]
+        self._keys = keys
+        self.lon = lon_arr[order]
+        self.lat = lat_arr[order]
+
+    @classmethod
+    def empty(cls) -> 'NodeIndex':
+        return cls([], [], [])
+
+    @classmethod
+    def from_arrays(cls, keys: np.ndarray, lon: np.ndarray, lat: np.ndarray) -> 'NodeIndex':
+        """Wrap the arrays of ``to_arrays`` (e.g. memory-mapped) without copying or sorting them."""
+        if keys.dtype.kind == 'S':
+            kind = 'str'
+        elif keys.dtype == np.int64:
+            kind = 'int'
+        else:
+            raise ValueError(f'unsupported id array dtype {keys.dtype}')
+        if not (len(keys) == len(lon) == len(lat)):
+            raise ValueError('keys, lon and lat must have the same length')
+        index = cls.__new__(cls)
+        index._kind = kind
+        index._keys = keys
+        index._fallback = None
+        index.lon = lon
+        index.lat = lat
+        return index
+
+    def to_arrays(self) -> Dict[str, np.ndarray]:
+        """The sorted ``keys`` with their ``lon``/``lat``, e.g. to persist the index.
+
+        Raises ``ValueError`` for an index on the dict fallback (mixed id types, or string
+        ids ending in NUL), which has no array form.
+        """
+        if self._kind == 'object':
+            raise ValueError('an index on the dict fallback has no array form')
+        return {'keys': self._keys, 'lon': self.lon, 'lat': self.lat}
+
+    @classmethod
+    def from_geojson(cls, nodes_geojson: Optional[Dict[str, Any]]) -> 'NodeIndex':
+        """Index Point nodes of a parsed nodes GeoJSON document.
+
+        Nodes without a usable ``_id`` or geometry are skipped silently;
+        higher level validation already reports those issues. The first
+        occurrence of a duplicated id wins.
+        """
+        ids: List[str] = []
+        lon: List[float] = []
+        lat: List[float] = []
+        if isinstance(nodes_geojson, dict):
+            features = nodes_geojson.get("features") or []
+            if isinstance(features, list):
+                for feature in features:
+                    if not isinstance(feature, dict):
+                        continue
+                    props = feature.get("properties") or {}
+                    node_id = props.get("_id") if isinstance(props, dict) else None
+                    if not isinstance(node_id, str) or not node_id:
+                        continue
+                    geom = feature.get("geometry") or {}
+                    if not isinstance(geom, dict) or geom.get("type") != "Point":
+                        continue
+                    coord = _coord_key(geom.get("coordinates"))
+                    if coord is None:
+                        continue
+                    ids.append(node_id)
+                    lon.append(coord[0])
+                    lat.append(coord[1])
+        return cls(ids, lon, lat, keep='first')
+
+    @classmethod
+    def from_mapping(cls, node_coords: Dict[Any, Coord]) -> 'NodeIndex':
+        if isinstance(node_coords, NodeIndex):
+            return node_coords
+        ids = list(node_coords.keys())
+        coords = list(node_coords.values())
+        return cls(ids, [c[0] for c in coords], [c[1] for c in coords])
+
+    # -- batch lookups -----------------------------------------------------
+
+    def positions(self, ids: Sequence[Any]) -> np.ndarray:
+        """Position of each id in the index, -1 when unknown or not an id."""
+        values = _object_array(ids)
+        result = np.full(len(values), -1, dtype=np.int64)
+        if len(values) == 0 or len(self) == 0:
+            return result
+        if self._kind == 'object':
+            for i, value in enumerate(values):
+                try:
+                    result[i] = self._fallback.get(value, -1)
+                except TypeError:
+                    pass
+            return result
+
+        if self._kind == 'str':
+            candidates = np.fromiter((_str_key(v) for v in values),
+                                     dtype=bool, count=len(values))
+            if not candidates.any():
+                return result
+            query = np.char.encode(values[candidates].astype(str), 'utf-8')
+        else:
+            int_keys = [_int_key(v) for v in values]
+            candidates = np.fromiter((k is not None for k in int_keys), dtype=bool, count=len(values))
+            if not candidates.any():
+                return result
+            query = np.fromiter((k for k in int_keys if k is not None), dtype=np.int64)
+
+        found = np.searchsorted(self._keys, query)
+        found = np.minimum(found, len(self._keys) - 1)
+        hit = self._keys[found] == query
+        sub = np.full(len(query), -1, dtype=np.int64)
+        sub[hit] = found[hit]
+        result[candidates] = sub
+        return result
+
+    def xy(self, positions: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """Coordinates at ``positions``; NaN where the position is -1."""
+        positions = np.asarray(positions, dtype=np.int64)
+        found = positions >= 0
+        lon = np.full(len(positions), np.nan)
+        lat = np.full(len(positions), np.nan)
+        lon[found] = self.lon[positions[found]]
+        lat[found] = self.lat[positions[found]]
+        return lon, lat
+
+    def lookup(self, ids: Sequence[Any]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Return ``(lon, lat, found)`` arrays for ``ids``."""
+        positions = self.positions(ids)
+        lon, lat = self.xy(positions)
+        return lon, lat, positions >= 0
+
+    def coord(self, position: int) -> Coord:
+        return (float(self.lon[position]), float(self.lat[position]))
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the index arrays (excluding the object fallback)."""
+        return int(self._keys.nbytes + self.lon.nbytes + self.lat.nbytes)
+
+    # -- Mapping interface --------------------------------------------------
+
+    def _decode(self, key: Any) -> Any:
+        if self._kind == 'str':
+            return key.decode('utf-8')
+        if self._kind == 'int':
+            return int(key)
+        return key
+
+    def __getitem__(self, node_id: Any) -> Coord:
+        position = self.positions([node_id])[0]
+        if position < 0:
+            raise KeyError(node_id)
+        return self.coord(position)
+
+    def __iter__(self) -> Iterator[Any]:
+        return (self._decode(key) for key in self._keys)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __repr__(self) -> str:
+        return f"NodeIndex({len(self)} nodes, {self._kind} ids)"
+
+
+def _object_array(values: Sequence[Any]) -> np.ndarray:
+    if isinstance(values, np.ndarray) and values.dtype == object:
+        return values
+    out = np.empty(len(values), dtype=object)
+    out[:] = list(values)
+    return out
+
+
+# ---------------------------------------------------------------------------
+# Tolerance matching
+# ---------------------------------------------------------------------------
+
+# Multipliers for hashing (group, cx, cy) cells into one uint64 key.
+_CELL_MIX = (np.uint64(0x9E3779B97F4A7C15), np.uint64(0xC2B2AE3D27D4EB4F), np.uint64(0x165667B19E3779F9))
+
+
+def coords_within_tolerance(x1: np.ndarray, y1: np.ndarray, x2: np.ndarray, y2: np.ndarray,
+                            tolerance: float) -> np.ndarray:
+    """Element-wise ``|dx| <= tolerance and |dy| <= tolerance``; False for NaN."""
+    return (np.abs(np.subtract(x1, x2)) <= tolerance) & (np.abs(np.subtract(y1, y2)) <= tolerance)
+
+
+class ToleranceGrid:
+    """Point set bucketed into square cells for tolerance lookups.
+
+    Points are quantised to ``(group, cx, cy)`` cells with a cell size of
+    (just over) ``tolerance``, so any point within tolerance of a query lies
+    in the query's cell or one of its eight neighbours. Cells are hashed to
+    uint64 keys and sorted once; ``contains`` then resolves every query
+    with a batched binary search per neighbour cell and an exact tolerance
+    check on the few points found there, instead of comparing against every
+    point. A hash collision only adds a candidate that the exact check
+    rejects.
+
+    ``groups`` partitions the set (e.g. one group per zone ring) so a
+    query only matches points of its own group.
+    """
+
+    __slots__ = ("tolerance", "_cell", "_keys", "_x", "_y", "_max_bucket")
+
+    def __init__(self, x: Sequence[float], y: Sequence[float], tolerance: float,
+                 groups: Optional[Sequence[int]] = None):
+        if not tolerance > 0:
+            raise ValueError("tolerance must be positive")
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        groups = np.zeros(len(x), dtype=np.int64) if groups is None else np.asarray(groups, dtype=np.int64)
+        if not (len(x) == len(y) == len(groups)):
+            raise ValueError("x, y and groups must have the same length")
+        self.tolerance = float(tolerance)
+        # Padding keeps float rounding in x / cell from pushing a point that is
+        # exactly ``tolerance`` away two cells over.
+        self._cell = self.tolerance * (1 + 1e-6)
+
+        finite = np.isfinite(x) & np.isfinite(y)
+        x, y, groups = x[finite], y[finite], groups[finite]
+        keys = self._cell_keys(groups, x, y)
+        order = np.argsort(keys, kind="stable")
+        self._keys = keys[order]
+        self._x = x[order]
+        self._y = y[order]
+        if len(self._keys):
+            starts = np.flatnonzero(np.r_[True, self._keys[1:] != self._keys[:-1]])
+            self._max_bucket = int(np.diff(np.r_[starts, len(self._keys)]).max())
+        else:
+            self._max_bucket = 0
+
+    def _cell_keys(self, groups: np.ndarray, x: np.ndarray, y: np.ndarray,
+                   dx: int = 0, dy: int = 0) -> np.ndarray:
+        cx = (np.floor(x / self._cell).astype(np.int64) + dx).view(np.uint64)
+        cy = (np.floor(y / self._cell).astype(np.int64) + dy).view(np.uint64)
+        return (groups.view(np.uint64) * _CELL_MIX[0]) ^ (cx * _CELL_MIX[1]) ^ (cy * _CELL_MIX[2])
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def contains(self, x: Sequence[float], y: Sequence[float],
+                 groups: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Boolean mask: is each query point within tolerance of a point in its group?"""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        groups = np.zeros(len(x), dtype=np.int64) if groups is None else np.asarray(groups, dtype=np.int64)
+        matched = np.zeros(len(x), dtype=bool)
+        if len(self._keys) == 0 or len(x) == 0:
+            return matched
+        queries = np.flatnonzero(np.isfinite(x) & np.isfinite(y))
+        qx, qy, qg = x[queries], y[queries], groups[queries]
+        found = np.zeros(len(queries), dtype=bool)
+        for dx in (0, -1, 1):
+            for dy in (0, -1, 1):
+                keys = self._cell_keys(qg, qx, qy, dx, dy)
+                lo = np.searchsorted(self._keys, keys, side="left")
+                hi = np.searchsorted(self._keys, keys, side="right")
+                for step in range(self._max_bucket):
+                    pending = np.flatnonzero(~found & (lo + step < hi))
+                    if len(pending) == 0:
+                        break
+                    cand = lo[pending] + step
+                    found[pending] = coords_within_tolerance(
+                        self._x[cand], self._y[cand], qx[pending], qy[pending], self.tolerance)
+        matched[queries] = found
+        return matched
+
+
 # ---------------------------------------------------------------------------
 # Index builders
 # ---------------------------------------------------------------------------
 
 
-def build_node_coord_index(nodes_geojson: Optional[Dict[str, Any]]) -> Dict[str, Coord]:
+def build_node_coord_index(nodes_geojson: Optional[Dict[str, Any]]) -> NodeIndex:
     """Map each node ``_id`` to its (lon, lat) coordinate.
 
     Nodes without a usable ``_id`` or geometry are skipped silently;
-    higher level validation already reports those issues.
+    higher level validation already reports those issues. The result is a
+    ``NodeIndex``, which also reads like a ``{_id: (lon, lat)}`` dict.
     """
-    index: Dict[str, Coord] = {}
-    if not isinstance(nodes_geojson, dict):
-        return index
-    features = nodes_geojson.get("features") or []
-    if not isinstance(features, list):
-        return index
-    for feature in features:
-        if not isinstance(feature, dict):
-            continue
-        props = feature.get("properties") or {}
-        node_id = props.get("_id") if isinstance(props, dict) else None
-        if not isinstance(node_id, str) or not node_id:
-            continue
-        geom = feature.get("geometry") or {}
-        if not isinstance(geom, dict) or geom.get("type") != "Point":
-            continue
-        coord = _coord_key(geom.get("coordinates"))
-        if coord is None:
-            continue
-        # First write wins - duplicate id detection is reported elsewhere.
-        index.setdefault(node_id, coord)
-    return index
+    # First write wins - duplicate id detection is reported elsewhere.
+    return NodeIndex.from_geojson(nodes_geojson)
 
 
 # ---------------------------------------------------------------------------
@@ -93,7 +425,7 @@ def build_node_coord_index(nodes_geojson: Optional[Dict[str, Any]]) -> Dict[str,
 
 def validate_edge_node_mapping(
         edges_geojson: Optional[Dict[str, Any]],
-        node_coords: Dict[str, Coord],
+        node_coords: Mapping,
         edges_filename: str = "edges",
         nodes_present: bool = True,
 ) -> List[Dict[str, Any]]:
@@ -107,6 +439,9 @@ def validate_edge_node_mapping(
 
     When ``nodes_present`` is False (no nodes file in dataset) coordinate
     matching is skipped because the targets are unknown.
+
+    ``node_coords`` is a ``NodeIndex`` (or any id → (lon, lat) mapping);
+    all references are resolved in one batch lookup.
     """
     issues: List[Dict[str, Any]] = []
     if not isinstance(edges_geojson, dict):
@@ -115,6 +450,9 @@ def validate_edge_node_mapping(
     if not isinstance(features, list):
         return issues
 
+    # Pass 1: collect checks in report order. A check is either a missing
+    # reference (ref_val None) or a string reference to resolve.
+    checks: List[Tuple[int, Optional[str], str, Optional[str], Optional[Coord], str]] = []
     for idx, feature in enumerate(features):
         if not isinstance(feature, dict):
             continue
@@ -139,10 +477,7 @@ def validate_edge_node_mapping(
         ):
             ref_val = props.get(ref_field)
             if ref_val is None or (isinstance(ref_val, str) and not ref_val.strip()):
-                issues.append(_make_issue(
-                    edges_filename, idx, feature_id,
-                    f"Edge is missing required '{ref_field}' reference.",
-                ))
+                checks.append((idx, feature_id, ref_field, None, None, endpoint_label))
                 continue
             if not isinstance(ref_val, str):
                 # Schema validation already complains about non-string ids; skip
@@ -152,27 +487,40 @@ def validate_edge_node_mapping(
             if not nodes_present:
                 # Only the existence check is meaningful, and we have no node set.
                 continue
+            checks.append((idx, feature_id, ref_field, ref_val, endpoint, endpoint_label))
 
-            target = node_coords.get(ref_val)
-            if target is None:
-                issues.append(_make_issue(
-                    edges_filename, idx, feature_id,
-                    f"Edge {ref_field}='{ref_val}' does not reference any node in nodes.geojson.",
-                ))
-                continue
+    # Pass 2: resolve every reference at once.
+    index = NodeIndex.from_mapping(node_coords) if nodes_present else NodeIndex.empty()
+    positions = index.positions([c[3] for c in checks])
 
-            if endpoint is None:
-                # Geometry was malformed; schema validation reports that. Skip
-                # coordinate mismatch reporting to avoid noise.
-                continue
+    for (idx, feature_id, ref_field, ref_val, endpoint, endpoint_label), position in zip(checks, positions):
+        if ref_val is None:
+            issues.append(_make_issue(
+                edges_filename, idx, feature_id,
+                f"Edge is missing required '{ref_field}' reference.",
+            ))
+            continue
+
+        if position < 0:
+            issues.append(_make_issue(
+                edges_filename, idx, feature_id,
+                f"Edge {ref_field}='{ref_val}' does not reference any node in nodes.geojson.",
+            ))
+            continue
 
-            if target != endpoint:
-                issues.append(_make_issue(
-                    edges_filename, idx, feature_id,
-                    (f"Edge {ref_field}='{ref_val}' coordinate mismatch: "
-                     f"node is at {_format_coord(target)} but edge {endpoint_label} "
-                     f"point is at {_format_coord(endpoint)}."),
-                ))
+        if endpoint is None:
+            # Geometry was malformed; schema validation reports that. Skip
+            # coordinate mismatch reporting to avoid noise.
+            continue
+
+        target = index.coord(position)
+        if target != endpoint:
+            issues.append(_make_issue(
+                edges_filename, idx, feature_id,
+                (f"Edge {ref_field}='{ref_val}' coordinate mismatch: "
+                 f"node is at {_format_coord(target)} but edge {endpoint_label} "
+                 f"point is at {_format_coord(endpoint)}."),
+            ))
     return issues
 
 
@@ -198,7 +546,7 @@ def _polygon_outer_ring(geom: Any) -> Optional[List[Sequence[Any]]]:
 
 def validate_zone_node_mapping(
         zones_geojson: Optional[Dict[str, Any]],
-        node_coords: Dict[str, Coord],
+        node_coords: Mapping,
         zones_filename: str = "zones",
         nodes_present: bool = True,
 ) -> List[Dict[str, Any]]:
@@ -210,6 +558,8 @@ def validate_zone_node_mapping(
          in the same order. The ring may include a closing vertex
          (last == first); when present the closing vertex is ignored
          when comparing lengths.
+
+    All ``_w_id`` entries of all zones are resolved in one batch lookup.
     """
     issues: List[Dict[str, Any]] = []
     if not isinstance(zones_geojson, dict):
@@ -218,6 +568,17 @@ def validate_zone_node_mapping(
     if not isinstance(features, list):
         return issues
 
+    index = NodeIndex.from_mapping(node_coords) if nodes_present else NodeIndex.empty()
+    flat_refs: List[Any] = []
+    offsets: Dict[int, int] = {}
+    for idx, feature in enumerate(features):
+        props = feature.get("properties") if isinstance(feature, dict) else None
+        w_ids = props.get("_w_id") if isinstance(props, dict) else None
+        if isinstance(w_ids, (list, tuple)) and w_ids:
+            offsets[idx] = len(flat_refs)
+            flat_refs.extend(w_ids)
+    ref_positions = index.positions(flat_refs)
+
     for idx, feature in enumerate(features):
         if not isinstance(feature, dict):
             continue
@@ -245,8 +606,11 @@ def validate_zone_node_mapping(
             ))
             continue
 
+        start = offsets[idx]
+        w_positions = ref_positions[start:start + len(w_ids)]
+
         # Existence check
-        missing_refs = [w for w in w_ids if not (isinstance(w, str) and w in node_coords)]
+        missing_refs = [w for w, pos in zip(w_ids, w_positions) if not (isinstance(w, str) and pos >= 0)]
         if nodes_present and missing_refs:
             preview = ", ".join(map(str, missing_refs[:5]))
             more = f" (+{len(missing_refs) - 5} more)" if len(missing_refs) > 5 else ""
@@ -291,13 +655,13 @@ def validate_zone_node_mapping(
             continue
 
         mismatches: List[str] = []
-        for pos, (wid, ring_pt) in enumerate(zip(w_ids, comparable_ring)):
+        for pos, (wid, ring_pt, node_pos) in enumerate(zip(w_ids, comparable_ring, w_positions)):
             if not isinstance(wid, str):
                 mismatches.append(
                     f"position {pos}: '_w_id' entry is not a string"
                 )
                 continue
-            node_pt = node_coords.get(wid)
+            node_pt = index.coord(node_pos) if node_pos >= 0 else None
             if node_pt is None or ring_pt is None or node_pt != ring_pt:
                 mismatches.append(
                     f"position {pos}: '_w_id'='{wid}' at node {_format_coord(node_pt)} "
@@ -324,6 +688,7 @@ def _make_issue(
         feature_id: Optional[str],
         message: str,
 ) -> Dict[str, Any]:
+    # The standalone validators return plain dicts, the shape of ``Issue.to_dict()``.
     return {
         "filename": filename,
         "feature_index": feature_index,
@@ -354,7 +719,7 @@ def run_geometry_mapping_validation(
     zones_name = fn.get("zones", "zones")
 
     nodes_present = isinstance(nodes_geojson, dict) and bool(nodes_geojson.get("features"))
-    node_coords = build_node_coord_index(nodes_geojson) if nodes_present else {}
+    node_coords = build_node_coord_index(nodes_geojson) if nodes_present else NodeIndex.empty()
 
     issues: List[Dict[str, Any]] = []
     issues.extend(validate_edge_node_mapping(
@@ -367,7 +732,10 @@ def run_geometry_mapping_validation(
 
 
 __all__ = [
+    "NodeIndex",
+    "ToleranceGrid",
     "build_node_coord_index",
+    "coords_within_tolerance",
     "run_geometry_mapping_validation",
     "validate_edge_node_mapping",
     "validate_zone_node_mapping",
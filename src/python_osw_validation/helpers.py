@@ -1,11 +1,15 @@
-from typing import Optional
+from typing import Any, Optional, Sequence, Tuple
 import json
 import re
 
 import geopandas as gpd
+import numpy as np
+import pandas as pd
 
+from .geometry_builder import build_geometries
 
-def _read_geojson_without_ext(file_path: str) -> gpd.GeoDataFrame:
+
+def _read_geojson_without_ext(file_path: str, columns: Optional[Sequence[str]] = None) -> gpd.GeoDataFrame:
     """Load a GeoJSON file into a GeoDataFrame with ext:* properties removed.
 
     Why: pyogrio/GDAL infers a single dtype per property column when reading
@@ -14,16 +18,95 @@ def _read_geojson_without_ext(file_path: str) -> gpd.GeoDataFrame:
     surfaces as a confusing JSON parse error. Schema validation has already
     accepted these properties; the GeoDataFrame is only used for geometry and
     _id-based integrity checks, so dropping ext:* here is safe.
+
+    ``columns`` projects the properties: only those keys (plus geometry)
+    become columns.
     """
     with open(file_path, 'r') as f:
         data = json.load(f)
-    for feature in data.get('features', []):
+    return _geodataframe_without_ext(data, columns)
+
+
+def _geodataframe_without_ext(data: dict, columns: Optional[Sequence[str]] = None) -> gpd.GeoDataFrame:
+    """Build the integrity-check GeoDataFrame from an already parsed GeoJSON document.
+
+    Strips ext:* properties in place (see `_read_geojson_without_ext`), or,
+    with ``columns``, builds the frame column-wise from just those
+    properties and leaves ``data`` untouched.
+    """
+    features = data.get('features', [])
+    crs = (data.get('crs') or {}).get('properties', {}).get('name')
+    if columns is not None and features:
+        return _projected_geodataframe(features, columns, crs)
+    if not features:
+        return gpd.GeoDataFrame.from_features(features, crs=crs)
+    rows = []
+    for feature in features:
         props = feature.get('properties')
         if isinstance(props, dict):
             for key in [k for k in props if isinstance(k, str) and k.startswith('ext:')]:
                 del props[key]
-    crs = (data.get('crs') or {}).get('properties', {}).get('name')
-    return gpd.GeoDataFrame.from_features(data.get('features', []), crs=crs)
+        rows.append(props or {})
+    # Same layout as GeoDataFrame.from_features: geometry first, then properties.
+    # A property named "geometry" would clash with the feature geometry; drop it.
+    frame = pd.DataFrame(rows).drop(columns='geometry', errors='ignore')
+    frame.insert(0, 'geometry', build_geometries([feature.get('geometry') for feature in features]))
+    return gpd.GeoDataFrame(frame, geometry='geometry', crs=crs)
+
+
+def _projected_geodataframe(features: list, columns: Sequence[str], crs) -> gpd.GeoDataFrame:
+    # Same column semantics as GeoDataFrame.from_features: a column exists when
+    # any feature has the key, and features without it get NaN.
+    values = {key: [] for key in columns}
+    present = set()
+    geometries = []
+    for feature in features:
+        props = feature.get('properties') or {}
+        for key, column in values.items():
+            if key in props:
+                present.add(key)
+                column.append(props[key])
+            else:
+                column.append(np.nan)
+        geometries.append(feature.get('geometry'))
+    frame = {key: column for key, column in values.items() if key in present}
+    return gpd.GeoDataFrame(frame, geometry=build_geometries(geometries), crs=crs)
+
+# Scalars json.dumps always accepts; object columns holding only these need no per-value check.
+_JSON_SCALARS = (str, int, float, bool, type(None))
+_JSON_INFERRED_DTYPES = {'empty', 'string', 'integer', 'floating', 'mixed-integer-float', 'boolean'}
+
+
+def _first_non_serializable(frame: pd.DataFrame) -> Optional[Tuple[int, str, Exception]]:
+    """Find the first (row position, column, error) whose value ``json.dumps`` rejects.
+
+    Equivalent to dumping ``row.to_dict()`` for every row, but decided per
+    column: numeric, boolean and string dtypes are skipped outright, object
+    columns of plain scalars are recognised by ``infer_dtype``, and only the
+    remaining columns are checked value by value. Among offending cells the
+    earliest row wins, then the leftmost column, like the row-wise dump.
+    """
+    first = None
+    for col_pos, column in enumerate(frame.columns):
+        series = frame.iloc[:, col_pos]
+        if series.dtype == object:
+            if pd.api.types.infer_dtype(series, skipna=True) in _JSON_INFERRED_DTYPES:
+                continue
+        elif (pd.api.types.is_numeric_dtype(series.dtype) or pd.api.types.is_bool_dtype(series.dtype)
+              or pd.api.types.is_string_dtype(series.dtype)):
+            continue
+        stop = len(series) if first is None else first[0] + 1
+        for row, value in enumerate(series.array[:stop]):
+            if type(value) in _JSON_SCALARS:
+                continue
+            try:
+                json.dumps(value.item() if isinstance(value, np.generic) else value)
+            except (TypeError, ValueError) as e:
+                if first is None or row < first[0]:
+                    first = (row, column, e)
+                break
+    return first
+
 
 _ADDITIONAL_PROPERTIES_RE = re.compile(
     r"Additional properties are not allowed \('(?P<tag>[^']+)' was unexpected\)"
@@ -159,14 +242,20 @@ def _has_enum_context(err, schema) -> bool:
     return _friendly_type_message(err, schema) is not None
 
 
-def _instance_path_str(err) -> str:
-    """Render jsonschema instance path as a readable JSON path."""
+def _instance_path_str(err, feature_index: Optional[int] = None) -> str:
+    """Render jsonschema instance path as a readable JSON path.
+
+    ``feature_index``, if given, replaces the index after ``features``
+    (for features validated on their own in a one-feature document).
+    """
     path = list(getattr(err, "instance_path", []) or [])
     if not path:
         return ""
 
     parts = []
-    for seg in path:
+    for i, seg in enumerate(path):
+        if feature_index is not None and isinstance(seg, int) and i > 0 and path[i - 1] == "features":
+            seg = feature_index
         if isinstance(seg, int):
             if parts:
                 parts[-1] = f"{parts[-1]}[{seg}]"
@@ -177,16 +266,17 @@ def _instance_path_str(err) -> str:
     return ".".join(parts)
 
 
-def _with_path(err, msg: str) -> str:
-    path = _instance_path_str(err)
+def _with_path(err, msg: str, feature_index: Optional[int] = None) -> str:
+    path = _instance_path_str(err, feature_index)
     if not path:
         return msg
     return f"{msg} (at: {path})"
 
 
-def _pretty_message(err, schema) -> str:
+def _pretty_message(err, schema, feature_index: Optional[int] = None) -> str:
     """
     Convert a jsonschema_rs error to a concise, user-friendly string.
+    ``feature_index`` overrides the feature index shown in the error's path.
 
     Special handling:
       - Enum  → compact message
@@ -228,7 +318,8 @@ def _pretty_message(err, schema) -> str:
 
             if required:
                 props = ", ".join(sorted(required))
-                return _with_path(err, _add_additional_properties_hint(f"must include one of: {props}"))
+                return _with_path(err, _add_additional_properties_hint(f"must include one of: {props}"),
+                                  feature_index)
         except Exception:
             pass
 
@@ -242,7 +333,7 @@ def _pretty_message(err, schema) -> str:
         return _add_additional_properties_hint(friendly_type)
 
     default_msg = (getattr(err, "message", "") or "").split("\n")[0]
-    return _with_path(err, _add_additional_properties_hint(default_msg))
+    return _with_path(err, _add_additional_properties_hint(default_msg), feature_index)
 
 
 def _rank_for(err) -> tuple:
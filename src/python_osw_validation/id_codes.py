@@ -0,0 +1,88 @@
+"""Dense integer codes for ``_id`` values.
+
+Uniqueness and cross-file reference checks factorize the ids once into
+integer codes (``pandas.factorize``) and work on those arrays with NumPy,
+instead of building Python sets of id strings and diffing them.
+"""
+
+from typing import Any, List, Sequence
+
+import numpy as np
+import pandas as pd
+
+
+def _as_array(values: Sequence[Any]) -> np.ndarray:
+    if isinstance(values, np.ndarray) and values.dtype == object and values.ndim == 1:
+        return values
+    if isinstance(values, (pd.Series, pd.Index)):
+        return values.to_numpy(dtype=object)
+    # fromiter keeps list values (e.g. _w_id entries) as single elements.
+    return np.fromiter(values, dtype=object, count=len(values))
+
+
+def _stringify_unhashable(values: np.ndarray) -> np.ndarray:
+    return np.fromiter((str(v) if isinstance(v, (list, dict, set)) else v for v in values),
+                       dtype=object, count=len(values))
+
+
+def _factorize(values: np.ndarray, **kwargs):
+    try:
+        return pd.factorize(values, **kwargs)
+    except TypeError:
+        # Unhashable entries (e.g. lists) are compared by their string form.
+        return pd.factorize(_stringify_unhashable(values), **kwargs)
+
+
+def non_null(values: Sequence[Any]) -> np.ndarray:
+    """Object array of ``values`` without None/NaN entries."""
+    values = _as_array(values)
+    return values[~pd.isna(values)] if len(values) else values
+
+
+def duplicated_ids(values: Sequence[Any]) -> List[Any]:
+    """Values occurring more than once, in first-seen order.
+
+    Missing values count as equal to each other, like ``DataFrame.duplicated``.
+    """
+    values = _as_array(values)
+    if len(values) == 0:
+        return []
+    codes, uniques = _factorize(values, use_na_sentinel=False)
+    counts = np.bincount(codes, minlength=len(uniques))
+    return list(np.asarray(uniques, dtype=object)[counts > 1])
+
+
+def unique_in_order(values: Sequence[Any]) -> List[Any]:
+    """Distinct ``values`` in first-seen order."""
+    values = _as_array(values)
+    if len(values) == 0:
+        return []
+    return list(np.asarray(_factorize(values)[1], dtype=object))
+
+
+class IdCodes:
+    """Known ids (e.g. every node ``_id``) interned as codes ``0..n-1``.
+
+    Reference arrays are encoded by factorizing them together with the known
+    ids in one pass: because ``factorize`` numbers values in first-seen order,
+    any code ``>= len(self)`` is a value that is not a known id.
+    """
+
+    def __init__(self, ids: Sequence[Any]):
+        _, uniques = _factorize(non_null(ids))
+        self._uniques = np.asarray(uniques, dtype=object)
+
+    def __len__(self) -> int:
+        return len(self._uniques)
+
+    def encode(self, *arrays: Sequence[Any]) -> List[np.ndarray]:
+        """Codes of each array's values; -1 for unknown ids and missing values."""
+        arrays = [_as_array(values) for values in arrays]
+        known = len(self._uniques)
+        codes, _ = _factorize(np.concatenate([self._uniques, *arrays]))
+        codes = codes[known:]
+        codes[codes >= known] = -1
+        return np.split(codes, np.cumsum([len(values) for values in arrays])[:-1])
+
+
+__all__ = ["IdCodes", "duplicated_ids", "non_null", "unique_in_order"]
@@ -0,0 +1,460 @@
+"""Incremental re-validation from feature-level diffs.
+
+``OSWValidation.build_baseline()`` validates every feature of an archive
+once and returns a ``Baseline``. For each dataset file, it keeps each
+feature's ``_id``, references, geometry and issues. It also keeps the
+indexes the cross-file checks need: ``_id`` → slots per file, and node
+``_id`` → the edge and zone features that reference it.
+
+``OSWValidation.revalidate(baseline, diffs)`` applies ``FeatureDiff``s
+(added, modified and deleted features per file). It schema-validates only
+the changed features. Duplicate ids, references, geometry mappings and
+validity are rechecked only for features that changed, or that reference a
+changed node (e.g. edges whose ``_u_id`` points at a moved node). The work
+is proportional to the diff, not to the dataset.
+
+A feature keeps its slot, which is its position in the baseline file.
+Added features get new slots at the end and deleted slots stay empty, so
+an issue's ``feature_index`` is stable across diffs. Modified and deleted
+features are matched to the first live feature with the same ``_id``.
+
+``Baseline.save`` writes an ``.npz`` archive of plain arrays (geometries as
+WKB) and one JSON document (ids, references, issues); ``Baseline.load``
+reads it without unpickling anything, so baseline files can be passed
+between runs and hosts.
+"""
+
+import bisect
+import json
+import math
+import zipfile
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Sequence, Set, Tuple
+
+import numpy as np
+import shapely
+from shapely.geometry import shape
+
+from .feature_table import FeatureTable, _pack_wkb, _unpack_wkb
+from .issues import NO_FEATURE_ID, Issue, IssueList
+from .validity import evaluate_validity
+
+# Issue categories of a feature, in reporting order
+_CATEGORIES = ('schema', 'ids', 'references', 'mapping', 'validity')
+_REFERENCE_FIELDS = {'edges': ('_u_id', '_v_id'), 'zones': ('_w_id',)}
+
+# Schema issues of one feature, built for the slot it is placed at
+SchemaIssues = Callable[[int], List[Issue]]
+
+# Version of the Baseline.save layout
+_FORMAT = 1
+
+# shapely.get_type_id codes
+_POINT = 0
+_LINESTRING = 1
+_POLYGON = 3
+
+
+def _is_null(value: Any) -> bool:
+    return value is None or (isinstance(value, float) and math.isnan(value))
+
+
+def _hashable(value: Any) -> Any:
+    return str(value) if isinstance(value, (list, dict, set)) else value
+
+
+def _json_default(value: Any) -> Any:
+    if isinstance(value, np.generic):
+        return value.item()
+    raise TypeError(f'{type(value).__name__} is not JSON serializable')
+
+
+def _issue_state(issue: Issue) -> Dict[str, Any]:
+    state = {'filename': issue.filename, 'feature_index': issue.feature_index, 'message': issue.message,
+             'kind': issue.kind, 'listed': issue.listed}
+    if issue.feature_id is not NO_FEATURE_ID:
+        state['feature_id'] = issue.feature_id
+    return state
+
+
+def _issue_from_state(state: Dict[str, Any]) -> Issue:
+    return Issue(state['filename'], state['feature_index'], state['message'],
+                 state.get('feature_id', NO_FEATURE_ID), state['kind'], state['listed'])
+
+
+def _readable(feature: Any) -> Dict[str, Any]:
+    if not isinstance(feature, dict):
+        return {}
+    try:
+        if feature.get('geometry'):
+            shape(feature['geometry'])
+        return feature
+    except Exception:
+        return {**feature, 'geometry': None}
+
+
+def _feature_table(features: Sequence[Any]) -> FeatureTable:
+    """Table of ``features``; geometries shapely cannot read are None (schema validation reports them)."""
+    try:
+        return FeatureTable.from_geojson({'features': features})
+    except Exception:
+        return FeatureTable.from_geojson({'features': [_readable(feature) for feature in features]})
+
+
+class FeatureDiff(NamedTuple):
+    """Changes to one dataset file.
+
+    ``added`` and ``modified`` hold GeoJSON feature dicts; ``deleted`` holds ``_id`` values.
+    """
+    added: Sequence[Dict[str, Any]] = ()
+    modified: Sequence[Dict[str, Any]] = ()
+    deleted: Sequence[Any] = ()
+
+
+class BaselineFile:
+    """Per-slot state and indexes of one dataset file."""
+
+    def __init__(self, key: str, filename: str, header: Dict[str, Any], expected_geometry: Optional[str]):
+        self.key = key
+        self.filename = filename
+        self.header = header
+        self.expected_geometry = expected_geometry
+        self.ids: List[Any] = []
+        self.refs: List[Dict[str, Any]] = []
+        self.geometries: List[Any] = []
+        self.live = bytearray()
+        # _id → live slots, ascending
+        self.slots_by_id: Dict[Any, List[int]] = {}
+        self.file_issues: List[Issue] = []
+        # slot → category → issues
+        self.issues: Dict[int, Dict[str, List[Issue]]] = {}
+
+    def __len__(self) -> int:
+        return sum(self.live)
+
+    def first_slot(self, feature_id: Any) -> Optional[int]:
+        slots = self.slots_by_id.get(_hashable(feature_id))
+        return slots[0] if slots else None
+
+    def __repr__(self) -> str:
+        return f"BaselineFile({self.key!r}, {len(self)} features)"
+
+
+class Baseline:
+    """Validated state of a dataset that feature-level diffs are applied to."""
+
+    def __init__(self, tolerance: float):
+        self.tolerance = tolerance
+        self.files: Dict[str, BaselineFile] = {}
+        # node _id → (file key, slot) of the features referencing it
+        self._referrers: Dict[Any, Set[Tuple[str, int]]] = {}
+
+    def add_file(self, key: str, filename: str, header: Dict[str, Any], expected_geometry: Optional[str],
+                 features: Sequence[Dict[str, Any]], schema_issues: List[SchemaIssues],
+                 file_issues: List[Issue]) -> None:
+        """Add a dataset file; ``check_all`` runs its integrity checks once every file is added."""
+        state = BaselineFile(key, filename, header, expected_geometry)
+        state.file_issues = file_issues
+        self.files[key] = state
+        table = _feature_table(features)
+        for row in range(len(table)):
+            self._place(state, None, table, row, schema_issues[row])
+
+    def check_all(self) -> None:
+        for state in self.files.values():
+            slots = [slot for slot, live in enumerate(state.live) if live]
+            for feature_id in state.slots_by_id:
+                self._check_ids(state, feature_id)
+            for slot in slots:
+                self._check_links(state, slot)
+            self._check_validity(state, slots)
+
+    def validate_diffs(self, diffs: Dict[str, FeatureDiff]) -> None:
+        """Raise ``ValueError`` if a diff targets an unknown file or ``_id``."""
+        for key, diff in diffs.items():
+            state = self.files.get(key)
+            if state is None:
+                raise ValueError(f"Baseline has no {key} file.")
+            for feature in diff.modified:
+                feature_id = (feature.get('properties') or {}).get('_id') if isinstance(feature, dict) else None
+                if _is_null(feature_id) or state.first_slot(feature_id) is None:
+                    raise ValueError(f"Modified {key} feature has no _id in the baseline: {feature_id!r}")
+            for feature_id in diff.deleted:
+                if state.first_slot(feature_id) is None:
+                    raise ValueError(f"Deleted {key} _id is not in the baseline: {feature_id!r}")
+
+    def apply(self, diffs: Dict[str, FeatureDiff], schema_issues: Dict[str, List[SchemaIssues]]) -> None:
+        """Apply ``diffs`` and recheck what they touch.
+
+        ``schema_issues[key]`` builds the schema issues of each of
+        ``diffs[key]``'s added and then modified features.
+        """
+        self.validate_diffs(diffs)
+        changed: Set[Tuple[str, int]] = set()
+        touched_ids: Set[Tuple[str, Any]] = set()
+        for key, diff in diffs.items():
+            state = self.files[key]
+            for feature_id in diff.deleted:
+                slot = state.first_slot(feature_id)
+                touched_ids.add((key, _hashable(feature_id)))
+                self._vacate(state, slot)
+                changed.discard((key, slot))
+            features = [*diff.added, *diff.modified]
+            if not features:
+                continue
+            table = _feature_table(features)
+            slots = [None] * len(diff.added)
+            slots += [state.first_slot(feature['properties']['_id']) for feature in diff.modified]
+            for row, slot in enumerate(slots):
+                if slot is not None:
+                    touched_ids.add((key, _hashable(state.ids[slot])))
+                slot = self._place(state, slot, table, row, schema_issues[key][row])
+                touched_ids.add((key, _hashable(state.ids[slot])))
+                changed.add((key, slot))
+
+        relinked = set(changed)
+        for key, feature_id in touched_ids:
+            self._check_ids(self.files[key], feature_id)
+            if key == 'nodes':
+                relinked.update(self._referrers.get(feature_id, ()))
+        for key, slot in relinked:
+            self._check_links(self.files[key], slot)
+        for key in diffs:
+            self._check_validity(self.files[key], sorted(slot for k, slot in changed if k == key))
+
+    def issue_list(self) -> IssueList:
+        """All current issues, file by file and slot by slot."""
+        issues = IssueList(issue for state in self.files.values() for issue in state.file_issues)
+        for state in self.files.values():
+            for slot in sorted(state.issues):
+                by_category = state.issues[slot]
+                for category in _CATEGORIES:
+                    issues.extend(by_category.get(category, ()))
+        return issues
+
+    def save(self, path: str) -> None:
+        """Write the baseline to ``path`` as an ``.npz`` archive (whatever its extension)."""
+        files, arrays = [], {}
+        for index, state in enumerate(self.files.values()):
+            files.append({
+                'key': state.key, 'filename': state.filename, 'header': state.header,
+                'expected_geometry': state.expected_geometry, 'ids': state.ids, 'refs': state.refs,
+                'file_issues': [_issue_state(issue) for issue in state.file_issues],
+                'issues': [[slot, {category: [_issue_state(issue) for issue in issues]
+                                   for category, issues in by_category.items()}]
+                           for slot, by_category in state.issues.items()],
+            })
+            arrays[f'wkb_sizes_{index}'], blob = _pack_wkb(state.geometries)
+            arrays[f'wkb_{index}'] = np.frombuffer(blob, dtype=np.uint8)
+            arrays[f'live_{index}'] = np.frombuffer(bytes(state.live), dtype=np.uint8)
+        document = {'format': _FORMAT, 'tolerance': self.tolerance, 'files': files}
+        arrays['state'] = np.frombuffer(json.dumps(document, default=_json_default).encode('utf-8'), dtype=np.uint8)
+        with open(path, 'wb') as file:
+            np.savez(file, **arrays)
+
+    @classmethod
+    def load(cls, path: str) -> 'Baseline':
+        """Baseline written by ``save``; raises ``ValueError`` if ``path`` holds anything else."""
+        try:
+            with np.load(path, allow_pickle=False) as archive:
+                document = json.loads(archive['state'].tobytes())
+                if document.get('format') != _FORMAT:
+                    raise ValueError(f"unsupported format {document.get('format')!r}")
+                baseline = cls(document['tolerance'])
+                for index, file_state in enumerate(document['files']):
+                    baseline._restore_file(file_state, archive[f'wkb_sizes_{index}'],
+                                           archive[f'wkb_{index}'].tobytes(), archive[f'live_{index}'].tobytes())
+        except (ValueError, KeyError, TypeError, AttributeError, OSError, EOFError, zipfile.BadZipFile) as e:
+            raise ValueError(f"{path} does not hold a Baseline: {e}") from e
+        return baseline
+
+    def _restore_file(self, file_state: Dict[str, Any], wkb_sizes: np.ndarray, wkb: bytes, live: bytes) -> None:
+        state = BaselineFile(file_state['key'], file_state['filename'], file_state['header'],
+                             file_state['expected_geometry'])
+        state.ids = file_state['ids']
+        state.refs = file_state['refs']
+        state.geometries = list(_unpack_wkb(wkb_sizes, wkb))
+        state.live = bytearray(live)
+        if not len(state.ids) == len(state.refs) == len(state.geometries) == len(state.live):
+            raise ValueError(f"{state.key} columns differ in length")
+        state.file_issues = [_issue_from_state(issue) for issue in file_state['file_issues']]
+        state.issues = {slot: {category: [_issue_from_state(issue) for issue in issues]
+                               for category, issues in by_category.items()}
+                        for slot, by_category in file_state['issues']}
+        self.files[state.key] = state
+        # The indexes are rebuilt, as _place builds them
+        for slot, is_live in enumerate(state.live):
+            if not is_live:
+                continue
+            if not _is_null(state.ids[slot]):
+                state.slots_by_id.setdefault(_hashable(state.ids[slot]), []).append(slot)
+            for _, ref in self._references(state, slot):
+                self._referrers.setdefault(_hashable(ref), set()).add((state.key, slot))
+
+    def __repr__(self) -> str:
+        files = ', '.join(f"{key}={len(state)}" for key, state in self.files.items())
+        return f"Baseline({files})"
+
+    # -- slots --------------------------------------------------------------
+
+    def _place(self, state: BaselineFile, slot: Optional[int], table: FeatureTable, row: int,
+               schema_issues: SchemaIssues) -> int:
+        """Store ``table[row]`` at ``slot`` (a new slot if None) and index it."""
+        if slot is None:
+            slot = len(state.live)
+            state.ids.append(None)
+            state.refs.append({})
+            state.geometries.append(None)
+            state.live.append(0)
+        else:
+            self._vacate(state, slot)
+        columns = table.columns
+        feature_id = table['_id'][row] if '_id' in columns else None
+        state.ids[slot] = feature_id
+        state.refs[slot] = {field: table[field][row] for field in _REFERENCE_FIELDS.get(state.key, ())
+                            if field in columns and not _is_null(table[field][row])}
+        state.geometries[slot] = table.geometry[row]
+        state.live[slot] = 1
+        if not _is_null(feature_id):
+            bisect.insort(state.slots_by_id.setdefault(_hashable(feature_id), []), slot)
+        for _, ref in self._references(state, slot):
+            self._referrers.setdefault(_hashable(ref), set()).add((state.key, slot))
+        self._set_issues(state, slot, 'schema', schema_issues(slot))
+        return slot
+
+    def _vacate(self, state: BaselineFile, slot: int) -> None:
+        feature_id = state.ids[slot]
+        if not _is_null(feature_id):
+            slots = state.slots_by_id[_hashable(feature_id)]
+            slots.remove(slot)
+            if not slots:
+                del state.slots_by_id[_hashable(feature_id)]
+        for _, ref in self._references(state, slot):
+            referrers = self._referrers.get(_hashable(ref))
+            if referrers is not None:
+                referrers.discard((state.key, slot))
+                if not referrers:
+                    del self._referrers[_hashable(ref)]
+        state.ids[slot] = None
+        state.refs[slot] = {}
+        state.geometries[slot] = None
+        state.live[slot] = 0
+        state.issues.pop(slot, None)
+
+    def _references(self, state: BaselineFile, slot: int) -> Iterator[Tuple[str, Any]]:
+        for field, value in state.refs[slot].items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for ref in values:
+                if not _is_null(ref):
+                    yield field, ref
+
+    def _set_issues(self, state: BaselineFile, slot: int, category: str, issues: List[Issue]) -> None:
+        if issues:
+            state.issues.setdefault(slot, {})[category] = issues
+        elif slot in state.issues:
+            state.issues[slot].pop(category, None)
+            if not state.issues[slot]:
+                del state.issues[slot]
+
+    # -- checks -------------------------------------------------------------
+
+    def _check_ids(self, state: BaselineFile, feature_id: Any) -> None:
+        """Every live slot after the first with ``feature_id`` is a duplicate."""
+        for position, slot in enumerate(state.slots_by_id.get(feature_id, ())):
+            issues = []
+            if position > 0:
+                issues.append(Issue(state.key, slot, f"{state.key} id '{state.ids[slot]}' : duplicate _id.",
+                                    feature_id=state.ids[slot]))
+            self._set_issues(state, slot, 'ids', issues)
+
+    def _check_links(self, state: BaselineFile, slot: int) -> None:
+        """References and geometry mapping of an edge or zone."""
+        if state.key not in _REFERENCE_FIELDS or not state.live[slot]:
+            return
+        nodes = self.files.get('nodes')
+        references, mapping = [], []
+        if nodes is not None and nodes.slots_by_id:
+            feature_id = state.ids[slot]
+            for field, ref in self._references(state, slot):
+                if _hashable(ref) not in nodes.slots_by_id:
+                    references.append(Issue(
+                        state.key, slot, f"{state.key} id '{feature_id}' : {field} '{ref}' is not an _id in nodes.",
+                        feature_id=feature_id,
+                    ))
+            if state.key == 'edges':
+                mapping = self._edge_mapping_issues(state, slot)
+            else:
+                mapping = self._zone_mapping_issues(state, slot)
+        self._set_issues(state, slot, 'references', references)
+        self._set_issues(state, slot, 'mapping', mapping)
+
+    def _node_coord(self, node_id: Any) -> Optional[Tuple[float, float]]:
+        """Coordinate of the last live Point node with ``node_id``."""
+        nodes = self.files['nodes']
+        for slot in reversed(nodes.slots_by_id.get(_hashable(node_id), ())):
+            geometry = nodes.geometries[slot]
+            if geometry is not None and shapely.get_type_id(geometry) == _POINT:
+                return float(shapely.get_x(geometry)), float(shapely.get_y(geometry))
+        return None
+
+    def _close(self, a: Tuple[float, float], b: Tuple[float, float]) -> bool:
+        return abs(a[0] - b[0]) <= self.tolerance and abs(a[1] - b[1]) <= self.tolerance
+
+    def _edge_mapping_issues(self, state: BaselineFile, slot: int) -> List[Issue]:
+        geometry = state.geometries[slot]
+        if (geometry is None or shapely.get_type_id(geometry) != _LINESTRING
+                or shapely.get_num_coordinates(geometry) == 0):
+            return []
+        coords = shapely.get_coordinates(geometry)
+        edge_id = state.ids[slot] if not _is_null(state.ids[slot]) else slot
+        issues = []
+        for field, label, xy in (('_u_id', 'start', coords[0]), ('_v_id', 'end', coords[-1])):
+            ref = state.refs[slot].get(field)
+            node = None if ref is None else self._node_coord(ref)
+            endpoint = (float(xy[0]), float(xy[1]))
+            if node is not None and not self._close(endpoint, node):
+                issues.append(Issue(
+                    'edges', slot,
+                    f"edges id '{edge_id}' : {label} coordinate {endpoint} does not match "
+                    f"node id '{ref}' coordinate {node} ({field} mismatch).",
+                    listed=False,
+                ))
+        return issues
+
+    def _zone_mapping_issues(self, state: BaselineFile, slot: int) -> List[Issue]:
+        geometry = state.geometries[slot]
+        if geometry is None or shapely.get_type_id(geometry) != _POLYGON:
+            return []
+        ring = shapely.get_coordinates(shapely.get_exterior_ring(geometry))
+        zone_id = state.ids[slot] if not _is_null(state.ids[slot]) else slot
+        issues = []
+        for _, ref in self._references(state, slot):
+            node = self._node_coord(ref)
+            if node is None:
+                continue
+            if not np.any((np.abs(ring[:, 0] - node[0]) <= self.tolerance)
+                          & (np.abs(ring[:, 1] - node[1]) <= self.tolerance)):
+                issues.append(Issue(
+                    'zones', slot,
+                    f"zones id '{zone_id}' : node id '{ref}' coordinate {node} is not a vertex "
+                    f"of the zone polygon geometry (_w_id coordinate mismatch).",
+                    listed=False,
+                ))
+        return issues
+
+    def _check_validity(self, state: BaselineFile, slots: List[int]) -> None:
+        if not slots:
+            return
+        geometries = np.empty(len(slots), dtype=object)
+        geometries[:] = [state.geometries[slot] for slot in slots]
+        report = evaluate_validity(geometries, state.expected_geometry, threads=1, reasons=True)
+        reasons = dict(zip(report.invalid.tolist(), report.reasons))
+        for position, slot in enumerate(slots):
+            issues = []
+            if position in reasons:
+                feature_id = state.ids[slot] if not _is_null(state.ids[slot]) else slot
+                issues.append(Issue(state.key, slot,
+                                    f"{state.key} id '{feature_id}' : invalid geometry ({reasons[position]})."))
+            self._set_issues(state, slot, 'validity', issues)
+
+
+__all__ = ["Baseline", "BaselineFile", "FeatureDiff"]
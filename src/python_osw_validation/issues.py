@@ -0,0 +1,160 @@
+"""Compact storage for per-feature validation issues.
+
+An issue used to be a dict (``filename``, ``feature_index``,
+``error_message`` and sometimes ``feature_id``) plus a one-element message
+list, a few hundred bytes of container overhead each. ``IssueList`` keeps
+the same fields in parallel columns instead, with filenames and schema error
+kinds interned, and only builds the dicts when an issue is read. With
+``max_errors`` in the hundreds of thousands that is several times less
+memory for the same messages.
+"""
+
+import sys
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+
+class _NoFeatureId:
+    """Marks issues without a ``feature_id`` key (distinct from ``feature_id=None``)."""
+
+    __slots__ = ()
+
+    def __repr__(self) -> str:
+        return 'NO_FEATURE_ID'
+
+
+NO_FEATURE_ID = _NoFeatureId()
+
+_DICT_KEYS = frozenset(('filename', 'feature_index', 'error_message', 'feature_id'))
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    return sys.intern(value) if type(value) is str else value
+
+
+class Issue:
+    """One issue record.
+
+    ``listed`` tells whether ``error_message`` is materialised as a
+    one-element list (schema and per-feature issues) or as the bare string
+    (``log_errors`` summaries). ``kind`` is the schema error kind used for
+    filtering and is not part of the dict view.
+    """
+
+    __slots__ = ('filename', 'feature_index', 'message', 'feature_id', 'kind', 'listed')
+
+    def __init__(self, filename: Optional[str], feature_index: Optional[int], message: Any,
+                 feature_id: Any = NO_FEATURE_ID, kind: Optional[str] = None, listed: bool = True):
+        self.filename = _intern(filename)
+        self.feature_index = feature_index
+        self.message = message
+        self.feature_id = feature_id
+        self.kind = _intern(kind)
+        self.listed = listed
+
+    @classmethod
+    def from_dict(cls, issue: Dict[str, Any]) -> Optional['Issue']:
+        """Record for a dict in the standard shape, or None if it has other keys or messages."""
+        if not _DICT_KEYS.issuperset(issue) or 'error_message' not in issue:
+            return None
+        message = issue['error_message']
+        listed = type(message) is list
+        if listed:
+            if len(message) != 1:
+                return None
+            message = message[0]
+        return cls(issue.get('filename'), issue.get('feature_index'), message,
+                   issue.get('feature_id', NO_FEATURE_ID), listed=listed)
+
+    def to_dict(self) -> Dict[str, Any]:
+        issue = {'filename': self.filename, 'feature_index': self.feature_index}
+        if self.feature_id is not NO_FEATURE_ID:
+            issue['feature_id'] = self.feature_id
+        issue['error_message'] = [self.message] if self.listed else self.message
+        return issue
+
+    def __repr__(self) -> str:
+        return f"Issue({self.to_dict()!r})"
+
+
+class IssueList:
+    """Append-only, list-like container of issues stored column-wise.
+
+    Reading an item (index, iteration) returns a fresh dict in the legacy
+    shape, so editing it does not change the stored issue, and items cannot
+    be assigned; ``to_list()`` returns plain dicts to edit. Slicing returns
+    another ``IssueList``. Dicts that do not fit the standard shape are kept
+    as they are.
+    """
+
+    __slots__ = ('_filenames', '_feature_indexes', '_messages', '_feature_ids', '_kinds', '_listed', '_raw')
+
+    def __init__(self, issues: Iterable[Union[Issue, Dict[str, Any]]] = ()):
+        self._filenames: List[Optional[str]] = []
+        self._feature_indexes: List[Optional[int]] = []
+        self._messages: List[Any] = []
+        self._feature_ids: List[Any] = []
+        self._kinds: List[Optional[str]] = []
+        self._listed = bytearray()
+        self._raw: Dict[int, Dict[str, Any]] = {}
+        self.extend(issues)
+
+    def append(self, issue: Union[Issue, Dict[str, Any]]) -> None:
+        if isinstance(issue, dict):
+            record = Issue.from_dict(issue)
+            if record is None:
+                self._raw[len(self._messages)] = issue
+                record = Issue(None, None, None)
+            issue = record
+        self._filenames.append(issue.filename)
+        self._feature_indexes.append(issue.feature_index)
+        self._messages.append(issue.message)
+        self._feature_ids.append(issue.feature_id)
+        self._kinds.append(issue.kind)
+        self._listed.append(issue.listed)
+
+    def extend(self, issues: Iterable[Union[Issue, Dict[str, Any]]]) -> None:
+        for issue in issues:
+            self.append(issue)
+
+    def record(self, index: int) -> Issue:
+        """The stored ``Issue`` at ``index`` (without building a dict)."""
+        index = range(len(self))[index]
+        return Issue(self._filenames[index], self._feature_indexes[index], self._messages[index],
+                     self._feature_ids[index], self._kinds[index], bool(self._listed[index]))
+
+    def records(self) -> Iterator[Issue]:
+        return (self.record(i) for i in range(len(self)))
+
+    def _dict_at(self, index: int) -> Dict[str, Any]:
+        raw = self._raw.get(index)
+        return raw if raw is not None else self.record(index).to_dict()
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            part = IssueList()
+            for i in range(len(self))[index]:
+                part.append(self._raw[i] if i in self._raw else self.record(i))
+            return part
+        return self._dict_at(range(len(self))[index])
+
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        return (self._dict_at(i) for i in range(len(self)))
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (IssueList, list)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def to_list(self) -> List[Dict[str, Any]]:
+        return list(self)
+
+    def __repr__(self) -> str:
+        return f"IssueList({len(self)} issues)"
+
+
+__all__ = ["Issue", "IssueList", "NO_FEATURE_ID"]
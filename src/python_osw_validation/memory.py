@@ -0,0 +1,96 @@
+"""Memory budget accounting for ``validate(memory_budget=...)``.
+
+Footprints are estimated from file sizes before anything is allocated, so a
+run that would not fit stops with a "Memory budget exceeded" result instead
+of being killed by the container's OOM killer. The factors are multiples of
+the GeoJSON file size, measured with ``tracemalloc`` on the test assets and
+rounded up:
+
+* a parsed document (plus the peak while a table is built from it) takes
+  3-6x the file size → ``DOCUMENT_FACTOR``;
+* a ``FeatureTable`` kept for the cross-file checks takes 0.3-0.7x
+  → ``TABLE_FACTOR``;
+* id codes, reference arrays and the node index built by the integrity
+  checks take a fraction of the resident tables → ``CHECKS_FACTOR``.
+"""
+
+from contextlib import contextmanager
+from typing import Iterator, Optional
+
+DOCUMENT_FACTOR = 6.0
+TABLE_FACTOR = 0.75
+CHECKS_FACTOR = 0.5
+
+
+def _mb(nbytes: float) -> str:
+    return f"{nbytes / 2 ** 20:.1f} MB"
+
+
+class MemoryBudgetExceeded(Exception):
+    """Raised when a stage's estimated footprint would exceed the budget."""
+
+    def __init__(self, stage: str, filename: Optional[str], needed: int, in_use: int, budget: int):
+        self.stage = stage
+        self.filename = filename
+        self.needed = needed
+        self.in_use = in_use
+        self.budget = budget
+        target = f"{stage} of '{filename}'" if filename else stage
+        super().__init__(
+            f"Memory budget exceeded: {target} needs an estimated {_mb(needed)} with {_mb(in_use)} "
+            f"already in use, but the budget is {_mb(budget)}."
+        )
+
+
+class MemoryBudget:
+    """Running total of estimated bytes held by a validation run.
+
+    ``limit=None`` only keeps the running total and never raises.
+    """
+
+    def __init__(self, limit: Optional[int] = None):
+        if limit is not None and limit <= 0:
+            raise ValueError('memory_budget must be a positive number of bytes')
+        self.limit = None if limit is None else int(limit)
+        self.in_use = 0
+        self.peak = 0
+
+    def reserve(self, stage: str, filename: Optional[str], nbytes: float) -> int:
+        """Account for ``nbytes`` more, or raise ``MemoryBudgetExceeded`` if they do not fit."""
+        nbytes = int(nbytes)
+        if self.limit is not None and self.in_use + nbytes > self.limit:
+            raise MemoryBudgetExceeded(stage, filename, nbytes, self.in_use, self.limit)
+        self.in_use += nbytes
+        self.peak = max(self.peak, self.in_use)
+        return nbytes
+
+    def release(self, nbytes: int) -> None:
+        self.in_use = max(0, self.in_use - nbytes)
+
+    @contextmanager
+    def hold(self, stage: str, filename: Optional[str], nbytes: float) -> Iterator[int]:
+        """Reserve ``nbytes`` for the duration of a block (e.g. one parsed document)."""
+        reserved = self.reserve(stage, filename, nbytes)
+        try:
+            yield reserved
+        finally:
+            self.release(reserved)
+
+
+def estimate_document_bytes(file_size: int) -> int:
+    return int(file_size * DOCUMENT_FACTOR)
+
+
+def estimate_table_bytes(file_size: int) -> int:
+    return int(file_size * TABLE_FACTOR)
+
+
+__all__ = [
+    "CHECKS_FACTOR",
+    "DOCUMENT_FACTOR",
+    "MemoryBudget",
+    "MemoryBudgetExceeded",
+    "TABLE_FACTOR",
+    "estimate_document_bytes",
+    "estimate_table_bytes",
+]
@@ -0,0 +1,135 @@
+"""On-disk, memory-mapped node indexes keyed by nodes file content.
+
+Reference and geometry mapping checks need two tables built from the
+nodes file: the set of node ``_id``s and the id → (lon, lat) index of Point
+nodes. For a large region both take a while to build, and the same
+regions are validated again and again. ``NodeStore`` keeps them as plain
+``.npy`` arrays (sorted UTF-8 or int64 ids, float64 coordinates) in one
+directory per nodes file, and loads them memory-mapped: a lookup opens
+three small headers and the pages binary searches touch, instead of
+factorizing and sorting every id.
+
+Keys are cheap fingerprints (the ZIP CRC32 and size), which are not
+collision resistant, so an entry can also record the SHA-256 of the nodes
+file it was built from; ``get`` with a ``digest`` only returns an entry
+built from that content.
+
+A stored entry also serves as a nodes baseline: an upload of edges or
+zones alone can be checked against the nodes of an earlier run (see
+``OSWValidation.validate(nodes_baseline=...)``).
+"""
+
+import os
+import shutil
+import tempfile
+from typing import List, NamedTuple, Optional, Sequence
+
+import numpy as np
+
+from .geometry_mapping_validator import NodeIndex
+
+# Array files of one entry, per index
+_INDEXES = ('coords', 'ids')
+_ARRAYS = ('keys', 'lon', 'lat')
+# SHA-256 of the nodes file an entry was built from
+_DIGEST = 'digest'
+
+
+class IndexCodes:
+    """``IdCodes`` over a ``NodeIndex`` of known ids: an id's code is its position in the index."""
+
+    def __init__(self, index: NodeIndex):
+        self._index = index
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def encode(self, *arrays: Sequence) -> List[np.ndarray]:
+        """Codes of each array's values; -1 for unknown ids and missing values."""
+        return [self._index.positions(values) for values in arrays]
+
+
+class StoredNodes(NamedTuple):
+    """The node tables of one nodes file."""
+    # Point nodes with an _id, duplicated ids keeping the last one
+    coords: NodeIndex
+    # Every non-null _id (coordinates unused)
+    ids: NodeIndex
+
+    @property
+    def id_codes(self) -> IndexCodes:
+        return IndexCodes(self.ids)
+
+
+class NodeStore:
+    """Directory of ``StoredNodes`` entries, one subdirectory of ``.npy`` files per key."""
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+
+    def _entry_dir(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+
+    def get(self, key: str, digest: Optional[str] = None) -> Optional[StoredNodes]:
+        """Memory-mapped entry stored under ``key``; None if missing, unreadable or,
+        with ``digest``, built from other content."""
+        entry_dir = self._entry_dir(key)
+        try:
+            if digest is not None:
+                with open(os.path.join(entry_dir, _DIGEST), encoding='ascii') as file:
+                    if file.read() != digest:
+                        return None
+            return StoredNodes(*(
+                NodeIndex.from_arrays(*(np.load(os.path.join(entry_dir, f'{index}.{name}.npy'), mmap_mode='r')
+                                        for name in _ARRAYS))
+                for index in _INDEXES
+            ))
+        except (OSError, ValueError):
+            return None
+
+    def put(self, key: str, nodes: StoredNodes, digest: Optional[str] = None) -> bool:
+        """Store ``nodes`` under ``key``, with the ``digest`` of their nodes file if given.
+
+        False if an index has no array form, writing failed or ``key`` already
+        holds an entry built from other content.
+        """
+        try:
+            arrays = [index.to_arrays() for index in nodes]
+        except ValueError:
+            return False
+        try:
+            staging = tempfile.mkdtemp(prefix='.tmp-', dir=self.directory)
+        except OSError:
+            return False
+        try:
+            for index, index_arrays in zip(_INDEXES, arrays):
+                for name in _ARRAYS:
+                    np.save(os.path.join(staging, f'{index}.{name}.npy'), index_arrays[name])
+            if digest is not None:
+                with open(os.path.join(staging, _DIGEST), 'w', encoding='ascii') as file:
+                    file.write(digest)
+            # Readers see a complete entry or none
+            os.replace(staging, self._entry_dir(key))
+        except OSError:
+            # Stored only if a concurrent writer of the same content won the rename
+            return self.get(key, digest) is not None
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
+        return True
+
+    def __contains__(self, key: str) -> bool:
+        return os.path.isdir(self._entry_dir(key))
+
+    def __len__(self) -> int:
+        return sum(1 for name in os.listdir(self.directory) if not name.startswith('.'))
+
+    def clear(self) -> None:
+        for name in os.listdir(self.directory):
+            shutil.rmtree(os.path.join(self.directory, name), ignore_errors=True)
+
+    def __repr__(self) -> str:
+        return f"NodeStore({self.directory!r})"
+
+
+__all__ = ["IndexCodes", "NodeStore", "StoredNodes"]
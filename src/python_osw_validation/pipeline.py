@@ -0,0 +1,94 @@
+"""Background prefetching of dataset files for pipelined validation.
+
+``FilePrefetcher`` reads and parses the next file(s) on a worker thread
+while the caller validates the current one. Parsed documents travel
+through a bounded queue, so at most ``depth`` documents wait in memory
+besides the one being validated and the one being parsed.
+"""
+
+import queue
+import threading
+from typing import Any, Callable, Iterator, List, NamedTuple, Optional
+
+_DONE = object()
+
+
+class PrefetchedFile(NamedTuple):
+    path: str
+    data: Any
+    error: Optional[BaseException]
+
+
+class FilePrefetcher:
+    """Iterate ``PrefetchedFile`` items, parsed ahead on a daemon thread.
+
+    Read errors are not raised on the worker; they are handed to the
+    consumer in ``PrefetchedFile.error`` so it can report them in order.
+    Use as a context manager so an early ``break`` stops the worker.
+    """
+
+    def __init__(self, paths: List[str], read: Callable[[str], Any], depth: int = 2):
+        if depth < 1:
+            raise ValueError('depth must be at least 1')
+        self._paths = list(paths)
+        self._read = read
+        self._queue: 'queue.Queue' = queue.Queue(maxsize=depth)
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def __enter__(self) -> 'FilePrefetcher':
+        self.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def start(self) -> None:
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name='osw-prefetch', daemon=True)
+            self._thread.start()
+
+    def _put(self, item) -> bool:
+        # Block on the bounded queue, but wake up regularly to honour close().
+        while not self._stop.is_set():
+            try:
+                self._queue.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def _run(self) -> None:
+        for path in self._paths:
+            if self._stop.is_set():
+                return
+            try:
+                item = PrefetchedFile(path, self._read(path), None)
+            except Exception as e:
+                item = PrefetchedFile(path, None, e)
+            if not self._put(item):
+                return
+        self._put(_DONE)
+
+    def __iter__(self) -> Iterator[PrefetchedFile]:
+        self.start()
+        while True:
+            item = self._queue.get()
+            if item is _DONE:
+                return
+            yield item
+
+    def close(self) -> None:
+        self._stop.set()
+        # Drop anything still queued so parsed documents can be freed.
+        try:
+            while True:
+                self._queue.get_nowait()
+        except queue.Empty:
+            pass
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+
+__all__ = ["FilePrefetcher", "PrefetchedFile"]
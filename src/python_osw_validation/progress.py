@@ -0,0 +1,110 @@
+"""Progress reporting and cooperative cancellation for validation runs.
+
+``OSWValidation.validate`` reports every stage transition to an optional
+``progress`` callback and polls an optional ``CancellationToken`` between
+stages and inside its per-feature loops, so callers (UIs, job runners) can
+show where a long validation is and abandon it without waiting for it to
+finish. With ``timings=True`` the same stages are also timed (see
+``StageTiming``).
+"""
+
+import threading
+from typing import Callable, NamedTuple, Optional
+
+STAGE_EXTRACT = 'extract'
+STAGE_DISCOVER = 'discover'
+STAGE_SCHEMA = 'schema'
+STAGE_LOAD = 'load'
+STAGE_IDS = 'ids'
+STAGE_REFERENCES = 'references'
+STAGE_GEOMETRY_MAPPING = 'geometry_mapping'
+STAGE_GEOMETRY_VALIDITY = 'geometry_validity'
+STAGE_EXTENSIONS = 'extensions'
+
+STAGES = (
+    STAGE_EXTRACT,
+    STAGE_DISCOVER,
+    STAGE_SCHEMA,
+    STAGE_LOAD,
+    STAGE_IDS,
+    STAGE_REFERENCES,
+    STAGE_GEOMETRY_MAPPING,
+    STAGE_GEOMETRY_VALIDITY,
+    STAGE_EXTENSIONS,
+)
+
+
+class ProgressEvent(NamedTuple):
+    """One stage transition.
+
+    ``status`` is ``'started'`` or ``'finished'``. ``filename`` is set for
+    per-file stages (schema, load, extensions). The counters are only
+    meaningful on ``'finished'`` events.
+    """
+    stage: str
+    status: str
+    filename: Optional[str] = None
+    features_processed: int = 0
+    bytes_processed: int = 0
+
+
+ProgressCallback = Callable[[ProgressEvent], None]
+
+
+class StageTiming(NamedTuple):
+    """Time one stage took, for one file in per-file stages.
+
+    ``wall`` and ``cpu`` are seconds (``time.perf_counter`` and
+    ``time.process_time``). CPU time is the whole process's, so it includes
+    helper threads working during the stage: the validity threads, and in a
+    pipelined run the parsing of the next file.
+    """
+    stage: str
+    filename: Optional[str]
+    wall: float
+    cpu: float
+    features: int = 0
+    bytes: int = 0
+
+
+class ValidationCancelled(Exception):
+    """Raised inside a validation run once its token has been cancelled."""
+
+
+class CancellationToken:
+    """Thread-safe flag a caller flips to stop a running validation."""
+
+    def __init__(self):
+        self._event = threading.Event()
+
+    def cancel(self) -> None:
+        self._event.set()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._event.is_set()
+
+    def raise_if_cancelled(self) -> None:
+        if self._event.is_set():
+            raise ValidationCancelled('Validation cancelled.')
+
+
+class StageCounters:
+    """Mutable counters a stage body fills in before its 'finished' event."""
+
+    __slots__ = ('features', 'bytes')
+
+    def __init__(self):
+        self.features = 0
+        self.bytes = 0
+
+
+__all__ = [
+    "CancellationToken",
+    "ProgressCallback",
+    "ProgressEvent",
+    "STAGES",
+    "StageCounters",
+    "StageTiming",
+    "ValidationCancelled",
+]
@@ -0,0 +1,215 @@
+"""Memoised schema validation of repeated ``properties`` payloads.
+
+Many features of a dataset file carry identical properties apart from
+their ids (thousands of ``{highway: footway, footway: sidewalk}``
+sidewalks), and validating the ``propertiesObject`` subschema, with its
+``anyOf`` over every feature kind, dominates schema validation.
+``MemoisedValidator`` splits the work in two:
+
+* the document, with each feature's properties cut down to the id fields,
+  is validated against the schema with ``propertiesObject`` reduced to the
+  id field subschemas. This covers structure, geometry and ids, per
+  feature;
+* every distinct payload (the properties without the id field values, plus
+  which id fields are present) is validated once against
+  ``propertiesObject``, with placeholder ids. Its errors are replayed for
+  each later feature with the same payload, with instance and schema paths
+  rebased onto that feature and the placeholders in messages replaced by
+  the feature's ids.
+
+Errors come out feature by feature, so a consumer that stops at a cap
+validates only the payloads it reaches. An id field with a bad value is
+reported once by the first part, without the ``anyOf`` summary it would
+also trigger in a full validation.
+
+The split only pays off for invalid files whose payloads repeat: most of
+a valid file's cost is converting the document into the validator, and
+the structure pass still converts every geometry. So a document is first
+checked with the full schema's ``is_valid`` (cheaper than collecting
+errors, and enough for a valid file), and a file whose first
+``SAMPLE_SIZE`` features repeat less than ``MIN_REPEAT_SHARE`` of their
+payloads is then validated in one pass as usual (e.g. edges that each
+carry their own ``length``).
+"""
+
+import copy
+import json
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+import jsonschema_rs
+
+from .helpers import _feature_index_from_error
+
+ID_FIELDS: Tuple[str, ...] = ('_id', '_u_id', '_v_id')
+SAMPLE_SIZE = 1000
+MIN_REPEAT_SHARE = 0.5
+
+# Where the propertiesObject sits in an OSW dataset schema
+_PROPERTIES_PATH: Tuple[str, ...] = ('properties', 'features', 'items', 'properties', 'properties')
+
+
+def _placeholder(field: str) -> str:
+    return f"__osw_memo{field}__"
+
+
+def _properties_schema(schema: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+    node: Any = schema
+    for key in _PROPERTIES_PATH:
+        if not isinstance(node, dict) or key not in node:
+            return None
+        node = node[key]
+    return node if isinstance(node, dict) else None
+
+
+def _id_subschemas(properties_schema: Dict[str, Any]) -> List[Any]:
+    """Every subschema an id field is checked against, in the object and its branches."""
+    found = []
+    objects = [properties_schema]
+    for combinator in ('anyOf', 'oneOf', 'allOf'):
+        objects.extend(branch for branch in properties_schema.get(combinator, []) if isinstance(branch, dict))
+    for obj in objects:
+        fields = obj.get('properties', {})
+        found.extend(fields[field] for field in ID_FIELDS if isinstance(fields, dict) and field in fields)
+    return found
+
+
+def _payload_key(payload: Dict[str, Any], ids: Dict[str, Any]) -> Any:
+    """Hashable identity of a payload and the id fields present.
+
+    Value types are part of the key, so ``1``, ``1.0`` and ``True`` (equal
+    in Python, distinct to JSON Schema) do not share an entry.
+    """
+    try:
+        return tuple(ids), tuple(sorted((key, type(value), value) for key, value in payload.items()))
+    except TypeError:
+        # Lists or objects among the values
+        return tuple(ids), json.dumps(payload, sort_keys=True)
+
+
+def _ids_and_payload(feature: Any) -> Optional[Tuple[Dict[str, Any], Dict[str, Any]]]:
+    props = feature.get('properties') if isinstance(feature, dict) else None
+    if not isinstance(props, dict):
+        return None
+    ids = {field: props[field] for field in ID_FIELDS if field in props}
+    return ids, {key: value for key, value in props.items() if key not in ids}
+
+
+def repeat_share(features: List[Any], sample: int = SAMPLE_SIZE) -> float:
+    """Share of the first ``sample`` features whose payload repeats an earlier one."""
+    keys = set()
+    counted = 0
+    for feature in features[:sample]:
+        split = _ids_and_payload(feature)
+        if split is not None:
+            keys.add(_payload_key(split[1], split[0]))
+            counted += 1
+    return 1 - len(keys) / counted if counted else 0.0
+
+
+class _RebasedError:
+    """A payload error seen through one feature: rebased paths and the feature's ids in the message."""
+
+    def __init__(self, err, instance_prefix: List[Any], schema_prefix: List[Any], ids: Dict[str, Any]):
+        self._err = err
+        self.instance_path = instance_prefix + list(err.instance_path)
+        self.schema_path = schema_prefix + list(err.schema_path)
+        message = err.message
+        for field, value in ids.items():
+            message = message.replace(json.dumps(_placeholder(field)), json.dumps(value, ensure_ascii=False))
+        self.message = message
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._err, name)
+
+
+class MemoisedValidator:
+    """Drop-in for ``jsonschema_rs.Draft7Validator(schema).iter_errors`` with a payload memo.
+
+    Raises ``ValueError`` for schemas it cannot split (no ``propertiesObject``
+    at the usual place, ``$ref``s inside it, or id subschemas that reject
+    the placeholder ids).
+    """
+
+    def __init__(self, schema: Dict[str, Any]):
+        properties_schema = _properties_schema(schema)
+        if properties_schema is None:
+            raise ValueError('schema has no features.items.properties.properties object')
+        if '"$ref"' in json.dumps(properties_schema):
+            raise ValueError('propertiesObject uses $ref')
+        for subschema in _id_subschemas(properties_schema):
+            if not all(jsonschema_rs.is_valid(subschema, _placeholder(field)) for field in ID_FIELDS):
+                raise ValueError('id field subschemas reject the placeholder ids')
+
+        self._schema = schema
+        self._properties_schema = properties_schema
+        self._full: Optional[Any] = None
+        self._structure: Optional[Any] = None
+        self._payloads: Optional[Any] = None
+        self._schema_prefix = list(_PROPERTIES_PATH)
+        self._memo: Dict[Any, List[Any]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def iter_errors(self, document: Any) -> Iterator[Any]:
+        if self._full is None:
+            self._full = jsonschema_rs.Draft7Validator(self._schema)
+        # A valid document costs one conversion and no error collection
+        if self._full.is_valid(document):
+            return
+        features = document.get('features') if isinstance(document, dict) else None
+        if not isinstance(features, list) or repeat_share(features) < MIN_REPEAT_SHARE:
+            yield from self._full.iter_errors(document)
+            return
+        if self._structure is None:
+            self._compile_split()
+        skeleton = {**document, 'features': [self._skeleton(feature) for feature in features]}
+        structural = iter(()) if self._structure.is_valid(skeleton) else self._structure.iter_errors(skeleton)
+        pending = next(structural, None)
+        for index, feature in enumerate(features):
+            while pending is not None and (_feature_index_from_error(pending) or 0) <= index:
+                yield pending
+                pending = next(structural, None)
+            yield from self._payload_errors(index, feature)
+        while pending is not None:
+            yield pending
+            pending = next(structural, None)
+
+    def _compile_split(self) -> None:
+        structure_schema = copy.deepcopy(self._schema)
+        parent = structure_schema
+        for key in _PROPERTIES_PATH[:-1]:
+            parent = parent[key]
+        id_fields = self._properties_schema.get('properties', {})
+        parent[_PROPERTIES_PATH[-1]] = {
+            'type': 'object',
+            'properties': {field: id_fields[field] for field in ID_FIELDS if field in id_fields},
+        }
+        self._structure = jsonschema_rs.Draft7Validator(structure_schema)
+        self._payloads = jsonschema_rs.Draft7Validator(self._properties_schema)
+
+    def _skeleton(self, feature: Any) -> Any:
+        props = feature.get('properties') if isinstance(feature, dict) else None
+        if not isinstance(props, dict):
+            return feature
+        return {**feature, 'properties': {field: props[field] for field in ID_FIELDS if field in props}}
+
+    def _payload_errors(self, index: int, feature: Any) -> Iterator[_RebasedError]:
+        split = _ids_and_payload(feature)
+        if split is None:
+            return
+        ids, payload = split
+        key = _payload_key(payload, ids)
+        errors = self._memo.get(key)
+        if errors is None:
+            self.misses += 1
+            instance = {**payload, **{field: _placeholder(field) for field in ids}}
+            errors = [] if self._payloads.is_valid(instance) else list(self._payloads.iter_errors(instance))
+            self._memo[key] = errors
+        else:
+            self.hits += 1
+        prefix = ['features', index, 'properties']
+        for err in errors:
+            yield _RebasedError(err, prefix, self._schema_prefix, ids)
+
+
+__all__ = ["ID_FIELDS", "MIN_REPEAT_SHARE", "MemoisedValidator", "SAMPLE_SIZE", "repeat_share"]
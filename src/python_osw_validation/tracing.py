@@ -0,0 +1,91 @@
+"""Pluggable tracing of validation runs.
+
+The library opens a span around ``OSWValidation.validate``, every
+validation stage (per file where the stage is per file),
+``ZipFileHandler.extract_zip``, ``ExtractedDataValidator.is_valid`` and
+``OSWValidation.validate_osw_errors``, through the tracer installed with
+``set_tracer``. Attributes carry the file name and, once known, feature,
+byte and error counts.
+
+The default ``Tracer`` is a no-op: every span is one shared object whose
+methods do nothing. To export spans, subclass ``Tracer`` and return your
+backend's span from ``start_span``, wrapped in a ``Span`` subclass if it
+does not already have ``set_attribute`` and the context manager protocol.
+Nothing here depends on a telemetry package.
+"""
+
+from typing import Any, Dict, Optional
+
+# Span names
+SPAN_VALIDATE = 'osw.validate'
+SPAN_STAGE = 'osw.stage.'  # + stage name
+SPAN_EXTRACT_ZIP = 'osw.extract_zip'
+SPAN_DISCOVER_FILES = 'osw.discover_files'
+SPAN_SCHEMA_FILE = 'osw.validate_osw_errors'
+
+# Attribute keys
+ATTR_FILENAME = 'osw.filename'
+ATTR_FEATURES = 'osw.feature_count'
+ATTR_BYTES = 'osw.byte_count'
+ATTR_ERRORS = 'osw.error_count'
+ATTR_ISSUES = 'osw.issue_count'
+ATTR_FILES = 'osw.file_count'
+ATTR_VALID = 'osw.is_valid'
+
+
+class Span:
+    """One traced operation; the base class ignores everything."""
+
+    def set_attribute(self, key: str, value: Any) -> None:
+        pass
+
+    def __enter__(self) -> 'Span':
+        return self
+
+    def __exit__(self, *exc) -> None:
+        # Exceptions inside the span propagate; a backend span may record them here
+        return None
+
+
+_NOOP_SPAN = Span()
+
+
+class Tracer:
+    """Opens spans; the base class is the no-op tracer."""
+
+    def start_span(self, name: str, attributes: Dict[str, Any]) -> Span:
+        """A span, used as a context manager, for ``name`` with initial ``attributes``."""
+        return _NOOP_SPAN
+
+
+_tracer = Tracer()
+
+
+def set_tracer(tracer: Optional[Tracer]) -> None:
+    """Install ``tracer`` process-wide; ``None`` restores the no-op tracer."""
+    global _tracer
+    _tracer = tracer if tracer is not None else Tracer()
+
+
+def get_tracer() -> Tracer:
+    return _tracer
+
+
+__all__ = [
+    "ATTR_BYTES",
+    "ATTR_ERRORS",
+    "ATTR_FEATURES",
+    "ATTR_FILENAME",
+    "ATTR_FILES",
+    "ATTR_ISSUES",
+    "ATTR_VALID",
+    "SPAN_DISCOVER_FILES",
+    "SPAN_EXTRACT_ZIP",
+    "SPAN_SCHEMA_FILE",
+    "SPAN_STAGE",
+    "SPAN_VALIDATE",
+    "Span",
+    "Tracer",
+    "get_tracer",
+    "set_tracer",
+]
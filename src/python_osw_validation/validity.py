@@ -0,0 +1,86 @@
+"""Chunked, multi-threaded geometry validity checks.
+
+Shapely 2 releases the GIL inside its vectorised predicates, so splitting a
+geometry array into chunks and evaluating ``is_valid`` / ``get_type_id`` on
+a thread pool uses several cores for the GEOS work.
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, NamedTuple, Optional
+
+import numpy as np
+import shapely
+
+DEFAULT_CHUNK_SIZE = 10000
+
+# GeoJSON geometry type name -> shapely.get_type_id code
+GEOMETRY_TYPE_IDS = {
+    'Point': 0, 'LineString': 1, 'LinearRing': 2, 'Polygon': 3,
+    'MultiPoint': 4, 'MultiLineString': 5, 'MultiPolygon': 6, 'GeometryCollection': 7,
+}
+
+
+class ValidityReport(NamedTuple):
+    invalid: np.ndarray
+    reasons: Optional[List[str]]
+
+
+def default_thread_count() -> int:
+    return max(1, min(8, os.cpu_count() or 1))
+
+
+def _map_chunks(fn: Callable[[slice], np.ndarray], n: int, threads: int, chunk_size: int) -> List[np.ndarray]:
+    chunks = [slice(start, min(start + chunk_size, n)) for start in range(0, n, chunk_size)]
+    if threads == 1 or len(chunks) <= 1:
+        return [fn(chunk) for chunk in chunks]
+    with ThreadPoolExecutor(max_workers=min(threads, len(chunks)), thread_name_prefix='osw-validity') as pool:
+        return list(pool.map(fn, chunks))
+
+
+def evaluate_validity(geometries: np.ndarray, expected_type: Optional[str] = None,
+                      threads: Optional[int] = None, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                      reasons: bool = False) -> ValidityReport:
+    """Find geometries that are missing, SFA-invalid or not of ``expected_type``.
+
+    Returns the positions of those rows in ascending order and, with
+    ``reasons=True``, one explanation per invalid row: ``'Missing geometry'``,
+    ``'Expected <type>, got <type>'`` or ``shapely.is_valid_reason``.
+    ``threads`` defaults to the CPU count (at most 8).
+    """
+    threads = default_thread_count() if threads is None else threads
+    if threads < 1:
+        raise ValueError('threads must be at least 1')
+    if chunk_size < 1:
+        raise ValueError('chunk_size must be at least 1')
+    geometries = np.asarray(geometries, dtype=object)
+    expected_id = GEOMETRY_TYPE_IDS.get(expected_type, -2) if expected_type else None
+
+    def invalid_in(chunk: slice) -> np.ndarray:
+        part = geometries[chunk]
+        bad = ~shapely.is_valid(part)
+        if expected_id is not None:
+            bad |= shapely.get_type_id(part) != expected_id
+        return np.flatnonzero(bad) + chunk.start
+
+    parts = _map_chunks(invalid_in, len(geometries), threads, chunk_size)
+    invalid = np.concatenate(parts) if parts else np.empty(0, dtype=np.int64)
+    if not reasons:
+        return ValidityReport(invalid, None)
+
+    subset = geometries[invalid]
+    valid_reasons = np.concatenate(_map_chunks(
+        lambda chunk: shapely.is_valid_reason(subset[chunk]), len(subset), threads, chunk_size
+    )) if len(subset) else np.empty(0, dtype=object)
+    explanations: List[str] = []
+    for geom, reason in zip(subset, valid_reasons):
+        if geom is None:
+            explanations.append('Missing geometry')
+        elif expected_type and geom.geom_type != expected_type:
+            explanations.append(f'Expected {expected_type}, got {geom.geom_type}')
+        else:
+            explanations.append(str(reason))
+    return ValidityReport(invalid, explanations)
+
+
+__all__ = ["DEFAULT_CHUNK_SIZE", "GEOMETRY_TYPE_IDS", "ValidityReport", "default_thread_count", "evaluate_validity"]
@@ -3,7 +3,9 @@ import glob
 import shutil
 import tempfile
 import zipfile36 as zipfile
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+from .tracing import ATTR_ERRORS, ATTR_FILENAME, SPAN_EXTRACT_ZIP, get_tracer
 
 
 class ZipFileHandler:
@@ -40,6 +42,13 @@ class ZipFileHandler:
             self.error = f'Error creating ZIP file: {e}'
 
     def extract_zip(self) -> Optional[str]:
+        with get_tracer().start_span(SPAN_EXTRACT_ZIP,
+                                     {ATTR_FILENAME: os.path.basename(str(self.zip_file_path))}) as span:
+            extracted = self._extract_zip()
+            span.set_attribute(ATTR_ERRORS, 0 if extracted else 1)
+            return extracted
+
+    def _extract_zip(self) -> Optional[str]:
         try:
             if not self.extracted_dir:
                 self.create_temp_dir()
@@ -55,6 +64,21 @@ class ZipFileHandler:
         except Exception as e:
             self.error = f'Error extracting ZIP file: {e}'
 
+    def member_fingerprints(self) -> Dict[str, Tuple[int, int]]:
+        """(CRC32, uncompressed size) of every member, read from the central directory.
+
+        Nothing is inflated; returns an empty dict if the archive cannot be read.
+        """
+        try:
+            with zipfile.ZipFile(self.zip_file_path, "r") as zip_ref:
+                return {info.filename: (info.CRC, info.file_size) for info in zip_ref.infolist()}
+        except Exception:
+            return {}
+
+    def member_name(self, extracted_path: str) -> str:
+        """Archive member name of a file extracted by ``extract_zip``."""
+        return os.path.relpath(extracted_path, self.extracted_dir).replace(os.sep, '/')
+
     # finds the first folder available in the extracted folder. 
     # returns empty if there are no folders inside
     def find_internal_folder(self, zip_ref: zipfile.ZipFile) -> str:
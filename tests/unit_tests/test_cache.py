@@ -0,0 +1,237 @@
+import os
+import pickle
+import shutil
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+
+import numpy as np
+from shapely.geometry import Point
+
+from src.python_osw_validation import CancellationToken, NodeStore, OSWValidation, ZipFileHandler
+from src.python_osw_validation.cache import CacheStats, CachedFile, ResultCache, cache_key, file_digest
+from src.python_osw_validation.feature_table import FeatureTable
+
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_PATH = os.path.join(PARENT_DIR, 'assets')
+
+
+def _entry(payload_size=0):
+    return CachedFile(['Validation error: x' * max(payload_size, 1)], [], True, None)
+
+
+class TestResultCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'cache.sqlite')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_round_trip_with_table(self):
+        table = FeatureTable({'_id': ['a', 'b'], '_w_id': [None, ['a', 'b']]}, [Point(0, 0), None])
+        issues = [{'filename': 'x.geojson', 'feature_index': 1, 'error_message': ['bad']}]
+        with ResultCache(self.path) as cache:
+            cache.put('k', CachedFile(['Validation error: bad'], issues, True, table))
+        with ResultCache(self.path) as cache:
+            entry = cache.get('k')
+        self.assertEqual(entry.errors, ['Validation error: bad'])
+        self.assertEqual(entry.issues, issues)
+        self.assertTrue(entry.within_cap)
+        self.assertEqual(list(entry.table['_id']), ['a', 'b'])
+        self.assertEqual(entry.table['_w_id'][1], ['a', 'b'])
+        self.assertTrue(entry.table.geometry[0].equals(Point(0, 0)))
+        self.assertIsNone(entry.table.geometry[1])
+
+    def test_entries_are_plain_data(self):
+        issues = [{'filename': 'x.geojson', 'feature_index': np.int64(3), 'error_message': 'bad'}]
+        with ResultCache(self.path) as cache:
+            cache.put('k', CachedFile([], issues, True, None))
+            self.assertEqual(cache.get('k').issues, [{**issues[0], 'feature_index': 3}])
+            # Foreign payloads (e.g. pickles written by older versions) are misses and never loaded
+            with cache._db:
+                cache._db.execute('UPDATE entries SET payload = ? WHERE key = ?',
+                                  (pickle.dumps(CachedFile([], [], True, None)), 'k'))
+            self.assertIsNone(cache.get('k'))
+            self.assertEqual(cache.stats, CacheStats(hits=1, misses=1))
+
+    def test_stats(self):
+        with ResultCache(self.path) as cache:
+            self.assertIsNone(cache.get('k'))
+            cache.put('k', _entry())
+            self.assertIsNotNone(cache.get('k'))
+            self.assertEqual(cache.stats, CacheStats(hits=1, misses=1))
+
+    def test_evicts_least_recently_used(self):
+        with ResultCache(self.path) as cache:
+            cache.put('a', _entry(100))
+            cache.put('b', _entry(100))
+            cache.max_bytes = cache.total_bytes + 100
+            cache.get('a')
+            cache.put('c', _entry(100))
+            self.assertIn('a', cache)
+            self.assertNotIn('b', cache)
+            self.assertIn('c', cache)
+            self.assertLessEqual(cache.total_bytes, cache.max_bytes)
+
+    def test_oversized_entry_is_not_stored(self):
+        with ResultCache(self.path, max_bytes=64) as cache:
+            cache.put('a', _entry(100))
+            self.assertEqual(len(cache), 0)
+
+    def test_invalid_max_bytes(self):
+        with self.assertRaises(ValueError):
+            ResultCache(self.path, max_bytes=0)
+
+    def test_confirm_rejects_changed_content(self):
+        file_path = os.path.join(self.tmp.name, 'f.geojson')
+        with open(file_path, 'wb') as f:
+            f.write(b'{}')
+        with ResultCache(self.path, confirm=True) as cache:
+            cache.put('k', _entry(), file_path)
+            self.assertIsNotNone(cache.get('k', file_path))
+            with open(file_path, 'wb') as f:
+                f.write(b'[]')
+            self.assertIsNone(cache.get('k', file_path))
+            self.assertEqual(cache.stats, CacheStats(hits=1, misses=1))
+
+    def test_keys_and_digests(self):
+        file_path = os.path.join(self.tmp.name, 'f.txt')
+        with open(file_path, 'wb') as f:
+            f.write(b'abc')
+        self.assertEqual(file_digest(file_path),
+                         'ba7816bf8f01cfea414140de5dae2223b00361a396177a9cb410ff61f20015ad')
+        self.assertEqual(cache_key('a', 1), cache_key('a', 1))
+        self.assertNotEqual(cache_key('a', 1), cache_key('a', 2))
+
+
+class TestValidateWithCache(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.cache = ResultCache(os.path.join(self.tmp.name, 'cache.sqlite'))
+
+    def tearDown(self):
+        self.cache.close()
+        self.tmp.cleanup()
+
+    def _validate(self, zip_path):
+        return OSWValidation(zipfile_path=zip_path).validate(cache=self.cache)
+
+    def _rebuild_with_changed_points(self, source):
+        target = os.path.join(self.tmp.name, 'changed.zip')
+        with zipfile.ZipFile(source) as src, zipfile.ZipFile(target, 'w', zipfile.ZIP_DEFLATED) as dst:
+            for info in src.infolist():
+                data = src.read(info)
+                if info.filename.endswith('points.OSW.geojson') and not info.filename.startswith('__MACOSX'):
+                    data += b'\n'
+                dst.writestr(info, data)
+        return target
+
+    def test_valid_archive_hits_on_second_run(self):
+        zip_path = os.path.join(ASSETS_PATH, 'valid.zip')
+        first = self._validate(zip_path)
+        second = self._validate(zip_path)
+        self.assertTrue(first.is_valid)
+        self.assertTrue(second.is_valid)
+        self.assertEqual(first.cache_stats, CacheStats(hits=0, misses=3))
+        self.assertEqual(second.cache_stats, CacheStats(hits=3, misses=0))
+
+    def test_invalid_archive_replays_errors_and_issues(self):
+        zip_path = os.path.join(ASSETS_PATH, 'edges_invalid.zip')
+        first = self._validate(zip_path)
+        second = self._validate(zip_path)
+        self.assertFalse(second.is_valid)
+        self.assertEqual(second.errors, first.errors)
+        self.assertEqual(second.issues, first.issues)
+        self.assertEqual(second.cache_stats.misses, 0)
+
+    def test_changed_member_misses_alone(self):
+        zip_path = os.path.join(ASSETS_PATH, 'valid.zip')
+        self._validate(zip_path)
+        result = self._validate(self._rebuild_with_changed_points(zip_path))
+        self.assertTrue(result.is_valid)
+        self.assertEqual(result.cache_stats, CacheStats(hits=2, misses=1))
+
+    def test_member_keys_do_not_hash_content(self):
+        zip_path = os.path.join(ASSETS_PATH, 'valid.zip')
+        self._validate(zip_path)
+        with patch('src.python_osw_validation.file_digest', wraps=file_digest) as digest:
+            result = self._validate(zip_path)
+        self.assertEqual(result.cache_stats, CacheStats(hits=3, misses=0))
+        self.assertTrue(all(call.args[0].endswith('.json') for call in digest.call_args_list))
+
+    def test_without_cache_stats_are_none(self):
+        result = OSWValidation(zipfile_path=os.path.join(ASSETS_PATH, 'minimal.zip')).validate()
+        self.assertIsNone(result.cache_stats)
+
+
+class TestArchiveMemo(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.zip_path = os.path.join(ASSETS_PATH, 'edges_invalid.zip')
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _validate(self, cache, zip_path=None):
+        return OSWValidation(zipfile_path=zip_path or self.zip_path).validate(cache=cache)
+
+    def test_repeated_upload_skips_extraction(self):
+        with ResultCache(os.path.join(self.tmp.name, 'c.sqlite'), archive_memo=True) as cache:
+            first = self._validate(cache)
+            with patch.object(ZipFileHandler, 'extract_zip') as extract:
+                second = self._validate(cache)
+            extract.assert_not_called()
+        self.assertFalse(second.is_valid)
+        self.assertEqual(second.errors, first.errors)
+        self.assertEqual(second.issues, first.issues)
+        self.assertEqual(second.cache_stats, CacheStats(hits=1, misses=0))
+
+    def test_confirm_hashes_the_archive(self):
+        zip_path = os.path.join(self.tmp.name, 'upload.zip')
+        shutil.copy(self.zip_path, zip_path)
+        with ResultCache(os.path.join(self.tmp.name, 'c.sqlite'), archive_memo=True, confirm=True) as cache:
+            self._validate(cache, zip_path)
+            self.assertEqual(self._validate(cache, zip_path).cache_stats, CacheStats(hits=1, misses=0))
+            # Same members, different archive bytes (an archive comment)
+            with zipfile.ZipFile(zip_path, 'a') as zip_ref:
+                zip_ref.comment = b'changed'
+            result = self._validate(cache, zip_path)
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.cache_stats.misses, 1)
+
+    def test_cancelled_runs_are_not_memoised(self):
+        token = CancellationToken()
+        token.cancel()
+        with ResultCache(os.path.join(self.tmp.name, 'c.sqlite'), archive_memo=True) as cache:
+            OSWValidation(zipfile_path=self.zip_path).validate(cache=cache, cancel_token=token)
+            self.assertEqual(len(cache), 0)
+
+    def test_node_store_runs_bypass_the_memo(self):
+        mismatch_zip = os.path.join(ASSETS_PATH, 'edge_u_id_coord_mismatch.zip')
+        edges_zip = os.path.join(self.tmp.name, 'edges.zip')
+        with zipfile.ZipFile(mismatch_zip) as src, zipfile.ZipFile(edges_zip, 'w') as dst:
+            dst.writestr('opensidewalks.edges.geojson', src.read('opensidewalks.edges.geojson'))
+        store = NodeStore(os.path.join(self.tmp.name, 'nodes'))
+        nodes_key = OSWValidation(zipfile_path=mismatch_zip).validate(node_store=store).nodes_key
+        with ResultCache(os.path.join(self.tmp.name, 'c.sqlite'), archive_memo=True) as cache:
+            self.assertTrue(self._validate(cache, edges_zip).is_valid)
+            result = OSWValidation(zipfile_path=edges_zip).validate(cache=cache, node_store=store,
+                                                                   nodes_baseline=nodes_key)
+        self.assertFalse(result.is_valid)
+        self.assertEqual(len(result.errors), 1)
+        self.assertIn('(_u_id mismatch)', result.errors[0])
+
+    def test_node_store_runs_report_their_nodes_key(self):
+        mismatch_zip = os.path.join(ASSETS_PATH, 'edge_u_id_coord_mismatch.zip')
+        store = NodeStore(os.path.join(self.tmp.name, 'nodes'))
+        with ResultCache(os.path.join(self.tmp.name, 'c.sqlite'), archive_memo=True) as cache:
+            self._validate(cache, mismatch_zip)
+            result = OSWValidation(zipfile_path=mismatch_zip).validate(cache=cache, node_store=store)
+        self.assertIsNotNone(result.nodes_key)
+        self.assertIn(result.nodes_key, store)
+
+
+if __name__ == '__main__':
+    unittest.main()
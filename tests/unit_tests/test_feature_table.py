@@ -0,0 +1,121 @@
+import os
+import unittest
+from unittest.mock import patch
+
+import shapely
+from shapely.geometry import shape
+
+from src.python_osw_validation import OSWValidation
+from src.python_osw_validation.feature_table import FeatureTable
+
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_PATH = os.path.join(PARENT_DIR, 'assets')
+
+
+def _feature(props, geometry):
+    return {'type': 'Feature', 'properties': props, 'geometry': geometry}
+
+
+class TestFeatureTable(unittest.TestCase):
+    def setUp(self):
+        self.geometries = [
+            {'type': 'Point', 'coordinates': [1.5, 2.5]},
+            {'type': 'LineString', 'coordinates': [[0, 0], [1, 1], [2, 0]]},
+            {'type': 'Polygon', 'coordinates': [[[0, 0], [1, 0], [1, 1], [0, 0]]]},
+            {'type': 'Point', 'coordinates': [1, 2, 3]},
+            {'type': 'LineString', 'coordinates': []},
+            None,
+        ]
+        self.data = {'type': 'FeatureCollection', 'features': [
+            _feature({'_id': 'a', '_w_id': ['x', 'y'], 'surface': 'asphalt'}, self.geometries[0]),
+            _feature({'_id': 'b', '_u_id': 'x', 'ext:foo': 1}, self.geometries[1]),
+            _feature({'_id': 'a'}, self.geometries[2]),
+            _feature({'_id': 'c'}, self.geometries[3]),
+            _feature({'_id': 'd'}, self.geometries[4]),
+            _feature(None, self.geometries[5]),
+        ]}
+
+    def test_reads_only_integrity_columns(self):
+        table = FeatureTable.from_geojson(self.data)
+        self.assertEqual(table.columns, ['_id', '_u_id', '_w_id', 'geometry'])
+        self.assertEqual(len(table), 6)
+        self.assertEqual(table['_id'].tolist(), ['a', 'b', 'a', 'c', 'd', None])
+        self.assertEqual(table['_w_id'][0], ['x', 'y'])
+        self.assertIsNone(table['_u_id'][0])
+        self.assertEqual(table.index.tolist(), list(range(6)))
+
+    def test_geometries_match_per_feature_shape(self):
+        table = FeatureTable.from_geojson(self.data)
+        for built, geom in zip(table.geometry, self.geometries):
+            if geom is None:
+                self.assertIsNone(built)
+            else:
+                self.assertTrue(shapely.equals_exact(built, shape(geom), 0))
+                self.assertEqual(shapely.has_z(built), shapely.has_z(shape(geom)))
+
+    def test_malformed_coordinates_raise(self):
+        data = {'features': [_feature({'_id': 'a'}, {'type': 'LineString', 'coordinates': [[0, 0], ['x', 1]]})]}
+        with self.assertRaises(Exception):
+            FeatureTable.from_geojson(data)
+
+    def test_bytes_round_trip(self):
+        table = FeatureTable.from_geojson(self.data)
+        restored = FeatureTable.from_bytes(table.to_bytes())
+        self.assertEqual(restored.columns, table.columns)
+        for name in ('_id', '_u_id', '_w_id'):
+            self.assertEqual(restored[name].tolist(), table[name].tolist())
+        for built, geom in zip(restored.geometry, table.geometry):
+            if geom is None:
+                self.assertIsNone(built)
+            else:
+                self.assertTrue(shapely.equals_exact(built, geom, 0))
+                self.assertEqual(shapely.has_z(built), shapely.has_z(geom))
+        with self.assertRaises(ValueError):
+            FeatureTable.from_bytes(table.to_bytes()[:-1])
+
+    def test_duplicated_ids_first_seen_order(self):
+        table = FeatureTable.from_geojson(self.data)
+        self.assertEqual(OSWValidation(zipfile_path='x.zip').are_ids_unique(table), (False, ['a']))
+
+
+class TestLeanValidation(unittest.TestCase):
+    ASSETS = [
+        'valid.zip',
+        'minimal.zip',
+        '4151.zip',
+        '_id_missing.zip',
+        'invalid_geometry.zip',
+        'multiple_entries.zip',
+        'geom_mapping_valid.zip',
+        'edge_u_id_coord_mismatch.zip',
+        'edge_v_id_coord_mismatch.zip',
+        'zone_w_id_coord_mismatch.zip',
+        'UW.zones.valid.zip',
+        'UW.zones.invalid.zip',
+        'issue_3297.zip',
+        'task_3469.zip',
+    ]
+
+    def test_lean_matches_geodataframe_path(self):
+        for asset in self.ASSETS:
+            path = os.path.join(ASSETS_PATH, asset)
+            for pipelined in (False, True):
+                with self.subTest(asset=asset, pipelined=pipelined):
+                    full = OSWValidation(zipfile_path=path).validate()
+                    lean = OSWValidation(zipfile_path=path).validate(lean=True, pipelined=pipelined)
+                    self.assertEqual(full.is_valid, lean.is_valid)
+                    self.assertEqual(full.errors, lean.errors)
+                    self.assertEqual(full.issues, lean.issues)
+
+    def test_lean_does_not_build_geodataframes_for_dataset_files(self):
+        path = os.path.join(ASSETS_PATH, 'geom_mapping_valid.zip')
+        with patch('src.python_osw_validation._read_geojson_without_ext',
+                   side_effect=AssertionError('GeoDataFrame built')), \
+                patch('src.python_osw_validation._geodataframe_without_ext',
+                      side_effect=AssertionError('GeoDataFrame built')):
+            self.assertTrue(OSWValidation(zipfile_path=path).validate(lean=True).is_valid)
+            self.assertTrue(OSWValidation(zipfile_path=path).validate(lean=True, pipelined=True).is_valid)
+
+
+if __name__ == '__main__':
+    unittest.main()
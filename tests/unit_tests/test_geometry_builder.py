@@ -0,0 +1,80 @@
+import unittest
+
+import shapely
+from shapely.geometry import shape
+
+from src.python_osw_validation.geometry_builder import build_geometries
+
+SQUARE = [[0, 0], [4, 0], [4, 4], [0, 4], [0, 0]]
+HOLE = [[1, 1], [2, 1], [2, 2], [1, 1]]
+
+
+class TestBuildGeometries(unittest.TestCase):
+    def assertSameAsShape(self, geometries):
+        built = build_geometries(geometries)
+        self.assertEqual(len(built), len(geometries))
+        for geom, result in zip(geometries, built):
+            if not geom:
+                self.assertIsNone(result)
+                continue
+            expected = shape(geom)
+            self.assertEqual(result.geom_type, expected.geom_type)
+            self.assertEqual(result.has_z, expected.has_z)
+            self.assertEqual(result.is_valid, expected.is_valid)
+            self.assertTrue(shapely.equals_exact(result, expected, 0), (result, expected))
+        return built
+
+    def test_known_types_in_bulk(self):
+        self.assertSameAsShape([
+            {'type': 'Point', 'coordinates': [1.5, 2.5]},
+            {'type': 'LineString', 'coordinates': [[0, 0], [1, 1], [2, 0]]},
+            {'type': 'Polygon', 'coordinates': [SQUARE, HOLE]},
+            {'type': 'Point', 'coordinates': [3, 4]},
+            {'type': 'Polygon', 'coordinates': [SQUARE]},
+            {'type': 'LineString', 'coordinates': [[5, 5], [6, 6]]},
+        ])
+
+    def test_missing_geometries_stay_none(self):
+        built = self.assertSameAsShape([None, {}, {'type': 'Point', 'coordinates': [0, 0]}])
+        self.assertIsNone(built[0])
+        self.assertIsNone(built[1])
+
+    def test_three_dimensional_coordinates(self):
+        self.assertSameAsShape([
+            {'type': 'Point', 'coordinates': [1, 2, 3]},
+            {'type': 'LineString', 'coordinates': [[0, 0, 1], [1, 1, 2]]},
+        ])
+
+    def test_mixed_dimensions_fall_back(self):
+        self.assertSameAsShape([
+            {'type': 'Point', 'coordinates': [1, 2, 3]},
+            {'type': 'Point', 'coordinates': [1, 2]},
+        ])
+
+    def test_other_types_and_edge_cases_fall_back(self):
+        self.assertSameAsShape([
+            {'type': 'MultiPolygon', 'coordinates': [[SQUARE]]},
+            {'type': 'MultiLineString', 'coordinates': [[[0, 0], [1, 1]]]},
+            {'type': 'LineString', 'coordinates': []},
+            {'type': 'Polygon', 'coordinates': []},
+            {'type': 'Polygon', 'coordinates': [[[0, 0], [1, 0], [1, 1]]]},
+            {'type': 'Polygon', 'coordinates': [[[0, 0], [2, 0], [2, 2], [0, 2]]]},
+        ])
+
+    def test_invalid_geometry_is_built_not_rejected(self):
+        bowtie = [[0, 0], [2, 2], [2, 0], [0, 2], [0, 0]]
+        built = self.assertSameAsShape([{'type': 'Polygon', 'coordinates': [bowtie]}])
+        self.assertFalse(built[0].is_valid)
+
+    def test_malformed_geometry_raises_like_shape(self):
+        for geom in ({'type': 'LineString', 'coordinates': [[0, 0], ['x', 1]]},
+                     {'type': 'LineString', 'coordinates': [[0, 0]]}):
+            with self.subTest(geom=geom):
+                with self.assertRaises(Exception):
+                    shape(geom)
+                with self.assertRaises(Exception):
+                    build_geometries([geom])
+
+
+if __name__ == '__main__':
+    unittest.main()
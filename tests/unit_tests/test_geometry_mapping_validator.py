@@ -15,7 +15,7 @@ if SRC not in sys.path:
 
 # Import the geometry_mapping_validator module directly so this test file
 # does not require the heavy optional dependencies (geopandas, jsonschema_rs)
-# of the parent package's __init__.py. The module itself is pure Python.
+# of the parent package's __init__.py. The module only needs numpy.
 _MOD_PATH = os.path.join(
     SRC, "python_osw_validation", "geometry_mapping_validator.py"
 )
@@ -26,6 +26,8 @@ _geometry_mapping_validator = importlib.util.module_from_spec(_spec)
 assert _spec.loader is not None
 _spec.loader.exec_module(_geometry_mapping_validator)
 
+NodeIndex = _geometry_mapping_validator.NodeIndex
+ToleranceGrid = _geometry_mapping_validator.ToleranceGrid
 build_node_coord_index = _geometry_mapping_validator.build_node_coord_index
 run_geometry_mapping_validation = _geometry_mapping_validator.run_geometry_mapping_validation
 validate_edge_node_mapping = _geometry_mapping_validator.validate_edge_node_mapping
@@ -193,6 +195,92 @@ class ZoneMappingTests(unittest.TestCase):
         self.assertTrue(any("does not match" in m for m in msgs))
 
 
+class NodeIndexTests(unittest.TestCase):
+    def test_string_ids_batch_lookup(self):
+        index = NodeIndex(["b", "a", "é"], [2.0, 1.0, 3.0], [20.0, 10.0, 30.0])
+        lon, lat, found = index.lookup(["a", "zz", "é", None, 5])
+        self.assertEqual(found.tolist(), [True, False, True, False, False])
+        self.assertEqual(lon[found].tolist(), [1.0, 3.0])
+        self.assertEqual(lat[found].tolist(), [10.0, 30.0])
+
+    def test_integer_ids(self):
+        index = NodeIndex([3, 1, 2], [3.0, 1.0, 2.0], [0.0, 0.0, 0.0])
+        self.assertEqual(index.positions([2, "2", 9]).tolist()[1:], [-1, -1])
+        self.assertEqual(index[2], (2.0, 0.0))
+
+    def test_mixed_ids_use_fallback(self):
+        index = NodeIndex(["a", 1], [1.0, 2.0], [1.0, 2.0])
+        self.assertEqual(index["a"], (1.0, 1.0))
+        self.assertEqual(index[1], (2.0, 2.0))
+        self.assertEqual(index.positions([[1]]).tolist(), [-1])
+
+    def test_trailing_nul_ids_stay_distinct(self):
+        index = NodeIndex(["a", "a\0"], [1.0, 2.0], [1.0, 2.0])
+        self.assertEqual(index["a"], (1.0, 1.0))
+        self.assertEqual(index["a\0"], (2.0, 2.0))
+        self.assertEqual(set(index), {"a", "a\0"})
+        with self.assertRaises(ValueError):
+            index.to_arrays()
+        self.assertEqual(NodeIndex(["a"], [1.0], [1.0]).positions(["a\0", "a"]).tolist(), [-1, 0])
+
+    def test_duplicates_keep_first_or_last(self):
+        ids, lon, lat = ["n", "m", "n"], [1.0, 5.0, 9.0], [0.0, 0.0, 0.0]
+        self.assertEqual(NodeIndex(ids, lon, lat)["n"], (1.0, 0.0))
+        self.assertEqual(NodeIndex(ids, lon, lat, keep="last")["n"], (9.0, 0.0))
+        self.assertEqual(len(NodeIndex(ids, lon, lat)), 2)
+
+    def test_behaves_as_mapping(self):
+        nodes = _nodes(("n1", 0.0, 0.0), ("n2", 1.5, 2.5))
+        index = build_node_coord_index(nodes)
+        self.assertIsInstance(index, NodeIndex)
+        self.assertEqual(dict(index), {"n1": (0.0, 0.0), "n2": (1.5, 2.5)})
+        self.assertIn("n2", index)
+        self.assertNotIn("n3", index)
+        self.assertIsNone(index.get("n3"))
+        self.assertGreater(index.nbytes, 0)
+
+    def test_empty_index(self):
+        index = NodeIndex.empty()
+        self.assertFalse(index)
+        self.assertEqual(index.positions(["a"]).tolist(), [-1])
+
+    def test_plain_dict_is_accepted_by_validators(self):
+        edges = _edges(_edge("e1", "n1", "n2", [[0.0, 0.0], [1.0, 1.0]]))
+        issues = validate_edge_node_mapping(
+            edges, {"n1": (0.0, 0.0), "n2": (1.0, 1.0)}, "edges.geojson", True
+        )
+        self.assertEqual(issues, [])
+
+
+class ToleranceGridTests(unittest.TestCase):
+    TOL = 1e-7
+
+    def test_matches_within_tolerance_across_cell_boundaries(self):
+        grid = ToleranceGrid([10.0, -122.123456789], [20.0, 47.0], self.TOL)
+        hits = grid.contains(
+            [10.0 + 0.99e-7, 10.0 - 0.99e-7, 10.0 + 1.5e-7, -122.123456789 + 0.5e-7],
+            [20.0 - 0.99e-7, 20.0 + 0.99e-7, 20.0, 47.0 - 0.5e-7],
+        )
+        self.assertEqual(hits.tolist(), [True, True, False, True])
+
+    def test_queries_only_match_their_own_group(self):
+        grid = ToleranceGrid([0.0, 1.0], [0.0, 1.0], self.TOL, groups=[0, 1])
+        hits = grid.contains([0.0, 0.0, 1.0], [0.0, 0.0, 1.0], groups=[0, 1, 1])
+        self.assertEqual(hits.tolist(), [True, False, True])
+
+    def test_crowded_cells_and_nan(self):
+        xs = [5.0 + i * 1e-9 for i in range(10)] + [float("nan")]
+        grid = ToleranceGrid(xs, [5.0] * 11, self.TOL)
+        self.assertEqual(len(grid), 10)
+        hits = grid.contains([5.0 + 9e-9 + 0.9e-7, float("nan"), 5.0 - 2e-7], [5.0, 5.0, 5.0])
+        self.assertEqual(hits.tolist(), [True, False, False])
+
+    def test_empty_grid_and_bad_tolerance(self):
+        self.assertEqual(ToleranceGrid([], [], self.TOL).contains([0.0], [0.0]).tolist(), [False])
+        with self.assertRaises(ValueError):
+            ToleranceGrid([0.0], [0.0], 0)
+
+
 class IntegrationTests(unittest.TestCase):
     def test_runs_all_validators_and_aggregates(self):
         nodes = _nodes(("n1", 0.0, 0.0), ("n2", 1.0, 1.0),
@@ -0,0 +1,120 @@
+import json
+import unittest
+
+import geopandas as gpd
+import numpy as np
+from shapely.geometry import LineString, Point, Polygon
+
+from src.python_osw_validation import OSWValidation
+from benchmarks import legacy_geometry_mapping as legacy
+from benchmarks.bench_geometry_mapping import build_frames, run_legacy, run_vectorised
+from benchmarks import bench_zone_tolerance
+
+
+def _nodes(rows):
+    return gpd.GeoDataFrame({"_id": [r[0] for r in rows],
+                             "geometry": [Point(r[1], r[2]) for r in rows]})
+
+
+class TestVectorizedEdgeMapping(unittest.TestCase):
+    def setUp(self):
+        self.v = OSWValidation(zipfile_path="dummy.zip")
+        self.nodes = _nodes([("n1", 0.0, 0.0), ("n2", 1.0, 1.0)])
+
+    def _run(self, edges, max_errors=20):
+        node_map = self.v._build_node_coord_map(self.nodes)
+        self.v._validate_edge_geometry_mapping(edges, node_map, max_errors)
+        return self.v.issues.to_list()
+
+    def test_exact_messages_for_both_endpoints(self):
+        edges = gpd.GeoDataFrame({"_id": ["e1"], "_u_id": ["n1"], "_v_id": ["n2"],
+                                  "geometry": [LineString([(9.0, 9.0), (8.5, 8.0)])]})
+        issues = self._run(edges)
+        self.assertEqual([i["error_message"] for i in issues], [
+            "edges id 'e1' : start coordinate (9.0, 9.0) does not match node id 'n1' coordinate (0.0, 0.0) "
+            "(_u_id mismatch).",
+            "edges id 'e1' : end coordinate (8.5, 8.0) does not match node id 'n2' coordinate (1.0, 1.0) "
+            "(_v_id mismatch).",
+        ])
+        self.assertEqual([i["feature_index"] for i in issues], [0, 0])
+
+    def test_falls_back_to_index_without_id_column(self):
+        edges = gpd.GeoDataFrame({"_u_id": ["n1"], "geometry": [LineString([(5.0, 5.0), (1.0, 1.0)])]},
+                                 index=[7])
+        issues = self._run(edges)
+        self.assertEqual(len(issues), 1)
+        self.assertTrue(issues[0]["error_message"].startswith("edges id '7' : start coordinate"))
+        self.assertIsInstance(issues[0]["feature_index"], int)
+        json.dumps(issues)
+
+    def test_cap_applies_between_start_and_end_checks(self):
+        edges = gpd.GeoDataFrame({"_id": ["e1", "e2"], "_u_id": ["n1", "n1"], "_v_id": ["n2", "n2"],
+                                  "geometry": [LineString([(9, 9), (8, 8)])] * 2})
+        issues = self._run(edges, max_errors=3)
+        self.assertEqual(len(issues), 3)
+        self.assertIn("_u_id mismatch", issues[2]["error_message"])
+        self.assertIn("'e2'", issues[2]["error_message"])
+
+    def test_skips_missing_geometry_unknown_and_missing_refs(self):
+        edges = gpd.GeoDataFrame({"_id": ["e1", "e2", "e3"],
+                                  "_u_id": ["n1", "ghost", None],
+                                  "_v_id": [None, np.nan, "n2"],
+                                  "geometry": [None, LineString([(9, 9), (8, 8)]), Point(9, 9)]})
+        self.assertEqual(self._run(edges), [])
+
+    def test_duplicate_node_ids_keep_last_coordinate(self):
+        self.nodes = _nodes([("n1", 9.0, 9.0), ("n1", 0.0, 0.0)])
+        edges = gpd.GeoDataFrame({"_id": ["e1"], "_u_id": ["n1"],
+                                  "geometry": [LineString([(0, 0), (1, 1)])]})
+        self.assertEqual(self._run(edges), [])
+
+    def test_within_tolerance_matches(self):
+        edges = gpd.GeoDataFrame({"_id": ["e1"], "_u_id": ["n1"], "_v_id": ["n2"],
+                                  "geometry": [LineString([(5e-8, -5e-8), (1.0, 1.0 + 9e-8)])]})
+        self.assertEqual(self._run(edges), [])
+
+
+class TestVectorizedZoneMapping(unittest.TestCase):
+    def test_exact_message_and_scalar_w_id(self):
+        v = OSWValidation(zipfile_path="dummy.zip")
+        nodes = _nodes([("a", 0.0, 0.0), ("b", 1.0, 0.0), ("far", 5.0, 5.0)])
+        square = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+        zones = gpd.GeoDataFrame({"_id": ["z1", "z2", "z3"],
+                                  "_w_id": [["a", "far", "ghost", None], "far", None],
+                                  "geometry": [square, square, square]})
+        v._validate_zone_geometry_mapping(zones, v._build_node_coord_map(nodes), 20)
+        self.assertEqual([i["error_message"] for i in v.issues], [
+            "zones id 'z1' : node id 'far' coordinate (5.0, 5.0) is not a vertex of the zone polygon "
+            "geometry (_w_id coordinate mismatch).",
+            "zones id 'z2' : node id 'far' coordinate (5.0, 5.0) is not a vertex of the zone polygon "
+            "geometry (_w_id coordinate mismatch).",
+        ])
+        self.assertEqual([i["feature_index"] for i in v.issues], [0, 1])
+
+
+class TestParityWithRowWiseImplementation(unittest.TestCase):
+    def test_matches_legacy_on_synthetic_frames(self):
+        nodes, edges, zones = build_frames(800, 120, mismatch_rate=0.2, seed=3)
+        for max_errors in (5, 37, 10 ** 6):
+            with self.subTest(max_errors=max_errors):
+                self.assertEqual(run_vectorised(nodes, edges, zones, max_errors),
+                                 run_legacy(nodes, edges, zones, max_errors))
+
+    def test_high_vertex_zones_match_legacy(self):
+        nodes, zones = bench_zone_tolerance.build_frames(6, 300, mismatch_rate=0.05, seed=1)
+        for max_errors in (4, 10 ** 6):
+            with self.subTest(max_errors=max_errors):
+                self.assertEqual(bench_zone_tolerance.run_grid(nodes, zones, max_errors),
+                                 bench_zone_tolerance.run_legacy(nodes, zones, max_errors))
+
+    def test_node_index_matches_legacy_dict(self):
+        nodes = _nodes([("a", 1.0, 2.0), ("b", 3.0, 4.0), ("a", 5.0, 6.0)])
+        node_map = OSWValidation(zipfile_path="dummy.zip")._build_node_coord_map(nodes)
+        expected = legacy.build_node_coord_map(nodes)
+        self.assertEqual(len(node_map), len(expected))
+        for node_id, coord in expected.items():
+            self.assertEqual(node_map.coord(node_map.positions(np.array([node_id], dtype=object))[0]), coord)
+
+
+if __name__ == "__main__":
+    unittest.main()
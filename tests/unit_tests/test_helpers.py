@@ -3,6 +3,8 @@ import os
 import tempfile
 import unittest
 
+import pandas as pd
+
 import src.python_osw_validation.helpers as helpers
 
 
@@ -254,6 +256,27 @@ class TestReadGeojsonWithoutExt(unittest.TestCase):
         self.assertEqual(gdf.geometry.iloc[0].x, 2)
         self.assertEqual(gdf.geometry.iloc[0].y, 3)
 
+    def test_geometry_property_does_not_clash(self):
+        payload = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "properties": {"_id": "x", "geometry": "footway centerline"},
+                    "geometry": {"type": "Point", "coordinates": [2, 3]},
+                },
+                {
+                    "type": "Feature",
+                    "properties": {"_id": "y"},
+                    "geometry": {"type": "Point", "coordinates": [4, 5]},
+                },
+            ],
+        }
+        gdf = helpers._read_geojson_without_ext(self._write_geojson(payload))
+        self.assertEqual(list(gdf.columns), ["geometry", "_id"])
+        self.assertEqual(gdf["_id"].tolist(), ["x", "y"])
+        self.assertEqual((gdf.geometry.iloc[0].x, gdf.geometry.iloc[1].y), (2, 5))
+
     def test_empty_feature_collection(self):
         payload = {"type": "FeatureCollection", "features": []}
         gdf = helpers._read_geojson_without_ext(self._write_geojson(payload))
@@ -274,6 +297,78 @@ class TestReadGeojsonWithoutExt(unittest.TestCase):
         gdf = helpers._read_geojson_without_ext(self._write_geojson(payload))
         self.assertIsNotNone(gdf.crs)
 
+    def test_columns_projects_properties(self):
+        payload = {
+            "type": "FeatureCollection",
+            "features": [
+                {
+                    "type": "Feature",
+                    "properties": {"_id": "e1", "_u_id": "n1", "highway": "footway", "ext:foo": 1},
+                    "geometry": {"type": "LineString", "coordinates": [[0, 0], [1, 1]]},
+                },
+                {
+                    "type": "Feature",
+                    "properties": {"_id": "e2", "surface": "asphalt"},
+                    "geometry": None,
+                },
+            ],
+        }
+        gdf = helpers._read_geojson_without_ext(
+            self._write_geojson(payload), columns=("_id", "_u_id", "_v_id", "_w_id")
+        )
+        self.assertEqual(sorted(gdf.columns), ["_id", "_u_id", "geometry"])
+        self.assertEqual(gdf["_id"].tolist(), ["e1", "e2"])
+        self.assertTrue(gdf["_u_id"].isna().iloc[1])
+        self.assertEqual(gdf.geometry.iloc[0].geom_type, "LineString")
+        self.assertIsNone(gdf.geometry.iloc[1])
+
+    def test_columns_leaves_parsed_document_untouched(self):
+        props = {"_id": "x", "ext:foo": 1}
+        payload = {"features": [{"type": "Feature", "properties": props,
+                                 "geometry": {"type": "Point", "coordinates": [0, 0]}}]}
+        gdf = helpers._geodataframe_without_ext(payload, columns=("_id",))
+        self.assertEqual(list(gdf.columns), ["_id", "geometry"])
+        self.assertIn("ext:foo", props)
+
+
+
+class TestFirstNonSerializable(unittest.TestCase):
+    def test_serializable_frame(self):
+        frame = pd.DataFrame({
+            "width": [1.5, None, 3],
+            "name": ["a", None, "c"],
+            "count": [1, 2, 3],
+            "tags": [{"k": "v"}, [1, 2], None],
+        })
+        self.assertIsNone(helpers._first_non_serializable(frame))
+
+    def test_reports_earliest_row_then_leftmost_column(self):
+        frame = pd.DataFrame({
+            "a": ["x", "y", {1, 2}, "z"],
+            "b": [1, 2, 3, 4],
+            "c": [None, {"k": {3}}, object(), None],
+        })
+        row, column, error = helpers._first_non_serializable(frame)
+        self.assertEqual((row, column), (1, "c"))
+        self.assertIsInstance(error, TypeError)
+        with self.assertRaises(TypeError) as ctx:
+            json.dumps({"k": {3}})
+        self.assertEqual(str(error), str(ctx.exception))
+
+    def test_matches_row_wise_dump(self):
+        frame = pd.DataFrame({"a": [1, 2, 3], "b": ["x", "y", "z"], "c": [None, None, {5}]})
+        expected = None
+        for position, (_, row) in enumerate(frame.iterrows()):
+            try:
+                json.dumps(row.to_dict())
+            except TypeError:
+                expected = position
+                break
+        self.assertEqual(helpers._first_non_serializable(frame)[0], expected)
+
+    def test_empty_frame(self):
+        self.assertIsNone(helpers._first_non_serializable(pd.DataFrame()))
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+
+import numpy as np
+import pandas as pd
+
+from src.python_osw_validation.id_codes import IdCodes, duplicated_ids, non_null
+
+
+class TestNonNull(unittest.TestCase):
+    def test_drops_none_and_nan(self):
+        self.assertEqual(non_null(['a', None, np.nan, 'b']).tolist(), ['a', 'b'])
+        self.assertEqual(non_null(pd.Series([1, None, 2], dtype=object)).tolist(), [1, 2])
+        self.assertEqual(len(non_null([])), 0)
+
+
+class TestDuplicatedIds(unittest.TestCase):
+    def test_first_seen_order(self):
+        self.assertEqual(duplicated_ids(['b', 'a', 'c', 'a', 'b', 'b']), ['b', 'a'])
+
+    def test_no_duplicates(self):
+        self.assertEqual(duplicated_ids(['a', 'b', 'c']), [])
+        self.assertEqual(duplicated_ids([]), [])
+
+    def test_missing_values_compare_equal(self):
+        self.assertEqual(len(duplicated_ids(['a', None, None])), 1)
+
+    def test_matches_dataframe_duplicated(self):
+        rng = np.random.default_rng(0)
+        ids = [f"n{i}" for i in rng.integers(0, 500, 2000)]
+        frame = pd.DataFrame({'_id': ids})
+        expected = list(frame[frame.duplicated('_id', keep=False)]['_id'].unique())
+        self.assertEqual(duplicated_ids(np.array(ids, dtype=object)), expected)
+
+    def test_unhashable_values_are_compared_as_strings(self):
+        self.assertEqual(duplicated_ids([[1, 2], [1, 2], 'a']), ['[1, 2]'])
+
+
+class TestIdCodes(unittest.TestCase):
+    def test_encode(self):
+        codes = IdCodes(['n1', 'n2', None, 'n1'])
+        self.assertEqual(len(codes), 2)
+        first, second = codes.encode(['n2', 'x', 'n1', None], ['x', 'n1'])
+        self.assertEqual(first.tolist(), [1, -1, 0, -1])
+        self.assertEqual(second.tolist(), [-1, 0])
+
+    def test_empty_vocabulary(self):
+        codes = IdCodes([])
+        self.assertEqual(len(codes), 0)
+        self.assertEqual(codes.encode(['a'])[0].tolist(), [-1])
+
+    def test_types_are_not_coerced(self):
+        self.assertEqual(IdCodes(['1']).encode([1, '1'])[0].tolist(), [-1, 0])
+
+    def test_matches_set_difference(self):
+        rng = np.random.default_rng(1)
+        nodes = [f"n{i}" for i in range(1000)]
+        refs = [f"n{i}" for i in rng.integers(0, 1100, 3000)]
+        refs = np.array(refs, dtype=object)
+        codes = IdCodes(nodes).encode(refs)[0]
+        self.assertEqual(set(refs[codes < 0]), set(refs) - set(nodes))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+import os
+import pickle
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.python_osw_validation import Baseline, FeatureDiff, OSWValidation
+
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_PATH = os.path.join(PARENT_DIR, 'assets')
+
+
+def _node(node_id, x, y):
+    return {'type': 'Feature', 'geometry': {'type': 'Point', 'coordinates': [x, y]},
+            'properties': {'_id': node_id}}
+
+
+def _edge(edge_id, u_id, v_id, coordinates, **properties):
+    return {'type': 'Feature', 'geometry': {'type': 'LineString', 'coordinates': coordinates},
+            'properties': {'_id': edge_id, '_u_id': u_id, '_v_id': v_id,
+                           'footway': 'sidewalk', 'highway': 'footway', **properties}}
+
+
+class TestIncrementalValidation(unittest.TestCase):
+    # nodes n1 (0, 0) and n2 (1, 1); edge e1 (0, 0)→(1, 1) and e2 (9, 9)→(1, 1), both n1→n2
+    zip_path = os.path.join(ASSETS_PATH, 'edge_u_id_coord_mismatch.zip')
+
+    def setUp(self):
+        self.validation = OSWValidation(zipfile_path=self.zip_path)
+        self.baseline = self.validation.build_baseline()
+
+    def _revalidate(self, **diffs):
+        return self.validation.revalidate(self.baseline, diffs)
+
+    def test_baseline_matches_full_validation(self):
+        full = OSWValidation(zipfile_path=self.zip_path).validate()
+        result = self._revalidate()
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.issues, full.issues)
+        self.assertEqual(result.errors, full.errors)
+
+    def test_moved_node_rechecks_referencing_edges(self):
+        result = self._revalidate(nodes=FeatureDiff(modified=[_node('n1', 9.0, 9.0)]))
+        self.assertEqual(result.errors, [
+            "edges id 'e1' : start coordinate (0.0, 0.0) does not match node id 'n1' coordinate (9.0, 9.0) "
+            "(_u_id mismatch)."
+        ])
+        self.assertEqual(result.issues[0]['feature_index'], 0)
+
+    def test_modified_edge_clears_its_issue(self):
+        result = self._revalidate(edges=FeatureDiff(modified=[_edge('e2', 'n1', 'n2', [[0.0, 0.0], [1.0, 1.0]])]))
+        self.assertTrue(result.is_valid)
+        self.assertEqual(result.issues, [])
+
+    def test_deleted_node_breaks_references_until_added_back(self):
+        result = self._revalidate(nodes=FeatureDiff(deleted=['n2']))
+        self.assertEqual(sorted(issue['error_message'][0] for issue in result.issues if 'feature_id' in issue), [
+            "edges id 'e1' : _v_id 'n2' is not an _id in nodes.",
+            "edges id 'e2' : _v_id 'n2' is not an _id in nodes.",
+        ])
+        result = self._revalidate(nodes=FeatureDiff(added=[_node('n2', 1.0, 1.0)]),
+                                  edges=FeatureDiff(deleted=['e2']))
+        self.assertTrue(result.is_valid)
+        self.assertEqual(len(self.baseline.files['nodes']), 2)
+        self.assertEqual(self.baseline.files['nodes'].first_slot('n2'), 2)
+
+    def test_added_duplicate_and_schema_issue(self):
+        result = self._revalidate(edges=FeatureDiff(added=[
+            _edge('e1', 'n1', 'n2', [[0.0, 0.0], [1.0, 1.0]]),
+            _edge('e3', 'n1', 'n2', [[0.0, 0.0], [1.0, 1.0]], crossing='unmarked'),
+        ]))
+        by_slot = {issue['feature_index']: issue for issue in result.issues}
+        self.assertEqual(by_slot[2]['error_message'], ["edges id 'e1' : duplicate _id."])
+        self.assertEqual(by_slot[3]['filename'], 'opensidewalks.edges.geojson')
+        self.assertIn("('crossing' was unexpected)", by_slot[3]['error_message'][0])
+        self.assertIn('(at: features[3].properties)', by_slot[3]['error_message'][0])
+
+        result = self._revalidate(edges=FeatureDiff(deleted=['e1', 'e3']))
+        self.assertNotIn("duplicate _id", ' '.join(result.errors))
+
+    def test_unknown_ids_are_rejected_before_changes(self):
+        with self.assertRaises(ValueError):
+            self._revalidate(nodes=FeatureDiff(deleted=['n1']), edges=FeatureDiff(deleted=['missing']))
+        with self.assertRaises(ValueError):
+            self._revalidate(lines=FeatureDiff(deleted=['l1']))
+        self.assertEqual(self.baseline.files['nodes'].first_slot('n1'), 0)
+
+    def test_save_and_load(self):
+        # A schema issue and an empty slot, so they round-trip too
+        self._revalidate(edges=FeatureDiff(added=[
+            _edge('e3', 'n1', 'n2', [[0.0, 0.0], [1.0, 1.0]], crossing='unmarked')], deleted=['e1']))
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'baseline.osw')
+            self.baseline.save(path)
+            with patch('pickle.loads') as unpickle, patch('pickle.load') as unpickle_file:
+                loaded = Baseline.load(path)
+            unpickle.assert_not_called()
+            unpickle_file.assert_not_called()
+        self.assertEqual(loaded.issue_list().to_list(), self.baseline.issue_list().to_list())
+        for key, state in self.baseline.files.items():
+            self.assertEqual(loaded.files[key].slots_by_id, state.slots_by_id)
+            self.assertEqual(loaded.files[key].live, state.live)
+        self.assertEqual(loaded._referrers, self.baseline._referrers)
+        diff = {'nodes': FeatureDiff(modified=[_node('n1', 9.0, 9.0)])}
+        self.assertEqual(self.validation.revalidate(loaded, diff).issues,
+                         self.validation.revalidate(self.baseline, diff).issues)
+
+    def test_load_rejects_other_files(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'baseline.pickle')
+            with open(path, 'wb') as file:
+                pickle.dump({'files': {}}, file)
+            with self.assertRaises(ValueError):
+                Baseline.load(path)
+
+    def test_only_changed_features_are_schema_validated(self):
+        validation = OSWValidation(zipfile_path=os.path.join(ASSETS_PATH, 'Archive.zip'))
+        baseline = validation.build_baseline()
+        node_id = next(iter(baseline.files['nodes'].slots_by_id))
+        with patch.object(OSWValidation, '_feature_schema_issues',
+                          wraps=validation._feature_schema_issues) as schema:
+            validation.revalidate(baseline, {'nodes': FeatureDiff(modified=[_node(node_id, 0.0, 0.0)])})
+        self.assertEqual(len(schema.call_args.args[2]), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,121 @@
+import json
+import os
+import tracemalloc
+import unittest
+
+from src.python_osw_validation import OSWValidation, ValidationResult
+from src.python_osw_validation.issues import Issue, IssueList
+
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_PATH = os.path.join(PARENT_DIR, 'assets')
+
+SCHEMA_ISSUE = {'filename': 'a.nodes.geojson', 'feature_index': 3, 'error_message': ['bad value']}
+SUMMARY_ISSUE = {'filename': 'All', 'feature_index': None, 'error_message': 'summary'}
+MAPPING_ISSUE = {'filename': 'edges', 'feature_index': 1, 'feature_id': None, 'error_message': ['mismatch']}
+
+
+class TestIssueList(unittest.TestCase):
+    def test_dict_round_trip(self):
+        issues = IssueList([SCHEMA_ISSUE, SUMMARY_ISSUE, MAPPING_ISSUE])
+        self.assertEqual(len(issues), 3)
+        self.assertEqual(list(issues), [SCHEMA_ISSUE, SUMMARY_ISSUE, MAPPING_ISSUE])
+        self.assertEqual(issues[-1], MAPPING_ISSUE)
+        self.assertEqual(issues, [SCHEMA_ISSUE, SUMMARY_ISSUE, MAPPING_ISSUE])
+        self.assertEqual(json.loads(json.dumps(issues.to_list())), [SCHEMA_ISSUE, SUMMARY_ISSUE, MAPPING_ISSUE])
+
+    def test_records_match_dicts(self):
+        issues = IssueList()
+        issues.append(Issue('edges', 2, 'msg', feature_id='e2'))
+        issues.append(Issue('All', None, 'summary', listed=False))
+        self.assertEqual(issues[0], {'filename': 'edges', 'feature_index': 2, 'feature_id': 'e2',
+                                     'error_message': ['msg']})
+        self.assertEqual(issues[1], SUMMARY_ISSUE)
+        self.assertEqual(issues.record(0).feature_id, 'e2')
+
+    def test_non_standard_dicts_are_kept(self):
+        odd = {'filename': 'x', 'feature_index': 0, 'error_message': ['a', 'b']}
+        extra = {'filename': 'x', 'error_message': ['a'], 'hint': 'h'}
+        issues = IssueList([odd, SCHEMA_ISSUE, extra])
+        self.assertIs(issues[0], odd)
+        self.assertIs(issues[2], extra)
+        self.assertEqual(issues[1:], [SCHEMA_ISSUE, extra])
+
+    def test_slicing_returns_issue_list(self):
+        issues = IssueList([SCHEMA_ISSUE] * 5)
+        part = issues[:2]
+        self.assertIsInstance(part, IssueList)
+        self.assertEqual(len(part), 2)
+        self.assertEqual(len(IssueList()[:20]), 0)
+        self.assertFalse(IssueList())
+
+    def test_filenames_and_kinds_are_interned(self):
+        issues = IssueList()
+        issues.append(Issue(''.join(['edg', 'es']), 0, 'm', kind=''.join(['Any', 'Of'])))
+        issues.append(Issue(''.join(['ed', 'ges']), 1, 'm', kind=''.join(['An', 'yOf'])))
+        self.assertIs(issues.record(0).filename, issues.record(1).filename)
+        self.assertIs(issues.record(0).kind, issues.record(1).kind)
+
+    def test_uses_less_memory_than_dicts(self):
+        messages = [f"feature {i} is invalid" for i in range(20000)]
+
+        def measure(build):
+            tracemalloc.start()
+            built = build()
+            size = tracemalloc.get_traced_memory()[0]
+            tracemalloc.stop()
+            del built
+            return size
+
+        as_dicts = measure(lambda: [{'filename': 'a.edges.geojson', 'feature_index': i, 'error_message': [m]}
+                                    for i, m in enumerate(messages)])
+        as_columns = measure(lambda: IssueList(Issue('a.edges.geojson', i, m) for i, m in enumerate(messages)))
+        self.assertLess(as_columns * 3, as_dicts)
+
+
+class TestValidationResultIssues(unittest.TestCase):
+    def test_materialises_dicts_on_access(self):
+        result = ValidationResult(False, ['summary'], IssueList([SCHEMA_ISSUE]))
+        self.assertEqual(result.issues, [SCHEMA_ISSUE])
+        self.assertIsInstance(result.issues, list)
+        self.assertIs(result.issues, result.issues)
+
+    def test_accepts_plain_lists(self):
+        self.assertEqual(ValidationResult(True, [], [SUMMARY_ISSUE]).issues, [SUMMARY_ISSUE])
+        self.assertIsNone(ValidationResult(True, [], None).issues)
+
+
+class TestIssuesCompatibility(unittest.TestCase):
+    """What callers can and cannot do with the issues of a run."""
+
+    def setUp(self):
+        self.validation = OSWValidation(zipfile_path=os.path.join(ASSETS_PATH, 'edges_invalid.zip'))
+        self.result = self.validation.validate()
+
+    def test_result_issues_are_a_plain_list(self):
+        issues = self.result.issues
+        self.assertIs(type(issues), list)
+        self.assertTrue(issues and all(type(issue) is dict for issue in issues))
+        # Edits to the result's dicts and list stick, as before
+        issues[0]['error_message'].append('reviewed')
+        issues[0]['reviewer'] = 'me'
+        issues.append(SUMMARY_ISSUE)
+        self.assertEqual(self.result.issues[0]['error_message'][-1], 'reviewed')
+        self.assertEqual(self.result.issues[0]['reviewer'], 'me')
+        self.assertEqual(self.result.issues[-1], SUMMARY_ISSUE)
+
+    def test_validator_issues_are_read_only_views(self):
+        issues = self.validation.issues
+        self.assertEqual(issues, self.result.issues)
+        self.assertEqual(issues.to_list(), self.result.issues)
+        # Each read builds a fresh dict: in-place edits are not kept
+        issues[0]['reviewer'] = 'me'
+        self.assertNotIn('reviewer', issues[0])
+        with self.assertRaises(TypeError):
+            issues[0] = SUMMARY_ISSUE
+        # Appending still works, for dicts and Issue records alike
+        issues.append(SUMMARY_ISSUE)
+        self.assertEqual(issues[-1], SUMMARY_ISSUE)
+
+
+if __name__ == '__main__':
+    unittest.main()
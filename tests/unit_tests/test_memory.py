@@ -0,0 +1,132 @@
+import os
+import tracemalloc
+import unittest
+
+from src.python_osw_validation import OSWValidation
+from src.python_osw_validation.memory import (
+    MemoryBudget,
+    MemoryBudgetExceeded,
+    estimate_document_bytes,
+    estimate_table_bytes,
+)
+
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_PATH = os.path.join(PARENT_DIR, 'assets')
+
+
+class TestMemoryBudget(unittest.TestCase):
+    def test_reserve_and_release(self):
+        budget = MemoryBudget(100)
+        self.assertEqual(budget.reserve('load', 'a', 60), 60)
+        with budget.hold('schema', 'b', 40):
+            self.assertEqual(budget.in_use, 100)
+        self.assertEqual(budget.in_use, 60)
+        budget.release(60)
+        self.assertEqual(budget.in_use, 0)
+        self.assertEqual(budget.peak, 100)
+
+    def test_exceeded(self):
+        budget = MemoryBudget(2 ** 20)
+        budget.reserve('load', 'a.geojson', 2 ** 19)
+        with self.assertRaises(MemoryBudgetExceeded) as ctx:
+            budget.reserve('schema', 'b.geojson', 2 ** 20)
+        self.assertEqual(str(ctx.exception),
+                         "Memory budget exceeded: schema of 'b.geojson' needs an estimated 1.0 MB with 0.5 MB "
+                         "already in use, but the budget is 1.0 MB.")
+        self.assertEqual(ctx.exception.filename, 'b.geojson')
+        self.assertEqual(budget.in_use, 2 ** 19)
+
+    def test_unlimited(self):
+        budget = MemoryBudget()
+        budget.reserve('load', None, 10 ** 15)
+        self.assertEqual(budget.peak, 10 ** 15)
+
+    def test_invalid_limit(self):
+        with self.assertRaises(ValueError):
+            MemoryBudget(0)
+
+    def test_estimates_scale_with_file_size(self):
+        self.assertGreater(estimate_document_bytes(1000), estimate_table_bytes(1000))
+        self.assertEqual(estimate_document_bytes(0), 0)
+
+
+class TestValidateWithMemoryBudget(unittest.TestCase):
+    def test_generous_budget_matches_default(self):
+        for name in ('valid.zip', 'edge_u_id_coord_mismatch.zip', 'external_extension.zip'):
+            with self.subTest(name=name):
+                path = os.path.join(ASSETS_PATH, name)
+                expected = OSWValidation(zipfile_path=path).validate()
+                budgeted = OSWValidation(zipfile_path=path).validate(memory_budget=2 ** 30)
+                self.assertEqual(budgeted.is_valid, expected.is_valid)
+                self.assertEqual(budgeted.errors, expected.errors)
+                self.assertEqual(budgeted.issues, expected.issues)
+
+    def test_small_budget_fails_with_budget_error(self):
+        result = OSWValidation(zipfile_path=os.path.join(ASSETS_PATH, 'valid.zip')).validate(memory_budget=2 ** 20)
+        self.assertFalse(result.is_valid)
+        self.assertEqual(len(result.errors), 1)
+        self.assertRegex(result.errors[0], r"^Memory budget exceeded: schema of '.+\.geojson' needs an estimated ")
+        self.assertTrue(result.errors[0].endswith("but the budget is 1.0 MB."))
+
+
+
+class TestStageLifetimes(unittest.TestCase):
+    """Peak and retained traced memory around every stage of a run on valid.zip."""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.events = []
+
+        def record(event):
+            current, peak = tracemalloc.get_traced_memory()
+            cls.events.append((event, current, peak))
+            if event.status == 'started':
+                tracemalloc.reset_peak()
+
+        tracemalloc.start()
+        try:
+            cls.baseline = tracemalloc.get_traced_memory()[0]
+            cls.result = OSWValidation(zipfile_path=os.path.join(ASSETS_PATH, 'valid.zip')).validate(progress=record)
+            cls.retained = tracemalloc.get_traced_memory()[0] - cls.baseline
+        finally:
+            tracemalloc.stop()
+        cls.dataset_bytes = sum(e.bytes_processed for e, _, _ in cls.events
+                                if e.stage == 'schema' and e.status == 'finished')
+
+    def _stages(self, name):
+        """(started, finished) memory snapshots for every run of stage ``name``."""
+        started = {}
+        for event, current, peak in self.events:
+            if event.stage != name:
+                continue
+            if event.status == 'started':
+                started[event.filename] = current
+            else:
+                yield event, current - started.pop(event.filename), peak
+
+    def test_parsed_documents_are_released_after_schema_validation(self):
+        for event, growth, peak in self._stages('schema'):
+            with self.subTest(file=event.filename):
+                self.assertGreater(peak, event.bytes_processed)
+                self.assertLess(growth, 0.05 * event.bytes_processed + 2 ** 16)
+
+    def test_load_keeps_only_the_table(self):
+        for event, growth, peak in self._stages('load'):
+            with self.subTest(file=event.filename):
+                self.assertLess(growth, event.bytes_processed)
+                self.assertGreater(peak, growth)
+
+    def test_check_temporaries_are_released_with_their_stage(self):
+        for stage in ('ids', 'references', 'geometry_mapping', 'geometry_validity'):
+            for event, growth, peak in self._stages(stage):
+                with self.subTest(stage=stage):
+                    self.assertLess(growth, 0.1 * self.dataset_bytes)
+
+    def test_nothing_large_is_retained_after_the_run(self):
+        self.assertTrue(self.result.is_valid)
+        self.assertGreater(self.dataset_bytes, 2 ** 20)
+        self.assertLess(self.retained, 0.2 * self.dataset_bytes)
+
+
+if __name__ == '__main__':
+    unittest.main()
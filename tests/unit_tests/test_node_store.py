@@ -0,0 +1,162 @@
+import os
+import tempfile
+import unittest
+import zipfile
+from unittest.mock import patch
+
+import numpy as np
+
+from src.python_osw_validation import NodeIndex, NodeStore, OSWValidation, StoredNodes
+
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_PATH = os.path.join(PARENT_DIR, 'assets')
+# nodes n1 (0, 0) and n2 (1, 1); edge e2 starts at (9, 9) instead of n1
+MISMATCH_ZIP = os.path.join(ASSETS_PATH, 'edge_u_id_coord_mismatch.zip')
+MISMATCH_ERROR = ("edges id 'e2' : start coordinate (9.0, 9.0) does not match node id 'n1' "
+                  "coordinate (0.0, 0.0) (_u_id mismatch).")
+
+
+def _nodes(ids, lon, lat):
+    return StoredNodes(NodeIndex(ids, lon, lat), NodeIndex(ids, [np.nan] * len(ids), [np.nan] * len(ids)))
+
+
+class TestNodeIndexArrays(unittest.TestCase):
+    def test_round_trip(self):
+        for ids in (['b', 'a', 'ü'], [3, 1, 2]):
+            index = NodeIndex(ids, [1.0, 2.0, 3.0], [4.0, 5.0, 6.0])
+            restored = NodeIndex.from_arrays(**index.to_arrays())
+            self.assertEqual(dict(restored), dict(index))
+            self.assertEqual(list(restored.positions(ids + ['x'])), list(index.positions(ids + ['x'])))
+
+    def test_mixed_ids_have_no_array_form(self):
+        with self.assertRaises(ValueError):
+            NodeIndex(['a', 1], [0.0, 0.0], [0.0, 0.0]).to_arrays()
+        with self.assertRaises(ValueError):
+            NodeIndex.from_arrays(np.array([1.5]), np.array([0.0]), np.array([0.0]))
+
+
+class TestNodeStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = NodeStore(os.path.join(self.tmp.name, 'nodes'))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_put_and_memory_mapped_get(self):
+        self.assertTrue(self.store.put('k', _nodes(['n1', 'n2'], [0.0, 1.0], [0.0, 1.0])))
+        nodes = self.store.get('k')
+        self.assertIsInstance(nodes.coords.lon, np.memmap)
+        self.assertEqual(nodes.coords['n2'], (1.0, 1.0))
+        self.assertEqual([list(codes) for codes in nodes.id_codes.encode(['n2', 'x', None])], [[1, -1, -1]])
+        self.assertIn('k', self.store)
+        self.assertEqual(len(self.store), 1)
+
+    def test_missing_and_unstorable_entries(self):
+        self.assertIsNone(self.store.get('k'))
+        self.assertFalse(self.store.put('k', _nodes(['n1', 2], [0.0, 1.0], [0.0, 1.0])))
+        self.assertNotIn('k', self.store)
+        self.store.put('k', _nodes([], [], []))
+        self.assertEqual(len(self.store.get('k').ids), 0)
+        self.store.clear()
+        self.assertEqual(len(self.store), 0)
+
+    def test_failed_writes_are_not_stored(self):
+        nodes = _nodes(['n1'], [0.0], [0.0])
+        with patch('numpy.save', side_effect=OSError('No space left on device')):
+            self.assertFalse(self.store.put('k', nodes))
+        with patch('os.replace', side_effect=OSError('Invalid cross-device link')):
+            self.assertFalse(self.store.put('k', nodes))
+        self.assertNotIn('k', self.store)
+        self.assertEqual(os.listdir(self.store.directory), [])
+
+    def test_concurrent_writer_of_the_same_key(self):
+        nodes = _nodes(['n1'], [0.0], [0.0])
+        self.assertTrue(self.store.put('k', nodes))
+        # Renaming onto the other writer's entry fails; the key is stored all the same
+        self.assertTrue(self.store.put('k', nodes))
+        self.assertEqual(self.store.get('k').coords['n1'], (0.0, 0.0))
+        self.assertEqual(len(self.store), 1)
+
+    def test_entries_are_confirmed_by_digest(self):
+        self.assertTrue(self.store.put('k', _nodes(['n1'], [0.0], [0.0]), digest='a' * 64))
+        self.assertEqual(self.store.get('k', 'a' * 64).coords['n1'], (0.0, 0.0))
+        self.assertIsNone(self.store.get('k', 'b' * 64))
+        # Other content under the same key is neither stored nor reported as stored
+        self.assertFalse(self.store.put('k', _nodes(['n1'], [5.0], [5.0]), digest='b' * 64))
+        self.assertEqual(self.store.get('k').coords['n1'], (0.0, 0.0))
+        self.assertTrue(self.store.put('j', _nodes(['n1'], [0.0], [0.0])))
+        self.assertIsNone(self.store.get('j', 'a' * 64))
+
+
+class TestValidateWithNodeStore(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+        self.store = NodeStore(os.path.join(self.tmp.name, 'nodes'))
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _edges_only(self):
+        target = os.path.join(self.tmp.name, 'edges.zip')
+        with zipfile.ZipFile(MISMATCH_ZIP) as src, zipfile.ZipFile(target, 'w') as dst:
+            dst.writestr('opensidewalks.edges.geojson', src.read('opensidewalks.edges.geojson'))
+        return target
+
+    def test_stored_nodes_are_reused(self):
+        plain = OSWValidation(zipfile_path=MISMATCH_ZIP).validate()
+        first = OSWValidation(zipfile_path=MISMATCH_ZIP).validate(node_store=self.store)
+        with patch.object(OSWValidation, '_node_tables') as build:
+            second = OSWValidation(zipfile_path=MISMATCH_ZIP).validate(node_store=self.store)
+        build.assert_not_called()
+        self.assertEqual(second.nodes_key, first.nodes_key)
+        self.assertIn(first.nodes_key, self.store)
+        for result in (first, second):
+            self.assertEqual(result.errors, plain.errors)
+            self.assertEqual(result.issues, plain.issues)
+
+    def test_edges_checked_against_nodes_baseline(self):
+        nodes_key = OSWValidation(zipfile_path=MISMATCH_ZIP).validate(node_store=self.store).nodes_key
+        edges_zip = self._edges_only()
+        self.assertTrue(OSWValidation(zipfile_path=edges_zip).validate().is_valid)
+        result = OSWValidation(zipfile_path=edges_zip).validate(node_store=self.store, nodes_baseline=nodes_key)
+        self.assertEqual(result.errors, [MISMATCH_ERROR])
+
+    def test_same_key_other_nodes_are_not_reused(self):
+        # MISMATCH_ZIP with node n1 moved onto e2's start
+        other_zip = os.path.join(self.tmp.name, 'other.zip')
+        with zipfile.ZipFile(MISMATCH_ZIP) as src, zipfile.ZipFile(other_zip, 'w') as dst:
+            for name in src.namelist():
+                data = src.read(name)
+                if name.endswith('nodes.geojson'):
+                    data = data.replace(b'[0.0, 0.0]', b'[9.0, 9.0]')
+                dst.writestr(name, data)
+        plain = OSWValidation(zipfile_path=other_zip).validate()
+        self.assertNotEqual(plain.errors, [MISMATCH_ERROR])
+        # Both nodes files get the same CRC32-based key
+        with patch.object(OSWValidation, '_content_fingerprint', return_value='crc32:00000000:1'):
+            first = OSWValidation(zipfile_path=MISMATCH_ZIP).validate(node_store=self.store)
+            second = OSWValidation(zipfile_path=other_zip).validate(node_store=self.store)
+        self.assertEqual(first.errors, [MISMATCH_ERROR])
+        self.assertEqual(second.errors, plain.errors)
+        self.assertIsNone(second.nodes_key)
+        self.assertEqual(self.store.get(first.nodes_key).coords['n1'], (0.0, 0.0))
+
+    def test_failed_store_has_no_nodes_key(self):
+        plain = OSWValidation(zipfile_path=MISMATCH_ZIP).validate()
+        with patch.object(NodeStore, 'put', return_value=False):
+            result = OSWValidation(zipfile_path=MISMATCH_ZIP).validate(node_store=self.store)
+        self.assertIsNone(result.nodes_key)
+        self.assertEqual(result.errors, plain.errors)
+
+    def test_unknown_baseline(self):
+        result = OSWValidation(zipfile_path=self._edges_only()).validate(node_store=self.store,
+                                                                        nodes_baseline='missing')
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.errors, ["Nodes baseline 'missing' is not in the node store."])
+        with self.assertRaises(ValueError):
+            OSWValidation(zipfile_path=MISMATCH_ZIP).validate(nodes_baseline='missing')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -171,7 +171,7 @@ class TestOSWValidationExtras(unittest.TestCase):
 
             PVal.return_value = self._fake_validator(fake_files)
 
-            def _rf(path):
+            def _rf(path, **_kwargs):
                 b = os.path.basename(path)
                 if "nodes" in b:
                     return nodes
@@ -204,7 +204,7 @@ class TestOSWValidationExtras(unittest.TestCase):
             PZip.return_value = z
             PVal.return_value = self._fake_validator(fake_files)
 
-            def _rf(path):
+            def _rf(path, **_kwargs):
                 b = os.path.basename(path)
                 return nodes if "nodes" in b else edges
             PRead.side_effect = _rf
@@ -237,7 +237,7 @@ class TestOSWValidationExtras(unittest.TestCase):
             PZip.return_value = z
             PVal.return_value = self._fake_validator(fake_files)
 
-            def _rf(path):
+            def _rf(path, **_kwargs):
                 b = os.path.basename(path)
                 return nodes if "nodes" in b else zones
             PRead.side_effect = _rf
@@ -252,6 +252,108 @@ class TestOSWValidationExtras(unittest.TestCase):
                 shown_ids = [x.strip() for x in displayed.split(",")]
                 self.assertLessEqual(len(shown_ids), 20)
 
+    def test_unmatched_references_add_per_feature_issues(self):
+        fake_files = ["/tmp/nodes.geojson", "/tmp/edges.geojson", "/tmp/zones.geojson"]
+        nodes = self._gdf_nodes([1, 2, 3])
+        edges = self._gdf_edges(u_ids=[1, 9, 2], v_ids=[2, 3, 1], n=3, ids=[100, 101, 102])
+        zones = self._gdf_zones([[1, 2, 3], [2, 7, 3, 8]], ids=[1000, 1001])
+
+        with patch(_PATCH_ZIP) as PZip, \
+             patch(_PATCH_EV) as PVal, \
+             patch(_PATCH_VALIDATE, return_value=True), \
+             patch(_PATCH_READ_FILE) as PRead, \
+             patch(_PATCH_DATASET_FILES, _CANON_DATASET_FILES):
+
+            z = MagicMock()
+            z.extract_zip.return_value = "/tmp/extracted"
+            PZip.return_value = z
+            PVal.return_value = self._fake_validator(fake_files)
+
+            def _rf(path, **_kwargs):
+                b = os.path.basename(path)
+                return {"nodes": nodes, "edges": edges}.get(b.split(".")[0], zones)
+            PRead.side_effect = _rf
+
+            res = OSWValidation(zipfile_path="dummy.zip").validate()
+
+        # The aggregated summaries are still reported.
+        self.assertTrue(any(e.startswith("All _u_id's in edges") for e in res.errors), res.errors)
+        self.assertTrue(any(e.startswith("All _w_id's in zones") for e in res.errors), res.errors)
+        per_feature = [i for i in res.issues if "feature_id" in i]
+        self.assertEqual(per_feature, [
+            {"filename": "edges", "feature_index": 1, "feature_id": 101,
+             "error_message": ["edges id '101' : _u_id '9' is not an _id in nodes."]},
+            {"filename": "zones", "feature_index": 1, "feature_id": 1001,
+             "error_message": ["zones id '1001' : _w_id '7' is not an _id in nodes."]},
+            {"filename": "zones", "feature_index": 1, "feature_id": 1001,
+             "error_message": ["zones id '1001' : _w_id '8' is not an _id in nodes."]},
+        ])
+
+    def test_per_feature_references_do_not_crowd_out_summaries(self):
+        fake_files = ["/tmp/nodes.geojson", "/tmp/edges.geojson", "/tmp/zones.geojson"]
+        nodes = self._gdf_nodes([1, 2, 3])
+        edges = self._gdf_edges(u_ids=[f"u{i}" for i in range(25)], v_ids=[f"v{i}" for i in range(25)], n=25)
+        bowtie = Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])
+        zones = gpd.GeoDataFrame({"_id": [1000], "_w_id": [[1, 2, 3]], "geometry": [bowtie]},
+                                 geometry="geometry", crs="EPSG:4326")
+
+        with patch(_PATCH_ZIP) as PZip, \
+             patch(_PATCH_EV) as PVal, \
+             patch(_PATCH_VALIDATE, return_value=True), \
+             patch(_PATCH_READ_FILE) as PRead, \
+             patch(_PATCH_DATASET_FILES, _CANON_DATASET_FILES):
+
+            z = MagicMock()
+            z.extract_zip.return_value = "/tmp/extracted"
+            PZip.return_value = z
+            PVal.return_value = self._fake_validator(fake_files)
+            PRead.side_effect = lambda path, **_kwargs: {"nodes": nodes, "edges": edges}.get(
+                os.path.basename(path).split(".")[0], zones)
+
+            res = OSWValidation(zipfile_path="dummy.zip").validate()
+
+        summaries = [i["error_message"] for i in res.issues if "feature_id" not in i]
+        self.assertTrue(any(m.startswith("All _u_id's in edges") for m in summaries), summaries)
+        self.assertTrue(any(m.startswith("All _v_id's in edges") for m in summaries), summaries)
+        self.assertTrue(any("invalid zones geometries" in m for m in summaries), summaries)
+        self.assertEqual(len(res.issues), 20)
+        per_feature = [i["error_message"][0] for i in res.issues if "feature_id" in i]
+        self.assertEqual(len(per_feature), 20 - len(summaries))
+        self.assertEqual(per_feature[0], "edges id '1' : _u_id 'u0' is not an _id in nodes.")
+
+    def test_validity_reasons_do_not_crowd_out_later_files(self):
+        fake_files = ["/tmp/nodes.geojson", "/tmp/edges.geojson", "/tmp/zones.geojson"]
+        nodes = self._gdf_nodes([1, 2, 3])
+        edges = gpd.GeoDataFrame({"_id": list(range(1, 26)), "_u_id": [1] * 25, "_v_id": [1] * 25,
+                                  "geometry": [LineString([(0, 0), (0, 0)]) for _ in range(25)]},
+                                 geometry="geometry", crs="EPSG:4326")
+        bowtie = Polygon([(0, 0), (1, 1), (1, 0), (0, 1)])
+        zones = gpd.GeoDataFrame({"_id": [1000], "_w_id": [[1, 2, 3]], "geometry": [bowtie]},
+                                 geometry="geometry", crs="EPSG:4326")
+
+        with patch(_PATCH_ZIP) as PZip, \
+             patch(_PATCH_EV) as PVal, \
+             patch(_PATCH_VALIDATE, return_value=True), \
+             patch(_PATCH_READ_FILE) as PRead, \
+             patch(_PATCH_DATASET_FILES, _CANON_DATASET_FILES):
+
+            z = MagicMock()
+            z.extract_zip.return_value = "/tmp/extracted"
+            PZip.return_value = z
+            PVal.return_value = self._fake_validator(fake_files)
+            PRead.side_effect = lambda path, **_kwargs: {"nodes": nodes, "edges": edges}.get(
+                os.path.basename(path).split(".")[0], zones)
+
+            res = OSWValidation(zipfile_path="dummy.zip").validate(validity_reasons=True)
+
+        summaries = [i["error_message"] for i in res.issues if isinstance(i["error_message"], str)]
+        self.assertTrue(any("invalid edges geometries" in m for m in summaries), summaries)
+        self.assertTrue(any("invalid zones geometries" in m for m in summaries), summaries)
+        self.assertEqual(len(res.issues), 20)
+        reasons = [i["error_message"][0] for i in res.issues if not isinstance(i["error_message"], str)]
+        self.assertEqual(len(reasons), 20 - len(summaries))
+        self.assertTrue(all(" : invalid geometry (" in m for m in reasons), reasons)
+
     def test_load_osw_file_reports_json_decode_error(self):
         """Invalid JSON should surface a detailed message with location context."""
         validator = OSWValidation(zipfile_path="dummy.zip")
@@ -371,7 +473,7 @@ class TestOSWValidationExtras(unittest.TestCase):
             PZip.return_value = z
             PVal.return_value = self._fake_validator(fake_files)
 
-            def _rf(path):
+            def _rf(path, **_kwargs):
                 b = os.path.basename(path)
                 if "nodes" in b:
                     return nodes
@@ -407,7 +509,7 @@ class TestOSWValidationExtras(unittest.TestCase):
             val = self._fake_validator(fake_files, external_exts=[ext_path])
             PVal.return_value = val
 
-            def _rf(path):
+            def _rf(path, **_kwargs):
                 b = os.path.basename(path)
                 if "nodes" in b:
                     return nodes
@@ -452,7 +554,7 @@ class TestOSWValidationExtras(unittest.TestCase):
             val = self._fake_validator(fake_files, external_exts=[ext_path])
             PVal.return_value = val
 
-            def _rf(path):
+            def _rf(path, **_kwargs):
                 b = os.path.basename(path)
                 if "nodes" in b:
                     return nodes
@@ -498,7 +600,7 @@ class TestOSWValidationExtras(unittest.TestCase):
             val = self._fake_validator(fake_files, external_exts=[ext_path])
             PVal.return_value = val
 
-            def _rf(path):
+            def _rf(path, **_kwargs):
                 b = os.path.basename(path)
                 if "nodes" in b:
                     return nodes
@@ -540,7 +642,7 @@ class TestOSWValidationExtras(unittest.TestCase):
             val = self._fake_validator(fake_files, external_exts=[ext_path])
             PVal.return_value = val
 
-            def _rf(path):
+            def _rf(path, **_kwargs):
                 b = os.path.basename(path)
                 if "nodes" in b:
                     return nodes
@@ -557,6 +659,34 @@ class TestOSWValidationExtras(unittest.TestCase):
                             for e in (res.errors or [])),
                         f"Errors were: {res.errors}")
 
+    def test_extension_serialization_failure_reports_feature_and_column(self):
+        ext_path = "/tmp/custom.geojson"
+        nodes = self._gdf_nodes([1])
+        extension_file = gpd.GeoDataFrame(
+            {"name": ["a", "b", "c"], "tags": [None, None, {"x"}], "geometry": [Point(0, i) for i in range(3)]},
+            geometry="geometry", crs="EPSG:4326",
+        )
+
+        with patch(_PATCH_ZIP) as PZip, \
+             patch(_PATCH_EV) as PVal, \
+             patch(_PATCH_VALIDATE, return_value=True), \
+             patch(_PATCH_READ_FILE) as PRead, \
+             patch(_PATCH_DATASET_FILES, _CANON_DATASET_FILES):
+
+            z = MagicMock()
+            z.extract_zip.return_value = "/tmp/extracted"
+            PZip.return_value = z
+            PVal.return_value = self._fake_validator(["/tmp/nodes.geojson"], external_exts=[ext_path])
+            PRead.side_effect = lambda path, **_kwargs: nodes if "nodes" in path else extension_file
+
+            res = OSWValidation(zipfile_path="dummy.zip").validate()
+
+        self.assertFalse(res.is_valid)
+        self.assertIn("Extension file `custom.geojson` has non-serializable properties: "
+                      "Object of type set is not JSON serializable (feature index 2, column 'tags')", res.errors)
+        issue = next(i for i in res.issues if i["filename"] == "custom.geojson")
+        self.assertEqual(issue["feature_index"], 2)
+
     def test_duplicate_ids_detection(self):
         """Duplicates inside a single file are reported."""
         fake_files = ["/tmp/nodes.geojson"]
@@ -693,7 +823,7 @@ class TestOSWValidationExtras(unittest.TestCase):
                 self.assertIn("dummy message", res.issues[0]["error_message"])
 
 class TestOSWValidationInternals(unittest.TestCase):
-    """Covers `_get_colset` and `pick_schema_for_file` internals."""
+    """Covers `pick_schema_for_file` and other internals."""
 
     # ---------- helpers ----------
     def _gdf(self, data, geom="Point"):
@@ -712,49 +842,6 @@ class TestOSWValidationInternals(unittest.TestCase):
         tmp.close()
         return tmp.name
 
-    # ---------- _get_colset ----------
-    def test_get_colset_returns_set_when_column_present(self):
-        v = OSWValidation(zipfile_path="dummy.zip")
-        gdf = self._gdf({"_id": [1, 2, 2, None, 3]}, geom="Point")
-        s = v._get_colset(gdf, "_id", "nodes")
-        self.assertEqual(s, {1, 2, 3})
-
-    def test_get_colset_reports_missing_column(self):
-        v = OSWValidation(zipfile_path="dummy.zip")
-        gdf = self._gdf({"foo": [1, 2]}, geom="Point")
-        s = v._get_colset(gdf, "_id", "nodes")
-        self.assertEqual(s, set())
-        self.assertTrue(any("Missing required column '_id' in nodes." in e for e in v.errors))
-
-    def test_get_colset_handles_unhashable_by_stringifying(self):
-        v = OSWValidation(zipfile_path="dummy.zip")
-        # dicts are unhashable; method should stringify
-        gdf = self._gdf({"meta": [{"a": 1}, {"b": 2}, None]}, geom="Point")
-        s = v._get_colset(gdf, "meta", "nodes")
-        self.assertEqual(s, {str({"a": 1}), str({"b": 2})})
-        # and should not log an error for existing column
-        self.assertFalse(any("meta" in e and "Could not create set" in e for e in (v.errors or [])))
-
-    def test_get_colset_with_none_gdf(self):
-        v = OSWValidation(zipfile_path="dummy.zip")
-        s = v._get_colset(None, "_id", "nodes")
-        self.assertEqual(s, set())
-
-    def test_get_colset_reports_stringify_failure(self):
-        class BadObj:
-            def __hash__(self):
-                raise TypeError("no hash")
-
-            def __str__(self):
-                raise ValueError("no str")
-
-        v = OSWValidation(zipfile_path="dummy.zip")
-        gdf = self._gdf({"meta": [BadObj()]}, geom="Point")
-        s = v._get_colset(gdf, "meta", "nodes")
-        self.assertEqual(s, set())
-        self.assertTrue(any("Could not create set for column 'meta' in nodes." in e for e in (v.errors or [])),
-                        f"Errors were: {v.errors}")
-
     def test_load_osw_schema_reports_missing_file(self):
         v = OSWValidation(zipfile_path="dummy.zip")
         missing_schema = os.path.join(tempfile.gettempdir(), "missing_schema.json")
@@ -1131,7 +1218,7 @@ class TestGeometryMappingViaValidate(unittest.TestCase):
         nodes = self._nodes_gdf([("n1", 0.0, 0.0), ("n2", 1.0, 1.0)])
         edges = self._edges_gdf([("e1", "n1", "n2", [(0.0, 0.0), (0.5, 0.5), (1.0, 1.0)])])
 
-        def rf(path):
+        def rf(path, **_kwargs):
             b = os.path.basename(path)
             return nodes if "nodes" in b else edges if "edges" in b else gpd.GeoDataFrame()
 
@@ -1143,7 +1230,7 @@ class TestGeometryMappingViaValidate(unittest.TestCase):
         # Edge starts at (9,9) but _u_id=n1 is at (0,0)
         edges = self._edges_gdf([("e1", "n1", "n2", [(9.0, 9.0), (1.0, 1.0)])])
 
-        def rf(path):
+        def rf(path, **_kwargs):
             b = os.path.basename(path)
             return nodes if "nodes" in b else edges if "edges" in b else gpd.GeoDataFrame()
 
@@ -1156,7 +1243,7 @@ class TestGeometryMappingViaValidate(unittest.TestCase):
         # Edge ends at (8,8) but _v_id=n2 is at (1,1)
         edges = self._edges_gdf([("e1", "n1", "n2", [(0.0, 0.0), (8.0, 8.0)])])
 
-        def rf(path):
+        def rf(path, **_kwargs):
             b = os.path.basename(path)
             return nodes if "nodes" in b else edges if "edges" in b else gpd.GeoDataFrame()
 
@@ -1168,7 +1255,7 @@ class TestGeometryMappingViaValidate(unittest.TestCase):
         nodes = self._nodes_gdf([("n1", 0.0, 0.0), ("n2", 1.0, 1.0)])
         edges = self._edges_gdf([("edge-xyz", "n1", "n2", [(9.0, 9.0), (1.0, 1.0)])])
 
-        def rf(path):
+        def rf(path, **_kwargs):
             b = os.path.basename(path)
             return nodes if "nodes" in b else edges if "edges" in b else gpd.GeoDataFrame()
 
@@ -1184,7 +1271,7 @@ class TestGeometryMappingViaValidate(unittest.TestCase):
         nodes = self._nodes_gdf([("n1", 0.0, 0.0)])
         edges = self._edges_gdf([("e1", "ghost", "n1", [(5.0, 5.0), (0.0, 0.0)])])
 
-        def rf(path):
+        def rf(path, **_kwargs):
             b = os.path.basename(path)
             return nodes if "nodes" in b else edges if "edges" in b else gpd.GeoDataFrame()
 
@@ -1197,7 +1284,7 @@ class TestGeometryMappingViaValidate(unittest.TestCase):
         """When there are no nodes, coordinate checks are silently skipped."""
         edges = self._edges_gdf([("e1", "n1", "n2", [(0.0, 0.0), (1.0, 1.0)])])
 
-        def rf(path):
+        def rf(path, **_kwargs):
             return edges if "edges" in os.path.basename(path) else gpd.GeoDataFrame()
 
         res = self._run(["/tmp/edges.geojson"], rf)
@@ -1211,7 +1298,7 @@ class TestGeometryMappingViaValidate(unittest.TestCase):
         ])
         zones = self._zones_gdf([("z1", ["w1", "w2", "w3", "w4"], ring)])
 
-        def rf(path):
+        def rf(path, **_kwargs):
             b = os.path.basename(path)
             return nodes if "nodes" in b else zones if "zones" in b else gpd.GeoDataFrame()
 
@@ -1227,7 +1314,7 @@ class TestGeometryMappingViaValidate(unittest.TestCase):
         ])
         zones = self._zones_gdf([("z1", ["w1", "w2", "w3", "w4"], ring)])
 
-        def rf(path):
+        def rf(path, **_kwargs):
             b = os.path.basename(path)
             return nodes if "nodes" in b else zones if "zones" in b else gpd.GeoDataFrame()
 
@@ -1247,7 +1334,7 @@ class TestGeometryMappingViaValidate(unittest.TestCase):
             geometry="geometry", crs="EPSG:4326",
         )
 
-        def rf(path):
+        def rf(path, **_kwargs):
             b = os.path.basename(path)
             return nodes if "nodes" in b else edges if "edges" in b else gpd.GeoDataFrame()
 
@@ -1277,7 +1364,7 @@ class TestGeometryMappingViaValidate(unittest.TestCase):
         # Start is 5e-8 off (within tolerance)
         edges = self._edges_gdf([("e1", "n1", "n2", [(5e-8, 0.0), (1.0, 1.0)])])
 
-        def rf(path):
+        def rf(path, **_kwargs):
             b = os.path.basename(path)
             return nodes if "nodes" in b else edges if "edges" in b else gpd.GeoDataFrame()
 
@@ -0,0 +1,110 @@
+import os
+import threading
+import time
+import unittest
+
+from src.python_osw_validation import OSWValidation
+from src.python_osw_validation.pipeline import FilePrefetcher
+
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_PATH = os.path.join(PARENT_DIR, 'assets')
+
+
+class TestFilePrefetcher(unittest.TestCase):
+    def test_yields_files_in_order(self):
+        with FilePrefetcher(['a', 'b', 'c'], read=str.upper) as prefetcher:
+            items = list(prefetcher)
+        self.assertEqual([i.path for i in items], ['a', 'b', 'c'])
+        self.assertEqual([i.data for i in items], ['A', 'B', 'C'])
+        self.assertTrue(all(i.error is None for i in items))
+
+    def test_read_errors_are_handed_to_consumer(self):
+        def read(path):
+            if path == 'bad':
+                raise OSError('nope')
+            return path
+
+        with FilePrefetcher(['ok', 'bad', 'ok2'], read=read) as prefetcher:
+            items = list(prefetcher)
+        self.assertIsNone(items[0].error)
+        self.assertIsInstance(items[1].error, OSError)
+        self.assertIsNone(items[1].data)
+        self.assertEqual(items[2].data, 'ok2')
+
+    def test_queue_is_bounded(self):
+        read_count = []
+        lock = threading.Lock()
+
+        def read(path):
+            with lock:
+                read_count.append(path)
+            return path
+
+        prefetcher = FilePrefetcher([str(i) for i in range(10)], read=read, depth=2)
+        prefetcher.start()
+        time.sleep(0.3)
+        # depth queued items + one blocked in put()
+        self.assertLessEqual(len(read_count), 3)
+        prefetcher.close()
+
+    def test_close_after_early_break_stops_worker(self):
+        prefetcher = FilePrefetcher([str(i) for i in range(50)], read=lambda p: p, depth=1)
+        with prefetcher:
+            for item in prefetcher:
+                break
+        self.assertIsNone(prefetcher._thread)
+
+    def test_depth_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            FilePrefetcher([], read=str, depth=0)
+
+
+class TestPipelinedValidation(unittest.TestCase):
+    ASSETS = [
+        'valid.zip',
+        'minimal.zip',
+        'invalid.zip',
+        'edges_invalid.zip',
+        '4151.zip',
+        'geom_mapping_valid.zip',
+        'edge_u_id_coord_mismatch.zip',
+        'zone_w_id_coord_mismatch.zip',
+        'UW.zones.valid.zip',
+        'external_extension.zip',
+    ]
+
+    def test_pipelined_matches_sequential(self):
+        for asset in self.ASSETS:
+            with self.subTest(asset=asset):
+                path = os.path.join(ASSETS_PATH, asset)
+                sequential = OSWValidation(zipfile_path=path).validate()
+                pipelined = OSWValidation(zipfile_path=path).validate(pipelined=True)
+                self.assertEqual(sequential.is_valid, pipelined.is_valid)
+                self.assertEqual(sequential.errors, pipelined.errors)
+                self.assertEqual(sequential.issues, pipelined.issues)
+
+    def test_pipelined_reports_parse_errors(self):
+        path = os.path.join(ASSETS_PATH, 'no_entity.zip')
+        sequential = OSWValidation(zipfile_path=path).validate()
+        pipelined = OSWValidation(zipfile_path=path).validate(pipelined=True, pipeline_depth=1)
+        self.assertEqual(sequential.is_valid, pipelined.is_valid)
+        self.assertEqual(bool(sequential.errors), bool(pipelined.errors))
+
+    def test_pipelined_builds_node_index_in_background(self):
+        validation = OSWValidation(zipfile_path=os.path.join(ASSETS_PATH, 'geom_mapping_valid.zip'))
+        threads = []
+        original = validation._build_node_coord_map
+
+        def tracking(nodes_df):
+            threads.append(threading.current_thread().name)
+            return original(nodes_df)
+
+        validation._build_node_coord_map = tracking
+        result = validation.validate(pipelined=True)
+        self.assertTrue(result.is_valid, f"errors={result.errors}")
+        self.assertEqual(len(threads), 1)
+        self.assertTrue(threads[0].startswith('osw-integrity'))
+
+
+if __name__ == '__main__':
+    unittest.main()
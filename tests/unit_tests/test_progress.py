@@ -0,0 +1,132 @@
+import os
+import unittest
+
+from src.python_osw_validation import OSWValidation
+from src.python_osw_validation.progress import (
+    CancellationToken,
+    ProgressEvent,
+    StageTiming,
+    ValidationCancelled,
+)
+
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_PATH = os.path.join(PARENT_DIR, 'assets')
+
+
+class TestCancellationToken(unittest.TestCase):
+    def test_token_starts_uncancelled(self):
+        token = CancellationToken()
+        self.assertFalse(token.cancelled)
+        token.raise_if_cancelled()
+
+    def test_cancel_sets_flag_and_raises(self):
+        token = CancellationToken()
+        token.cancel()
+        self.assertTrue(token.cancelled)
+        with self.assertRaises(ValidationCancelled):
+            token.raise_if_cancelled()
+
+
+class TestProgressReporting(unittest.TestCase):
+    def setUp(self):
+        self.valid_zipfile = os.path.join(ASSETS_PATH, 'valid.zip')
+        self.geom_mapping_valid = os.path.join(ASSETS_PATH, 'geom_mapping_valid.zip')
+
+    def test_reports_every_stage_in_order(self):
+        events = []
+        result = OSWValidation(zipfile_path=self.geom_mapping_valid).validate(progress=events.append)
+
+        self.assertTrue(result.is_valid, f"errors={result.errors}")
+        self.assertTrue(all(isinstance(e, ProgressEvent) for e in events))
+        started = [e.stage for e in events if e.status == 'started']
+        for stage in ('extract', 'discover', 'schema', 'load', 'ids', 'references',
+                      'geometry_mapping', 'geometry_validity'):
+            self.assertIn(stage, started)
+        self.assertEqual(started[0], 'extract')
+        self.assertLess(started.index('schema'), started.index('load'))
+        self.assertLess(started.index('references'), started.index('geometry_mapping'))
+
+    def test_finished_events_carry_counters(self):
+        events = []
+        OSWValidation(zipfile_path=self.valid_zipfile).validate(progress=events.append)
+
+        schema_done = [e for e in events if e.stage == 'schema' and e.status == 'finished']
+        self.assertTrue(schema_done)
+        for event in schema_done:
+            self.assertIsNotNone(event.filename)
+            self.assertGreater(event.bytes_processed, 0)
+        load_done = [e for e in events if e.stage == 'load' and e.status == 'finished']
+        self.assertTrue(all(e.features_processed > 0 for e in load_done))
+        extract_done = next(e for e in events if e.stage == 'extract' and e.status == 'finished')
+        self.assertEqual(extract_done.bytes_processed, os.path.getsize(self.valid_zipfile))
+
+    def test_cancelled_before_start_returns_invalid_result(self):
+        token = CancellationToken()
+        token.cancel()
+        events = []
+        result = OSWValidation(zipfile_path=self.valid_zipfile).validate(progress=events.append,
+                                                                         cancel_token=token)
+
+        self.assertFalse(result.is_valid)
+        self.assertEqual(result.errors, ['Validation cancelled.'])
+        self.assertEqual(events, [])
+
+    def test_cancel_during_run_stops_remaining_stages(self):
+        token = CancellationToken()
+        events = []
+
+        def on_progress(event):
+            events.append(event)
+            if event.stage == 'schema' and event.status == 'finished':
+                token.cancel()
+
+        result = OSWValidation(zipfile_path=self.valid_zipfile).validate(progress=on_progress,
+                                                                         cancel_token=token)
+
+        self.assertFalse(result.is_valid)
+        self.assertIn('Validation cancelled.', result.errors)
+        self.assertFalse(any(e.stage == 'load' for e in events))
+
+    def test_hooks_are_cleared_after_run(self):
+        validation = OSWValidation(zipfile_path=self.valid_zipfile)
+        validation.validate(progress=lambda e: None, cancel_token=CancellationToken())
+        self.assertIsNone(validation._progress)
+        self.assertIsNone(validation._cancel_token)
+
+
+class TestStageTimings(unittest.TestCase):
+    def setUp(self):
+        self.valid_zipfile = os.path.join(ASSETS_PATH, 'valid.zip')
+
+    def test_off_by_default(self):
+        validation = OSWValidation(zipfile_path=self.valid_zipfile)
+        self.assertIsNone(validation.validate().timings)
+        self.assertIsNone(validation._timings)
+
+    def test_timings_match_finished_events(self):
+        events = []
+        result = OSWValidation(zipfile_path=self.valid_zipfile).validate(progress=events.append, timings=True)
+
+        finished = [(e.stage, e.filename, e.features_processed, e.bytes_processed)
+                    for e in events if e.status == 'finished']
+        self.assertTrue(all(isinstance(t, StageTiming) for t in result.timings))
+        self.assertEqual([(t.stage, t.filename, t.features, t.bytes) for t in result.timings], finished)
+        self.assertTrue(all(t.wall >= 0 and t.cpu >= 0 for t in result.timings))
+        schema = [t for t in result.timings if t.stage == 'schema']
+        self.assertEqual(len(schema), 3)
+        self.assertTrue(all(t.filename and t.bytes > 0 for t in schema))
+
+    def test_unfinished_stages_are_not_listed(self):
+        token = CancellationToken()
+
+        def cancel_after_schema(event):
+            if event.stage == 'schema' and event.status == 'finished':
+                token.cancel()
+
+        result = OSWValidation(zipfile_path=self.valid_zipfile).validate(
+            progress=cancel_after_schema, cancel_token=token, timings=True)
+        self.assertEqual([t.stage for t in result.timings], ['extract', 'discover', 'schema'])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+import json
+import os
+import unittest
+from unittest.mock import patch
+
+import jsonschema_rs
+
+from src.python_osw_validation import OSWValidation
+from src.python_osw_validation.schema_memo import MemoisedValidator, repeat_share
+
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_PATH = os.path.join(PARENT_DIR, 'assets')
+SCHEMA_URL = 'https://sidewalks.washington.edu/opensidewalks/0.2/schema.json'
+
+
+def _edge(edge_id, **properties):
+    return {'type': 'Feature', 'geometry': {'type': 'LineString', 'coordinates': [[0.0, 0.0], [1.0, 1.0]]},
+            'properties': {'_id': edge_id, '_u_id': 'n1', '_v_id': 'n2', **properties}}
+
+
+def _messages(errors):
+    return [(list(err.instance_path), err.message) for err in errors]
+
+
+class TestMemoisedValidator(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        validation = OSWValidation(zipfile_path='unused.zip')
+        cls.schema = validation.load_osw_schema(validation.pick_schema_for_file('x.edges.geojson', {}))
+
+    def _document(self, features):
+        return {'$schema': SCHEMA_URL, 'type': 'FeatureCollection', 'features': features}
+
+    def test_matches_full_validation_on_repeated_payloads(self):
+        bad = {'highway': 'footway', 'footway': 'sidewalk', 'crossing': 'unmarked'}
+        document = self._document([_edge(f'e{i}', **bad) for i in range(10)] + [_edge('e10', highway=1)])
+        memo = MemoisedValidator(self.schema)
+        self.assertEqual(_messages(memo.iter_errors(document)),
+                         _messages(jsonschema_rs.Draft7Validator(self.schema).iter_errors(document)))
+        self.assertEqual((memo.hits, memo.misses), (9, 2))
+
+    def test_messages_carry_each_features_ids(self):
+        bad = {'highway': 'footway', 'footway': 'sidewalk', 'crossing': 'unmarked'}
+        document = self._document([_edge('first', **bad), _edge('second', **bad)])
+        messages = [err.message for err in MemoisedValidator(self.schema).iter_errors(document)]
+        self.assertTrue(any('"first"' in message for message in messages))
+        self.assertTrue(any('"second"' in message for message in messages))
+        self.assertFalse(any('__osw_memo' in message for message in messages))
+
+    def test_valid_document_skips_the_split(self):
+        document = self._document([_edge(f'e{i}', highway='footway', footway='sidewalk') for i in range(5)])
+        memo = MemoisedValidator(self.schema)
+        self.assertEqual(list(memo.iter_errors(document)), [])
+        self.assertEqual((memo.hits, memo.misses), (0, 0))
+
+    def test_distinct_payloads_fall_back(self):
+        document = self._document([_edge(f'e{i}', highway='footway', length=i, crossing='x') for i in range(5)])
+        memo = MemoisedValidator(self.schema)
+        self.assertEqual(_messages(memo.iter_errors(document)),
+                         _messages(jsonschema_rs.Draft7Validator(self.schema).iter_errors(document)))
+        self.assertEqual(memo.misses, 0)
+
+    def test_unsupported_schemas(self):
+        with self.assertRaises(ValueError):
+            MemoisedValidator({'type': 'object'})
+        schema = json.loads(json.dumps(self.schema))
+        features = schema['properties']['features']['items']['properties']
+        features['properties'] = {'$ref': '#/definitions/x'}
+        with self.assertRaises(ValueError):
+            MemoisedValidator(schema)
+
+    def test_repeat_share(self):
+        features = [_edge('a', highway='footway'), _edge('b', highway='footway'),
+                    _edge('c', highway='steps'), {'type': 'Feature'}]
+        self.assertAlmostEqual(repeat_share(features), 1 / 3)
+        self.assertEqual(repeat_share([]), 0.0)
+        # Equal in Python, different to JSON Schema
+        self.assertEqual(repeat_share([_edge('a', width=1), _edge('b', width=True)]), 0.0)
+
+
+class TestValidateWithSchemaMemo(unittest.TestCase):
+    def test_same_result_as_plain_validation(self):
+        zip_path = os.path.join(ASSETS_PATH, 'edges_invalid.zip')
+        for max_errors in (20, 100000):
+            plain = OSWValidation(zipfile_path=zip_path).validate(max_errors=max_errors)
+            memo = OSWValidation(zipfile_path=zip_path).validate(max_errors=max_errors, schema_memo=True)
+            self.assertEqual((memo.is_valid, memo.errors, memo.issues),
+                             (plain.is_valid, plain.errors, plain.issues))
+
+    def test_memo_is_used_for_repeated_payloads(self):
+        zip_path = os.path.join(ASSETS_PATH, 'edges_invalid.zip')
+        with patch('src.python_osw_validation.MemoisedValidator', wraps=MemoisedValidator) as memo:
+            OSWValidation(zipfile_path=zip_path).validate(schema_memo=True)
+        self.assertTrue(memo.called)
+
+    def test_off_by_default(self):
+        with patch('src.python_osw_validation.MemoisedValidator') as memo:
+            OSWValidation(zipfile_path=os.path.join(ASSETS_PATH, 'minimal.zip')).validate()
+        memo.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from benchmarks.suite import (
+    STATUS_FASTER,
+    STATUS_MISSING,
+    STATUS_NEW,
+    STATUS_OK,
+    STATUS_REGRESSION,
+    compare_results,
+    load_results,
+    main,
+    run_suite,
+    save_results,
+)
+from src.python_osw_validation.progress import STAGES
+
+
+def _results(seconds, edges=2000):
+    return {'format': 1, 'meta': {'size': 'small', 'edges': edges, 'seed': 0},
+            'results': {name: {'seconds': value} for name, value in seconds.items()}}
+
+
+class TestRunSuite(unittest.TestCase):
+    def test_every_stage_is_timed(self):
+        results = run_suite(edges=200, repeat=2)
+        self.assertEqual(results['meta']['size'], 'custom')
+        names = set(results['results'])
+        keys = ('nodes', 'edges', 'zones', 'points', 'lines', 'polygons')
+        expected = {f'pipeline.{stage}' for stage in STAGES if stage not in ('schema', 'load', 'extensions')}
+        expected |= {f'pipeline.{stage}.{key}' for stage in ('schema', 'load') for key in keys}
+        expected |= {f'mapping.{kind}.{name}' for kind in ('module', 'method')
+                     for name in ('node_index', 'edges', 'zones')}
+        expected |= {f'validity.{key}' for key in keys} | {'pipeline.total'}
+        self.assertEqual(names, expected)
+        for entry in results['results'].values():
+            self.assertEqual(len(entry['samples']), 2)
+            self.assertEqual(entry['seconds'], min(entry['samples']))
+
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, 'results.json')
+            save_results(results, path)
+            self.assertEqual(load_results(path), results)
+
+    def test_unknown_size(self):
+        with self.assertRaises(ValueError):
+            run_suite(size='huge')
+
+
+class TestCompareResults(unittest.TestCase):
+    def test_statuses(self):
+        baseline = _results({'slower': 0.100, 'faster': 0.100, 'steady': 0.100, 'tiny': 0.0002, 'gone': 0.1})
+        current = _results({'slower': 0.130, 'faster': 0.070, 'steady': 0.105, 'tiny': 0.0006, 'added': 0.1})
+        statuses = {c.name: c.status for c in compare_results(baseline, current, threshold=0.15)}
+        self.assertEqual(statuses, {'slower': STATUS_REGRESSION, 'faster': STATUS_FASTER, 'steady': STATUS_OK,
+                                    'tiny': STATUS_OK, 'gone': STATUS_MISSING, 'added': STATUS_NEW})
+
+    def test_threshold_overrides(self):
+        baseline = _results({'pipeline.schema.edges': 0.1, 'pipeline.load.edges': 0.1})
+        current = _results({'pipeline.schema.edges': 0.13, 'pipeline.load.edges': 0.13})
+        comparisons = compare_results(baseline, current, threshold=0.15, overrides={'pipeline.schema.*': 0.5})
+        self.assertEqual([(c.name, c.threshold, c.status) for c in comparisons],
+                         [('pipeline.load.edges', 0.15, STATUS_REGRESSION),
+                          ('pipeline.schema.edges', 0.5, STATUS_OK)])
+        self.assertAlmostEqual(comparisons[0].change, 0.3)
+
+    def test_different_inputs_are_not_compared(self):
+        with self.assertRaises(ValueError):
+            compare_results(_results({}), _results({}, edges=20000))
+
+    def test_compare_command_exit_status(self):
+        with tempfile.TemporaryDirectory() as tmp:
+            paths = {}
+            for name, seconds in (('baseline', 0.1), ('same', 0.1), ('slow', 0.2)):
+                paths[name] = os.path.join(tmp, f'{name}.json')
+                save_results(_results({'pipeline.total': seconds}), paths[name])
+            for current, status in (('same', 0), ('slow', 1)):
+                with redirect_stdout(io.StringIO()), self.assertRaises(SystemExit) as exit_:
+                    main(['compare', paths['baseline'], paths[current]])
+                self.assertEqual(exit_.exception.code, status)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,106 @@
+import hashlib
+import os
+import tempfile
+import unittest
+import zipfile
+
+import numpy as np
+
+from benchmarks.synthetic import FAULT_TYPES, LAYOUTS, SyntheticDataset
+from src.python_osw_validation import OSWValidation
+
+
+# A fragment of the error each fault type must produce
+FAULT_ERRORS = {
+    'bad_enum': '"cobblestone_x" is not one of',
+    'wrong_type': '"1.5 m" is not of type "number"',
+    'missing_u_id': '"_u_id" is a required property',
+    'endpoint_drift': '(_u_id mismatch)',
+    'zone_misalignment': '(_w_id coordinate mismatch)',
+    'duplicate_id': "Duplicate _id's found in edges",
+    'invalid_geometry': 'invalid polygons geometries',
+    'null_ext': "Invalid value at 'ext:surveyed': None",
+}
+
+
+def _digest(path):
+    with zipfile.ZipFile(path) as archive:
+        return {name: hashlib.sha256(archive.read(name)).hexdigest() for name in archive.namelist()}
+
+
+class TestSyntheticDataset(unittest.TestCase):
+    def setUp(self):
+        self.tmp = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def _path(self, name):
+        return os.path.join(self.tmp.name, name)
+
+    def test_every_layout_validates(self):
+        dataset = SyntheticDataset(edges=500, seed=1)
+        for layout in LAYOUTS:
+            path = dataset.write_zip(self._path(f'region_{layout}.zip'), layout=layout)
+            result = OSWValidation(zipfile_path=path).validate()
+            self.assertTrue(result.is_valid, f'{layout}: {result.errors}')
+
+    def test_counts_and_references(self):
+        dataset = SyntheticDataset(edges=300, zones=7, points=0, seed=2)
+        self.assertEqual(dataset.keys(), ['nodes', 'edges', 'zones', 'lines', 'polygons'])
+        nodes = {f['properties']['_id']: f['geometry']['coordinates'] for f in dataset.features('nodes')}
+        self.assertEqual(len(nodes), dataset.counts['nodes'])
+        edges = dataset.document('edges')['features']
+        self.assertEqual(len(edges), 300)
+        for edge in edges:
+            coords, props = edge['geometry']['coordinates'], edge['properties']
+            self.assertEqual(coords[0], nodes[props['_u_id']])
+            self.assertEqual(coords[-1], nodes[props['_v_id']])
+        zones = dataset.document('zones')['features']
+        self.assertEqual(len(zones), 7)
+        for zone in zones:
+            ring = zone['geometry']['coordinates'][0]
+            self.assertEqual(ring[:-1], [nodes[node_id] for node_id in zone['properties']['_w_id']])
+
+    def test_deterministic_per_seed(self):
+        first = SyntheticDataset(edges=200, seed=5).write_zip(self._path('a.zip'))
+        second = SyntheticDataset(edges=200, seed=5).write_zip(self._path('b.zip'))
+        other = SyntheticDataset(edges=200, seed=6).write_zip(self._path('c.zip'))
+        self.assertEqual(_digest(first), _digest(second))
+        self.assertNotEqual(_digest(first), _digest(other))
+
+    def test_each_fault_type_is_reported(self):
+        self.assertEqual(set(FAULT_ERRORS), set(FAULT_TYPES))
+        for fault, fragment in FAULT_ERRORS.items():
+            dataset = SyntheticDataset(edges=300, zones=20, polygons=20, seed=4, faults={fault: 0.3})
+            self.assertGreater(dataset.fault_count(fault), 1, fault)
+            result = OSWValidation(zipfile_path=dataset.write_zip(self._path(f'{fault}.zip'))).validate()
+            self.assertFalse(result.is_valid, fault)
+            self.assertTrue(any(fragment in error for error in result.errors), f'{fault}: {result.errors[:3]}')
+
+    def test_faults_leave_the_rest_of_the_dataset_alone(self):
+        clean = SyntheticDataset(edges=200, seed=5)
+        zero = SyntheticDataset(edges=200, seed=5, faults={'bad_enum': 0.0})
+        self.assertEqual(_digest(clean.write_zip(self._path('a.zip'))), _digest(zero.write_zip(self._path('b.zip'))))
+        broken = SyntheticDataset(edges=200, seed=5, faults={'bad_enum': 0.5, 'null_ext': 0.5})
+        alone = SyntheticDataset(edges=200, seed=5, faults={'bad_enum': 0.5})
+        self.assertTrue(np.array_equal(broken.fault_masks['bad_enum'], alone.fault_masks['bad_enum']))
+        for mixed, edge in zip(broken.features('edges'), clean.features('edges')):
+            self.assertEqual(mixed['properties']['_id'], edge['properties']['_id'])
+            self.assertEqual(mixed['geometry'], edge['geometry'])
+
+    def test_invalid_arguments(self):
+        with self.assertRaises(ValueError):
+            SyntheticDataset(edges=-1)
+        with self.assertRaises(ValueError):
+            SyntheticDataset(edges=10).member_name('edges', layout='tarball')
+        with self.assertRaises(ValueError):
+            list(SyntheticDataset(edges=10).features('roads'))
+        with self.assertRaises(ValueError):
+            SyntheticDataset(edges=10, faults={'typo': 0.1})
+        with self.assertRaises(ValueError):
+            SyntheticDataset(edges=10, faults={'bad_enum': 1.5})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,107 @@
+import os
+import unittest
+
+from src.python_osw_validation import OSWValidation, Span, Tracer, get_tracer, set_tracer
+
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_PATH = os.path.join(PARENT_DIR, 'assets')
+
+
+class _RecordedSpan(Span):
+    def __init__(self, tracer, name, attributes):
+        self.tracer = tracer
+        self.name = name
+        self.attributes = dict(attributes)
+        self.parent = None
+        self.exception = None
+
+    def set_attribute(self, key, value):
+        self.attributes[key] = value
+
+    def __enter__(self):
+        self.parent = self.tracer.open[-1].name if self.tracer.open else None
+        self.tracer.open.append(self)
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.tracer.open.remove(self)
+        self.exception = exc
+
+
+class _RecordingTracer(Tracer):
+    def __init__(self):
+        self.spans = []
+        self.open = []
+
+    def start_span(self, name, attributes):
+        span = _RecordedSpan(self, name, attributes)
+        self.spans.append(span)
+        return span
+
+    def named(self, name):
+        return [span for span in self.spans if span.name == name]
+
+
+class TestTracing(unittest.TestCase):
+    def setUp(self):
+        self.tracer = _RecordingTracer()
+        set_tracer(self.tracer)
+
+    def tearDown(self):
+        set_tracer(None)
+
+    def test_spans_of_a_valid_run(self):
+        result = OSWValidation(zipfile_path=os.path.join(ASSETS_PATH, 'valid.zip')).validate()
+        self.assertTrue(result.is_valid)
+        self.assertEqual(self.tracer.open, [])
+
+        run, = self.tracer.named('osw.validate')
+        self.assertIsNone(run.parent)
+        self.assertEqual(run.attributes['osw.filename'], 'valid.zip')
+        self.assertTrue(run.attributes['osw.is_valid'])
+        self.assertEqual(run.attributes['osw.error_count'], 0)
+
+        extract, = self.tracer.named('osw.extract_zip')
+        self.assertEqual(extract.parent, 'osw.stage.extract')
+        self.assertEqual(self.tracer.named('osw.discover_files')[0].attributes['osw.file_count'], 3)
+
+        schema_files = self.tracer.named('osw.validate_osw_errors')
+        self.assertEqual(len(schema_files), 3)
+        for span in schema_files:
+            self.assertEqual(span.parent, 'osw.stage.schema')
+            self.assertGreater(span.attributes['osw.feature_count'], 0)
+            self.assertEqual(span.attributes['osw.error_count'], 0)
+
+        loads = self.tracer.named('osw.stage.load')
+        self.assertEqual({span.attributes['osw.filename'] for span in loads},
+                         {span.attributes['osw.filename'] for span in schema_files})
+        for stage in ('ids', 'references', 'geometry_validity'):
+            span, = self.tracer.named(f'osw.stage.{stage}')
+            self.assertEqual(span.parent, 'osw.validate')
+            self.assertNotIn('osw.filename', span.attributes)
+
+    def test_error_counts_of_an_invalid_run(self):
+        result = OSWValidation(zipfile_path=os.path.join(ASSETS_PATH, 'edges_invalid.zip')).validate()
+        run, = self.tracer.named('osw.validate')
+        self.assertFalse(run.attributes['osw.is_valid'])
+        self.assertEqual(run.attributes['osw.error_count'], len(result.errors))
+        failed = [span for span in self.tracer.named('osw.validate_osw_errors')
+                  if span.attributes['osw.error_count']]
+        self.assertEqual(len(failed), 1)
+
+    def test_extraction_failure(self):
+        OSWValidation(zipfile_path=os.path.join(ASSETS_PATH, 'missing.zip')).validate()
+        extract, = self.tracer.named('osw.extract_zip')
+        self.assertEqual(extract.attributes['osw.error_count'], 1)
+
+    def test_default_tracer_is_a_no_op(self):
+        set_tracer(None)
+        tracer = get_tracer()
+        self.assertIs(type(tracer), Tracer)
+        with tracer.start_span('x', {}) as span:
+            span.set_attribute('k', 'v')
+        self.assertIs(tracer.start_span('y', {}), span)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,118 @@
+import json
+import os
+import tempfile
+import threading
+import unittest
+import zipfile
+from unittest.mock import patch
+
+import numpy as np
+import shapely
+from shapely.geometry import LineString, Point, Polygon
+
+from src.python_osw_validation import OSWValidation
+from src.python_osw_validation import validity
+from src.python_osw_validation.validity import evaluate_validity
+
+PARENT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+ASSETS_PATH = os.path.join(PARENT_DIR, 'assets')
+
+BOWTIE = Polygon([(0, 0), (2, 2), (2, 0), (0, 2), (0, 0)])
+SQUARE = Polygon([(0, 0), (1, 0), (1, 1), (0, 1)])
+
+
+def _geometries(n):
+    geoms = np.empty(n, dtype=object)
+    geoms[:] = [SQUARE] * n
+    geoms[3] = BOWTIE
+    geoms[7] = None
+    geoms[11] = LineString([(0, 0), (1, 1)])
+    return geoms
+
+
+class TestEvaluateValidity(unittest.TestCase):
+    def test_threads_and_chunks_do_not_change_result(self):
+        geoms = _geometries(50)
+        expected = evaluate_validity(geoms, 'Polygon', threads=1).invalid
+        self.assertEqual(expected.tolist(), [3, 7, 11])
+        for threads, chunk_size in ((2, 4), (4, 1), (8, 7)):
+            with self.subTest(threads=threads, chunk_size=chunk_size):
+                report = evaluate_validity(geoms, 'Polygon', threads=threads, chunk_size=chunk_size)
+                self.assertEqual(report.invalid.tolist(), expected.tolist())
+                self.assertIsNone(report.reasons)
+
+    def test_without_expected_type_only_checks_validity(self):
+        self.assertEqual(evaluate_validity(_geometries(20), None, threads=2, chunk_size=5).invalid.tolist(), [3, 7])
+
+    def test_reasons(self):
+        report = evaluate_validity(_geometries(20), 'Polygon', threads=2, chunk_size=3, reasons=True)
+        self.assertEqual(report.reasons[1:], ['Missing geometry', 'Expected Polygon, got LineString'])
+        self.assertTrue(report.reasons[0].startswith('Self-intersection'))
+
+    def test_chunks_run_on_worker_threads(self):
+        names = set()
+        original = shapely.is_valid
+
+        def tracking(geoms, **kwargs):
+            names.add(threading.current_thread().name)
+            return original(geoms, **kwargs)
+
+        with patch.object(validity.shapely, 'is_valid', side_effect=tracking):
+            evaluate_validity(_geometries(40), 'Polygon', threads=3, chunk_size=10)
+        self.assertTrue(names)
+        self.assertTrue(all(name.startswith('osw-validity') for name in names), names)
+
+    def test_empty_input_and_bad_arguments(self):
+        report = evaluate_validity(np.empty(0, dtype=object), 'Point', reasons=True)
+        self.assertEqual(report.invalid.tolist(), [])
+        self.assertEqual(report.reasons, [])
+        with self.assertRaises(ValueError):
+            evaluate_validity(_geometries(20), threads=0)
+        with self.assertRaises(ValueError):
+            evaluate_validity(_geometries(20), chunk_size=0)
+
+    def test_point_expected(self):
+        geoms = np.array([Point(0, 0), SQUARE], dtype=object)
+        self.assertEqual(evaluate_validity(geoms, 'Point', threads=1).invalid.tolist(), [1])
+
+
+class TestValidityInValidate(unittest.TestCase):
+    def setUp(self):
+        # minimal.zip with its only edge collapsed to a degenerate LineString.
+        self.tmp = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.tmp.name, 'degenerate.zip')
+        with zipfile.ZipFile(os.path.join(ASSETS_PATH, 'minimal.zip')) as src, \
+                zipfile.ZipFile(self.path, 'w') as dst:
+            for name in src.namelist():
+                data = src.read(name)
+                if name.endswith('edges.OSW.geojson'):
+                    doc = json.loads(data)
+                    coords = doc['features'][0]['geometry']['coordinates']
+                    doc['features'][0]['geometry']['coordinates'] = [coords[0], coords[0]]
+                    data = json.dumps(doc).encode()
+                dst.writestr(name, data)
+
+    def tearDown(self):
+        self.tmp.cleanup()
+
+    def test_threaded_matches_single_thread(self):
+        single = OSWValidation(zipfile_path=self.path).validate(validity_threads=1)
+        threaded = OSWValidation(zipfile_path=self.path).validate(validity_threads=4)
+        self.assertFalse(single.is_valid)
+        self.assertIn("Showing all out of 1 invalid edges geometries, id's of invalid geometries: 3234", single.errors)
+        self.assertEqual(single.errors, threaded.errors)
+        self.assertEqual(single.issues, threaded.issues)
+
+    def test_reasons_add_per_feature_issues(self):
+        plain = OSWValidation(zipfile_path=self.path).validate()
+        detailed = OSWValidation(zipfile_path=self.path).validate(validity_reasons=True)
+        self.assertEqual(plain.errors, detailed.errors)
+        extra = [i for i in detailed.issues if i not in plain.issues]
+        self.assertEqual(len(extra), 1)
+        self.assertEqual(extra[0]['filename'], 'edges')
+        self.assertEqual(extra[0]['feature_index'], 0)
+        self.assertRegex(extra[0]['error_message'][0], r"^edges id '3234' : invalid geometry \(Too few points.*\)\.$")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,7 @@
 import unittest
 import os
+import tempfile
+import zipfile
 from unittest.mock import patch, MagicMock
 from src.python_osw_validation.zipfile_handler import ZipFileHandler
 
@@ -31,6 +33,26 @@ class TestZipFileHandler(unittest.TestCase):
         self.assertIsNone(extracted_dir)
         self.assertIsNotNone(zip_handler.error)
 
+    def test_member_fingerprints(self):
+        zip_handler = ZipFileHandler(self.valid_zip_path)
+        with zipfile.ZipFile(self.valid_zip_path) as zip_ref:
+            expected = {info.filename: (info.CRC, info.file_size) for info in zip_ref.infolist()}
+        self.assertEqual(zip_handler.member_fingerprints(), expected)
+        self.assertIsNone(zip_handler.extracted_dir)
+
+    def test_member_fingerprints_of_invalid_zip(self):
+        zip_handler = ZipFileHandler(self.invalid_zip_path)
+        self.assertEqual(zip_handler.member_fingerprints(), {})
+
+    def test_member_name(self):
+        tmp = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp.cleanup)
+        zip_handler = ZipFileHandler(self.valid_zip_path)
+        zip_handler.extracted_dir = tmp.name
+        extracted_dir = zip_handler.extract_zip()
+        path = os.path.join(extracted_dir, 'wa.microsoft.graph.nodes.OSW.geojson')
+        self.assertEqual(zip_handler.member_name(path), 'valid/wa.microsoft.graph.nodes.OSW.geojson')
+
     def test_remove_extracted_files(self):
         zip_handler = ZipFileHandler(self.valid_zip_path)
         extracted_dir = zip_handler.extract_zip()